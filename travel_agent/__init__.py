@@ -3,36 +3,158 @@
 This module exposes the primary entrypoints for consumers who want to
 instantiate the agent components individually or use the combined
 `TravelAgent` façade.
+
+Public names are imported on first access, so that for example
+``from travel_agent import TripRequest`` loads only :mod:`models` and not
+the HTTP client behind the Amadeus providers.
 """
 
-from .agent import TravelAgent
-from .itinerary import ItineraryPlanner
-from .flights import FlightMonitor
-from .hotels import HotelMonitor
-from .providers import (
-    AmadeusConfig,
-    AmadeusFlightSearchProvider,
-    AmadeusHotelSearchProvider,
-    AmadeusSearchProvider,
-    ProviderError,
-)
-from .models import (
-    Activity,
-    FlightOffer,
-    FlightPreference,
-    HotelOffer,
-    HotelPreference,
-    Itinerary,
-    ItineraryDay,
-    TripRequest,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent import BatchResult, TravelAgent
+    from .cache import CacheStats, CachingSearchProvider
+    from .dedup import ActivityDeduplicator
+    from .changes import OfferChangeDetector, OfferEvent, OfferEventKind
+    from .fanout import FanOutFlightSearchProvider, FanOutHotelSearchProvider, FanOutStats
+    from .geo import GridIndex
+    from .itinerary import ItineraryPlanner
+    from .locations import LocationIndex
+    from .metrics import REGISTRY, MetricsRegistry, serve_metrics
+    from .flights import FlightMonitor
+    from .hotels import HotelMonitor
+    from .ranking import OfferTable, RankingWeights
+    from .ratelimit import RateLimit, RateLimiter, RetryPolicy
+    from .resilience import CircuitBreaker, CircuitBreakers, ResilienceStats
+    from .scheduler import MonitorScheduler, WatchStats
+    from .stub_server import EndpointBehavior, StubAmadeusServer, StubStats
+    from .timetable import DayScheduler
+    from .tracing import Span, Tracer, format_trace, set_tracer
+    from .providers import (
+        AmadeusConfig,
+        AmadeusFlightSearchProvider,
+        AmadeusHotelSearchProvider,
+        AmadeusSearchProvider,
+        AsyncAmadeusFlightSearchProvider,
+        AsyncAmadeusHotelSearchProvider,
+        AsyncAmadeusSearchProvider,
+        ProviderError,
+    )
+    from .models import (
+        Activity,
+        FareCell,
+        FareMatrix,
+        FlightOffer,
+        FlightPreference,
+        HotelOffer,
+        HotelPreference,
+        Itinerary,
+        ItineraryDay,
+        TripRequest,
+    )
+
+_EXPORTS = {
+    "TravelAgent": ".agent",
+    "BatchResult": ".agent",
+    "CachingSearchProvider": ".cache",
+    "CacheStats": ".cache",
+    "OfferChangeDetector": ".changes",
+    "OfferEvent": ".changes",
+    "OfferEventKind": ".changes",
+    "FanOutFlightSearchProvider": ".fanout",
+    "FanOutHotelSearchProvider": ".fanout",
+    "FanOutStats": ".fanout",
+    "GridIndex": ".geo",
+    "ItineraryPlanner": ".itinerary",
+    "ActivityDeduplicator": ".dedup",
+    "LocationIndex": ".locations",
+    "MetricsRegistry": ".metrics",
+    "REGISTRY": ".metrics",
+    "serve_metrics": ".metrics",
+    "FlightMonitor": ".flights",
+    "HotelMonitor": ".hotels",
+    "OfferTable": ".ranking",
+    "RankingWeights": ".ranking",
+    "RateLimit": ".ratelimit",
+    "RateLimiter": ".ratelimit",
+    "RetryPolicy": ".ratelimit",
+    "CircuitBreaker": ".resilience",
+    "CircuitBreakers": ".resilience",
+    "ResilienceStats": ".resilience",
+    "MonitorScheduler": ".scheduler",
+    "WatchStats": ".scheduler",
+    "EndpointBehavior": ".stub_server",
+    "StubAmadeusServer": ".stub_server",
+    "StubStats": ".stub_server",
+    "DayScheduler": ".timetable",
+    "Span": ".tracing",
+    "Tracer": ".tracing",
+    "format_trace": ".tracing",
+    "set_tracer": ".tracing",
+    "Activity": ".models",
+    "FareCell": ".models",
+    "FareMatrix": ".models",
+    "FlightOffer": ".models",
+    "FlightPreference": ".models",
+    "HotelOffer": ".models",
+    "HotelPreference": ".models",
+    "Itinerary": ".models",
+    "ItineraryDay": ".models",
+    "TripRequest": ".models",
+    "AmadeusConfig": ".providers",
+    "AmadeusFlightSearchProvider": ".providers",
+    "AmadeusHotelSearchProvider": ".providers",
+    "AmadeusSearchProvider": ".providers",
+    "AsyncAmadeusFlightSearchProvider": ".providers",
+    "AsyncAmadeusHotelSearchProvider": ".providers",
+    "AsyncAmadeusSearchProvider": ".providers",
+    "ProviderError": ".providers",
+}
 
 __all__ = [
     "TravelAgent",
+    "BatchResult",
+    "CachingSearchProvider",
+    "CacheStats",
+    "OfferChangeDetector",
+    "OfferEvent",
+    "OfferEventKind",
+    "FanOutFlightSearchProvider",
+    "FanOutHotelSearchProvider",
+    "FanOutStats",
+    "GridIndex",
     "ItineraryPlanner",
+    "ActivityDeduplicator",
+    "LocationIndex",
+    "MetricsRegistry",
+    "REGISTRY",
+    "serve_metrics",
     "FlightMonitor",
     "HotelMonitor",
+    "OfferTable",
+    "RankingWeights",
+    "RateLimit",
+    "RateLimiter",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "ResilienceStats",
+    "MonitorScheduler",
+    "WatchStats",
+    "EndpointBehavior",
+    "StubAmadeusServer",
+    "StubStats",
+    "DayScheduler",
+    "Span",
+    "Tracer",
+    "format_trace",
+    "set_tracer",
     "Activity",
+    "FareCell",
+    "FareMatrix",
     "FlightOffer",
     "FlightPreference",
     "HotelOffer",
@@ -44,5 +166,22 @@ __all__ = [
     "AmadeusFlightSearchProvider",
     "AmadeusHotelSearchProvider",
     "AmadeusSearchProvider",
+    "AsyncAmadeusFlightSearchProvider",
+    "AsyncAmadeusHotelSearchProvider",
+    "AsyncAmadeusSearchProvider",
     "ProviderError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the package so that later lookups skip this hook.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Sequence
+import contextvars
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, Iterable, Iterator, Sequence, Tuple, TypeVar
 
+from cache import CachingSearchProvider
+from changes import OfferEvent
 from flights import FlightMonitor
 from hotels import HotelMonitor
 from itinerary import ItineraryPlanner
+from metrics import MetricsRegistry
 from models import (
+    FareMatrix,
     FlightOffer,
     FlightPreference,
     HotelOffer,
@@ -16,35 +22,199 @@ from models import (
     Itinerary,
     TripRequest,
 )
-from search import CompositeSearchProvider
+from ranking import RankingWeights
+from search import (
+    AsyncCompositeSearchProvider,
+    CompositeSearchProvider,
+    FlightSearchProvider,
+    HotelSearchProvider,
+    SearchProvider,
+)
+from tracing import traced
+
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True)
+class BatchResult(Generic[_T]):
+    """Outcome of one request of a batch call such as :meth:`TravelAgent.plan_many`.
+
+    ``index`` is the position of ``request`` in the batch. Exactly one of
+    ``value`` and ``error`` is set.
+    """
+
+    index: int
+    request: TripRequest
+    value: _T | None = None
+    error: BaseException | None = None
 
 
 @dataclass(slots=True)
 class TravelAgent:
-    """Orchestrates itinerary planning and monitoring."""
+    """Orchestrates itinerary planning and monitoring.
+
+    Each planning and search call is a :mod:`tracing` span; monitors trace
+    every polling cycle instead of the whole loop.
+    """
 
     planner: ItineraryPlanner
     flight_monitor: FlightMonitor
     hotel_monitor: HotelMonitor
+    _owned_executor: Executor | None = field(default=None, repr=False, kw_only=True)
 
     @classmethod
-    def from_provider(cls, provider: CompositeSearchProvider) -> "TravelAgent":
-        """Create a travel agent that uses a unified search provider."""
+    def from_provider(
+        cls,
+        provider: CompositeSearchProvider | AsyncCompositeSearchProvider,
+        *,
+        executor: Executor | None = None,
+        max_concurrency: int | None = None,
+        weights: RankingWeights | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> "TravelAgent":
+        """Create a travel agent that uses a unified search provider.
+
+        Synchronous providers serve both the blocking and the coroutine
+        methods; async providers only serve the ``*_async`` methods. When
+        *max_concurrency* is given for a synchronous provider, both monitors
+        share one thread pool of that size unless *executor* is supplied.
+        *weights* controls how both monitors rank offers and *metrics* is
+        where they record cycle timings. A thread pool created here is shut
+        down by :meth:`close`.
+        """
+
+        owned_executor = None
+        if executor is None and max_concurrency is not None and isinstance(provider, CompositeSearchProvider):
+            owned_executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="travel-agent")
+            executor = owned_executor
+        planner = ItineraryPlanner(provider, executor=executor)
+        flight_monitor = FlightMonitor(
+            provider, executor=executor, max_concurrency=max_concurrency, weights=weights, metrics=metrics
+        )
+        hotel_monitor = HotelMonitor(
+            provider, executor=executor, max_concurrency=max_concurrency, weights=weights, metrics=metrics
+        )
+        return cls(
+            planner=planner, flight_monitor=flight_monitor, hotel_monitor=hotel_monitor, _owned_executor=owned_executor
+        )
+
+    def close(self) -> None:
+        """Shut down the thread pools owned by this agent and its monitors."""
 
-        planner = ItineraryPlanner(provider)
-        flight_monitor = FlightMonitor(provider)
-        hotel_monitor = HotelMonitor(provider)
-        return cls(planner=planner, flight_monitor=flight_monitor, hotel_monitor=hotel_monitor)
+        self.flight_monitor.close()
+        self.hotel_monitor.close()
+        if self._owned_executor is not None:
+            self._owned_executor.shutdown(wait=True)
 
+    def __enter__(self) -> "TravelAgent":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @traced("agent.plan_itinerary")
     def plan_itinerary(self, request: TripRequest) -> Itinerary:
         return self.planner.plan_trip(request)
 
+    @traced("agent.find_flights")
     def find_flights(self, request: TripRequest, preference: FlightPreference) -> Sequence[FlightOffer]:
         return self.flight_monitor.find_best_flights(request, preference)
 
+    @traced("agent.find_fare_matrix")
+    def find_fare_matrix(
+        self, request: TripRequest, preference: FlightPreference, *, flex_days: int = 1
+    ) -> FareMatrix:
+        return self.flight_monitor.find_fare_matrix(request, preference, flex_days=flex_days)
+
+    @traced("agent.find_hotels")
     def find_hotels(self, request: TripRequest, preference: HotelPreference) -> Sequence[HotelOffer]:
         return self.hotel_monitor.find_best_hotels(request, preference)
 
+    @traced("agent.find_hotels_near")
+    def find_hotels_near(
+        self,
+        request: TripRequest,
+        preference: HotelPreference,
+        itinerary: Itinerary,
+        *,
+        aggregate: str = "mean",
+        limit: int = 20,
+    ) -> Sequence[HotelOffer]:
+        return self.hotel_monitor.find_hotels_near(
+            request, preference, itinerary, aggregate=aggregate, limit=limit
+        )
+
+    def plan_many(self, requests: Iterable[TripRequest], *, max_workers: int = 8) -> Iterator[BatchResult[Itinerary]]:
+        """Plan itineraries for a batch of trips, yielding each as soon as it is ready.
+
+        Results arrive in completion order, not input order; use
+        :attr:`BatchResult.index` to match them up. Up to *max_workers* trips
+        are planned at once, and the searches of every trip share one pool of
+        *max_workers* threads, so at most *max_workers* searches reach the
+        provider at a time however many interests each trip has. Identical
+        searches across the batch (the same interest at the same destination,
+        say) reach the provider once: a :class:`~cache.CachingSearchProvider`
+        shared by the batch answers the repeats, including ones issued while
+        the first is still in flight. A trip that fails is reported through
+        :attr:`BatchResult.error` without stopping the others. Closing the
+        iterator early cancels trips and searches that have not started.
+        """
+
+        provider = self.planner.provider
+        if not isinstance(provider, SearchProvider):
+            raise TypeError("plan_many requires a synchronous SearchProvider")
+        _check_max_workers(max_workers)
+        # Trips wait on their searches, so the searches need a pool of their own to avoid deadlock.
+        searches = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="travel-agent-batch-search")
+        planner = self.planner.with_provider(_batch_cache(provider), executor=searches)
+        return _run_batch(
+            requests,
+            planner.plan_trip,
+            max_workers,
+            cleanup=lambda: searches.shutdown(wait=False, cancel_futures=True),
+        )
+
+    def find_flights_many(
+        self, requests: Iterable[TripRequest], preference: FlightPreference, *, max_workers: int = 8
+    ) -> Iterator[BatchResult[Sequence[FlightOffer]]]:
+        """Find flights for a batch of trips; see :meth:`plan_many`.
+
+        Trips on the same route and dates share one provider search.
+        """
+
+        provider = self.flight_monitor.provider
+        if not isinstance(provider, FlightSearchProvider):
+            raise TypeError("find_flights_many requires a synchronous FlightSearchProvider")
+        monitor = self.flight_monitor.with_provider(_batch_cache(provider))
+        return _run_batch(requests, lambda request: monitor.find_best_flights(request, preference), max_workers)
+
+    def find_hotels_many(
+        self, requests: Iterable[TripRequest], preference: HotelPreference, *, max_workers: int = 8
+    ) -> Iterator[BatchResult[Sequence[HotelOffer]]]:
+        """Find hotels for a batch of trips; see :meth:`plan_many`.
+
+        Trips to the same destination on the same dates share one provider
+        search.
+        """
+
+        provider = self.hotel_monitor.provider
+        if not isinstance(provider, HotelSearchProvider):
+            raise TypeError("find_hotels_many requires a synchronous HotelSearchProvider")
+        monitor = self.hotel_monitor.with_provider(_batch_cache(provider))
+        return _run_batch(requests, lambda request: monitor.find_best_hotels(request, preference), max_workers)
+
+    @traced("agent.plan_itinerary_async")
+    async def plan_itinerary_async(self, request: TripRequest) -> Itinerary:
+        return await self.planner.plan_trip_async(request)
+
+    @traced("agent.find_flights_async")
+    async def find_flights_async(self, request: TripRequest, preference: FlightPreference) -> Sequence[FlightOffer]:
+        return await self.flight_monitor.find_best_flights_async(request, preference)
+
+    @traced("agent.find_hotels_async")
+    async def find_hotels_async(self, request: TripRequest, preference: HotelPreference) -> Sequence[HotelOffer]:
+        return await self.hotel_monitor.find_best_hotels_async(request, preference)
+
     async def monitor_flights(
         self,
         request: TripRequest,
@@ -53,6 +223,7 @@ class TravelAgent:
         interval_seconds: int = 3600,
         callback: Callable[[Sequence[FlightOffer]], None] | None = None,
         max_cycles: int | None = None,
+        on_event: Callable[[Sequence[OfferEvent[FlightOffer]]], None] | None = None,
     ) -> None:
         await self.flight_monitor.monitor(
             request,
@@ -60,6 +231,7 @@ class TravelAgent:
             interval_seconds=interval_seconds,
             callback=callback,
             max_cycles=max_cycles,
+            on_event=on_event,
         )
 
     async def monitor_hotels(
@@ -70,6 +242,7 @@ class TravelAgent:
         interval_seconds: int = 3600,
         callback: Callable[[Sequence[HotelOffer]], None] | None = None,
         max_cycles: int | None = None,
+        on_event: Callable[[Sequence[OfferEvent[HotelOffer]]], None] | None = None,
     ) -> None:
         await self.hotel_monitor.monitor(
             request,
@@ -77,4 +250,63 @@ class TravelAgent:
             interval_seconds=interval_seconds,
             callback=callback,
             max_cycles=max_cycles,
+            on_event=on_event,
         )
+
+
+def _batch_cache(provider: object) -> CachingSearchProvider:
+    """Cache shared by the requests of one batch call.
+
+    A new cache is created per call, so nothing is shared between batches.
+    The regular TTLs still apply so that a long batch does not keep serving
+    fares that have since changed.
+    """
+
+    return CachingSearchProvider(
+        provider,  # type: ignore[arg-type] - only the methods the batch calls are used
+        name="batch",
+    )
+
+
+def _check_max_workers(max_workers: int) -> None:
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+
+def _run_batch(
+    requests: Iterable[TripRequest],
+    run: Callable[[TripRequest], _T],
+    max_workers: int,
+    *,
+    cleanup: Callable[[], None] | None = None,
+) -> Iterator[BatchResult[_T]]:
+    _check_max_workers(max_workers)
+    batch = list(requests)
+
+    def results() -> Iterator[BatchResult[_T]]:
+        executor = None
+        try:
+            if not batch:
+                return
+            executor = ThreadPoolExecutor(
+                max_workers=min(max_workers, len(batch)), thread_name_prefix="travel-agent-batch"
+            )
+            pending: Dict[Future[_T], Tuple[int, TripRequest]] = {
+                # Run in a copy of the caller's context so that spans nest under the caller's trace.
+                executor.submit(contextvars.copy_context().run, run, request): (index, request)
+                for index, request in enumerate(batch)
+            }
+            for future in as_completed(pending):
+                index, request = pending[future]
+                error = future.exception()
+                if error is not None:
+                    yield BatchResult(index=index, request=request, error=error)
+                else:
+                    yield BatchResult(index=index, request=request, value=future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if cleanup is not None:
+                cleanup()
+
+    return results()
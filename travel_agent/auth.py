@@ -0,0 +1,291 @@
+"""Access token caching shared by the provider HTTP clients."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from metrics import REGISTRY, MetricsRegistry
+from tracing import span
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True, slots=True)
+class AccessToken:
+    """A bearer token and the wall-clock time at which it expires."""
+
+    value: str
+    expires_at: float
+
+    def is_valid(self, *, margin: float = 0.0, now: float | None = None) -> bool:
+        current = time.time() if now is None else now
+        return bool(self.value) and current < self.expires_at - margin
+
+
+class TokenStore(ABC):
+    """Storage that lets several clients or processes reuse one token."""
+
+    @abstractmethod
+    def load(self, key: str) -> AccessToken | None:
+        """Return the stored token for *key*, if any."""
+
+    @abstractmethod
+    def save(self, key: str, token: AccessToken) -> None:
+        """Persist *token* under *key*."""
+
+    @abstractmethod
+    def discard(self, key: str, value: str) -> None:
+        """Remove the token stored under *key* if it still equals *value*."""
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Serialise refreshes of *key* across every user of the store."""
+
+        del key
+        yield
+
+
+class FileTokenStore(TokenStore):
+    """Store tokens as small JSON files in *directory*.
+
+    Processes on the same host pointing at the same directory share tokens,
+    and refreshes are serialised with an advisory file lock where the
+    platform supports it. Pointing *directory* at a private subdirectory of
+    a tmpfs mount, such as ``/dev/shm/<user>``, keeps tokens in memory rather
+    than on disk; the shared mount point itself is rejected.
+
+    By default tokens live in a per-user directory: ``$XDG_RUNTIME_DIR``
+    when set, ``~/.cache`` otherwise. The directory must belong to the
+    current user and be inaccessible to anyone else, since its files are
+    bearer tokens; :class:`PermissionError` is raised if it is not.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None) -> None:
+        self._directory = Path(directory) if directory is not None else _default_token_directory()
+        self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_private(self._directory)
+
+    def load(self, key: str) -> AccessToken | None:
+        try:
+            payload = json.loads(self._path(key).read_text(encoding="utf-8"))
+            return AccessToken(value=str(payload["value"]), expires_at=float(payload["expires_at"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, key: str, token: AccessToken) -> None:
+        path = self._path(key)
+        fd, tmp_name = tempfile.mkstemp(dir=self._directory, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"value": token.value, "expires_at": token.expires_at}, handle)
+            os.chmod(tmp_name, 0o600)
+            # Atomic rename so readers never observe a partially written file.
+            os.replace(tmp_name, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+
+    def discard(self, key: str, value: str) -> None:
+        stored = self.load(key)
+        if stored is not None and stored.value == value:
+            with contextlib.suppress(OSError):
+                self._path(key).unlink()
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        if fcntl is None:  # pragma: no cover - Windows
+            yield
+            return
+        with open(self._path(key).with_suffix(".lock"), "a+") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+        return self._directory / f"token-{digest}.json"
+
+
+def _default_token_directory() -> Path:
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    base = Path(runtime) if runtime else Path.home() / ".cache"
+    return base / "travel_agent_tokens"
+
+
+def _check_private(directory: Path) -> None:
+    """Refuse a token directory that another local user could read or plant files in."""
+
+    if not hasattr(os, "getuid"):  # pragma: no cover - Windows
+        return
+    # mkdir(exist_ok=True) keeps the owner and mode of a directory created by someone else.
+    info = directory.stat()
+    if info.st_uid != os.getuid():
+        raise PermissionError(f"Token directory {directory} is not owned by the current user")
+    if info.st_mode & 0o077:
+        raise PermissionError(f"Token directory {directory} is accessible to other users; chmod it to 0700")
+
+
+class TokenManager:
+    """Thread-safe token cache with single-flight and proactive refreshes.
+
+    Parameters
+    ----------
+    fetch:
+        Callable performing the actual token request and returning an
+        :class:`AccessToken`.
+    key:
+        Identifier under which the token is shared through *store*.
+    store:
+        Optional :class:`TokenStore` used to reuse tokens between clients and
+        processes.
+    expiry_margin:
+        Seconds before expiry after which a token is no longer handed out.
+    refresh_ahead:
+        Seconds before expiry at which a background thread fetches the next
+        token so that callers never wait on a refresh. ``None`` disables
+        background refreshes.
+    metrics:
+        :class:`~metrics.MetricsRegistry` recording token fetches; the
+        shared :data:`~metrics.REGISTRY` by default.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], AccessToken],
+        *,
+        key: str,
+        store: TokenStore | None = None,
+        expiry_margin: float = 60.0,
+        refresh_ahead: float | None = 120.0,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        registry = metrics if metrics is not None else REGISTRY
+        self._refreshes = registry.counter(
+            "token_refreshes_total", "Access token refreshes by trigger and outcome.", ("mode", "outcome")
+        )
+        self._fetch_seconds = registry.histogram("token_fetch_duration_seconds", "Time spent fetching access tokens.")
+        self._fetch = fetch
+        self._key = key
+        self._store = store
+        self._expiry_margin = expiry_margin
+        self._refresh_ahead = refresh_ahead
+        self._token: AccessToken | None = None
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._closed = False
+
+    @property
+    def token(self) -> str | None:
+        """Return the cached token if it is still usable, without blocking."""
+
+        token = self._token
+        if token is not None and token.is_valid(margin=self._expiry_margin):
+            return token.value
+        return None
+
+    def get_token(self) -> str:
+        """Return a usable token, refreshing it if required.
+
+        Concurrent callers that find the token expired wait for a single
+        refresh rather than each requesting a new token.
+        """
+
+        cached = self.token
+        if cached is not None:
+            return cached
+        with self._lock:
+            cached = self.token
+            if cached is not None:
+                return cached
+            return self._refresh_locked(force=False).value
+
+    def invalidate(self, value: str) -> None:
+        """Forget *value* after the upstream rejected it.
+
+        Only the token that was actually rejected is dropped, so a burst of
+        401 responses for the same stale token causes a single refresh.
+        """
+
+        with self._lock:
+            if self._token is not None and self._token.value == value:
+                self._token = None
+            if self._store is not None:
+                self._store.discard(self._key, value)
+
+    def close(self) -> None:
+        """Stop background refreshes."""
+
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _refresh_locked(self, *, force: bool) -> AccessToken:
+        mode = "background" if force else "blocking"
+        if self._store is None:
+            token = self._timed_fetch(mode)
+        else:
+            with self._store.lock(self._key):
+                stored = self._store.load(self._key)
+                refresh_point = self._refresh_ahead if force and self._refresh_ahead is not None else self._expiry_margin
+                if stored is not None and stored.is_valid(margin=refresh_point):
+                    token = stored
+                    self._refreshes.labels(mode, "shared").inc()
+                else:
+                    token = self._timed_fetch(mode)
+                    self._store.save(self._key, token)
+        self._token = token
+        self._schedule_refresh(token)
+        return token
+
+    def _timed_fetch(self, mode: str) -> AccessToken:
+        started = time.perf_counter()
+        try:
+            with span("token.fetch", mode=mode):
+                token = self._fetch()
+        except Exception:
+            self._refreshes.labels(mode, "error").inc()
+            raise
+        finally:
+            self._fetch_seconds.labels().observe(time.perf_counter() - started)
+        self._refreshes.labels(mode, "fetched").inc()
+        return token
+
+    def _schedule_refresh(self, token: AccessToken) -> None:
+        if self._refresh_ahead is None or self._closed:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        delay = token.expires_at - self._refresh_ahead - time.time()
+        if delay <= 0:
+            self._timer = None
+            return
+        self._timer = threading.Timer(delay, self._background_refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _background_refresh(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self._refresh_locked(force=True)
+            except Exception:  # noqa: BLE001 - callers fall back to a synchronous refresh
+                self._timer = None
@@ -0,0 +1,319 @@
+"""Reproducible benchmarks against the local :class:`~stub_server.StubAmadeusServer`.
+
+The stub serves synthetic, seeded payloads of configurable size, so two runs
+on the same machine see byte-identical responses. Measured:
+
+* ``flights.search`` / ``hotels.search``: HTTP round trip, JSON decoding and
+  parsing in :class:`AmadeusFlightSearchProvider`/:class:`AmadeusHotelSearchProvider`
+* ``flights.normalize`` / ``hotels.normalize``: building and ranking offer
+  models from the parsed results
+* ``planner.plan_trip``: :meth:`ItineraryPlanner.plan_trip` latency
+* ``monitor.cycles``: :meth:`FlightMonitor.monitor` cycles per second
+* ``import.*``: time to import the package and its entry points in a fresh
+  interpreter, which dominates short-lived workers and cold starts
+
+Usage::
+
+    python benchmark.py --sizes 10,1000,100000 --output before.json
+    # ... change the code ...
+    python benchmark.py --sizes 10,1000,100000 --output after.json --baseline before.json
+
+With ``--baseline`` the run exits with status 1 when any benchmark is worse
+than the baseline by more than ``--threshold`` (10% by default).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import zlib
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Sequence
+
+from flights import FlightMonitor
+from hotels import HotelMonitor
+from itinerary import ItineraryPlanner
+from locations import LocationIndex
+from metrics import MetricsRegistry
+from models import FlightPreference, HotelPreference, TripRequest
+from providers import AmadeusConfig, AmadeusSearchProvider
+from ratelimit import RateLimiter
+from stub_server import (
+    FLIGHT_OFFERS_PATH,
+    HOTEL_OFFERS_PATH,
+    LOCATIONS_PATH,
+    StubAmadeusServer,
+    synthetic_flight_offers,
+    synthetic_hotel_offers,
+    synthetic_places,
+)
+
+_PLACE_VARIANTS = 4
+_IMPORTS = {
+    "import.package": "import travel_agent",
+    "import.models": "from travel_agent import TripRequest",
+    "import.providers": "from travel_agent import AmadeusSearchProvider",
+    "import.agent": "from travel_agent import TravelAgent",
+}
+_TRIP_START = date(2030, 5, 1)
+
+
+def _places_by_keyword(size: int) -> Callable[[Mapping[str, str]], bytes]:
+    """Serve one of a few pre-encoded place lists, chosen by the search keyword."""
+
+    variants = [
+        json.dumps(synthetic_places(size, seed=size * 31 + variant)).encode("utf-8")
+        for variant in range(_PLACE_VARIANTS)
+    ]
+    return lambda query: variants[zlib.crc32(query.get("keyword", "").encode("utf-8")) % len(variants)]
+
+
+def machine_profile() -> Dict[str, object]:
+    """Describe the interpreter and hardware the numbers were measured on."""
+
+    affinity = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+        "cpu_count": os.cpu_count(),
+        "cpu_affinity": affinity,
+    }
+
+
+def run_benchmarks(sizes: Sequence[int], *, repeat: int = 5, cycles: int = 5, interests: int = 6) -> Dict[str, object]:
+    """Run every benchmark for each payload size and return the results document."""
+
+    server = StubAmadeusServer(seed=0).start()
+    try:
+        config = AmadeusConfig(client_id="bench", client_secret="bench", hostname=server.base_url, timeout=60.0)
+
+        def provider() -> AmadeusSearchProvider:
+            # No pacing and a private registry, so that only the code under test is measured.
+            return AmadeusSearchProvider(
+                config, rate_limiter=RateLimiter(None), location_index=LocationIndex(), metrics=MetricsRegistry()
+            )
+
+        request = TripRequest(
+            origin="HKG",
+            destination="BJS",
+            start_date=_TRIP_START,
+            end_date=_TRIP_START + timedelta(days=4),
+            interests=(),
+            travelers=2,
+            destination_display="Beijing",
+        )
+        results: Dict[str, Dict[str, object]] = {}
+        for name, statement in _IMPORTS.items():
+            _record(results, name, "s", "lower", None, _import_timings(statement, repeat))
+        for size in sizes:
+            server.serve(FLIGHT_OFFERS_PATH, synthetic_flight_offers(size, seed=size))
+            server.serve(HOTEL_OFFERS_PATH, synthetic_hotel_offers(size, seed=size))
+            server.serve(LOCATIONS_PATH, _places_by_keyword(size))
+            flights = FlightMonitor(provider())
+            hotels = HotelMonitor(provider())
+            flight_preference = FlightPreference(alerts=True)
+            hotel_preference = HotelPreference()
+            flights.find_best_flights(request, flight_preference)  # warm up connections and the token
+            hotels.find_best_hotels(request, hotel_preference)
+
+            def search_flights() -> Sequence[Mapping[str, object]]:
+                return flights._provider.search_flights(**flights._search_kwargs(request, flight_preference))
+
+            def search_hotels() -> Sequence[Mapping[str, object]]:
+                return hotels._provider.search_hotels(**hotels._search_kwargs(request, hotel_preference))
+
+            raw_flights = search_flights()
+            raw_hotels = search_hotels()
+            _record(results, f"flights.search[n={size}]", "offers/s", "higher", len(raw_flights), _timings(search_flights, repeat))
+            _record(
+                results,
+                f"flights.normalize[n={size}]",
+                "offers/s",
+                "higher",
+                len(raw_flights),
+                _timings(lambda: flights._offers(raw_flights, flight_preference, None), repeat),
+            )
+            _record(results, f"hotels.search[n={size}]", "offers/s", "higher", len(raw_hotels), _timings(search_hotels, repeat))
+            _record(
+                results,
+                f"hotels.normalize[n={size}]",
+                "offers/s",
+                "higher",
+                len(raw_hotels),
+                _timings(lambda: hotels._offers(raw_hotels, hotel_preference, None), repeat),
+            )
+
+            planner = ItineraryPlanner(provider())
+            runs = iter(range(sys.maxsize))
+
+            def plan() -> None:
+                # Fresh keywords on every run so that the location index cannot answer them locally.
+                run = next(runs)
+                planner.plan_trip(
+                    dataclasses.replace(request, interests=tuple(f"r{run}i{index}x" for index in range(interests)))
+                )
+
+            _record(results, f"planner.plan_trip[n={size}]", "s", "lower", None, _timings(plan, repeat))
+
+            def monitor() -> None:
+                asyncio.run(flights.monitor(request, flight_preference, interval_seconds=0, max_cycles=cycles))
+
+            _record(results, f"monitor.cycles[n={size}]", "cycles/s", "higher", cycles, _timings(monitor, repeat))
+    finally:
+        server.stop()
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "machine": machine_profile(),
+        "settings": {"sizes": list(sizes), "repeat": repeat, "cycles": cycles, "interests": interests},
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Mapping[str, object], current: Mapping[str, object], *, threshold: float = 0.10
+) -> List[Dict[str, object]]:
+    """Compare two results documents benchmark by benchmark.
+
+    ``change`` is the relative improvement (positive is better) of the
+    median; a benchmark regresses when ``change < -threshold``.
+    """
+
+    rows = []
+    before = baseline.get("results", {})
+    after = current.get("results", {})
+    assert isinstance(before, Mapping) and isinstance(after, Mapping)
+    for name in sorted(set(before) & set(after)):
+        old, new = before[name], after[name]
+        if old["median"] <= 0 or new["median"] <= 0:
+            continue
+        ratio = new["median"] / old["median"]
+        change = ratio - 1 if new["better"] == "higher" else 1 / ratio - 1
+        rows.append(
+            {
+                "name": name,
+                "unit": new["unit"],
+                "baseline": old["median"],
+                "current": new["median"],
+                "change": change,
+                "regressed": change < -threshold,
+            }
+        )
+    return rows
+
+
+def _timings(func: Callable[[], object], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def _import_timings(statement: str, repeat: int) -> List[float]:
+    """Time *statement* in *repeat* fresh interpreters, excluding interpreter start-up."""
+
+    package = Path(__file__).resolve().parent
+    env = dict(os.environ)
+    # The modules import each other by their top-level names, so the package directory is on the path too.
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(package.parent), str(package), env.get("PYTHONPATH")]))
+    code = f"import time\nstarted = time.perf_counter()\n{statement}\nprint(time.perf_counter() - started)"
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=package.parent, env=env, capture_output=True, text=True, check=True
+        )
+        samples.append(float(output.stdout.strip()))
+    return samples
+
+
+def _record(
+    results: Dict[str, Dict[str, object]],
+    name: str,
+    unit: str,
+    better: str,
+    work: int | None,
+    samples: Sequence[float],
+) -> None:
+    """Store *samples* (seconds per run) as a rate of *work* per second or as latency."""
+
+    values = [work / sample for sample in samples] if work is not None else list(samples)
+    results[name] = {
+        "unit": unit,
+        "better": better,
+        "median": statistics.median(values),
+        "best": max(values) if better == "higher" else min(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "samples": values,
+    }
+    print(f"{name:<32} {statistics.median(values):>14.4g} {unit}", file=sys.stderr)
+
+
+def _git_commit() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--sizes", default="10,1000,10000", help="comma separated offer counts (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark (default: %(default)s)")
+    parser.add_argument("--cycles", type=int, default=5, help="monitor cycles per run (default: %(default)s)")
+    parser.add_argument("--output", type=Path, help="write the results JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="results JSON of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown (default: %(default)s)")
+    parser.add_argument("--cpu", type=int, help="pin the process to this CPU for steadier numbers")
+    args = parser.parse_args(argv)
+
+    if args.cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {args.cpu})
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    document = run_benchmarks(sizes, repeat=args.repeat, cycles=args.cycles)
+    text = json.dumps(document, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("machine") != document["machine"]:
+        print("warning: baseline was measured on a different machine profile", file=sys.stderr)
+    rows = compare(baseline, document, threshold=args.threshold)
+    for row in rows:
+        flag = "REGRESSION" if row["regressed"] else ""
+        print(
+            f"{row['name']:<32} {row['baseline']:>12.4g} -> {row['current']:>12.4g} {row['unit']:<9}"
+            f" {row['change']:+7.1%} {flag}",
+            file=sys.stderr,
+        )
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
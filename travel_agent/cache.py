@@ -0,0 +1,300 @@
+"""Response caching for search providers."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Mapping, Sequence, Tuple
+
+from metrics import REGISTRY, MetricsRegistry
+from search import CompositeSearchProvider
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters describing the behaviour of a :class:`CachingSearchProvider`."""
+
+    hits: int = 0
+    misses: int = 0
+    negative_hits: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: Sequence[Mapping[str, object]]
+    expires_at: float
+    size: int
+
+
+class CachingSearchProvider(CompositeSearchProvider):
+    """Memoize the results of another composite provider.
+
+    Results are keyed on the method name plus a normalized tuple of its
+    arguments, so argument order and the order of sequence arguments such as
+    ``loyalty_programs`` do not fragment the cache. Entries expire after a
+    per-method TTL and the least recently used ones are evicted once either
+    *max_entries* or the estimated *max_bytes* is exceeded. Empty results are
+    cached for *negative_ttl* seconds (``None`` disables negative caching).
+    Concurrent misses for the same key are coalesced: one caller fetches and
+    the others wait for its result. Those waits are counted in ``coalesced``
+    only; they are neither hits nor misses, since the result still comes
+    from upstream.
+
+    Cached result sequences are shared between callers and must be treated as
+    read-only.
+
+    Lookups, the hit ratio, evictions and the cache size are published to
+    *metrics* (the shared :data:`~metrics.REGISTRY` by default) under the
+    ``cache`` label *name*.
+    """
+
+    def __init__(
+        self,
+        provider: CompositeSearchProvider,
+        *,
+        search_ttl: float = 3600.0,
+        flights_ttl: float = 300.0,
+        hotels_ttl: float = 600.0,
+        negative_ttl: float | None = 60.0,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: MetricsRegistry | None = None,
+        name: str = "search",
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self._provider = provider
+        self._ttls = {
+            "search": search_ttl,
+            "search_flights": flights_ttl,
+            "search_hotels": hotels_ttl,
+        }
+        self._negative_ttl = negative_ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: Dict[Hashable, Future[Sequence[Mapping[str, object]]]] = {}
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        registry = metrics if metrics is not None else REGISTRY
+        self._name = name
+        self._lookups = registry.counter(
+            "search_cache_lookups_total", "Search cache lookups by cache, method and result.", ("cache", "method", "result")
+        )
+        self._hit_ratio = registry.gauge(
+            "search_cache_hit_ratio", "Share of lookups answered from the cache.", ("cache",)
+        ).labels(name)
+        self._evictions = registry.counter(
+            "search_cache_evictions_total", "Entries evicted to stay within the cache limits.", ("cache",)
+        ).labels(name)
+        self._size_entries = registry.gauge("search_cache_entries", "Entries held by the cache.", ("cache",)).labels(name)
+        self._size_bytes = registry.gauge(
+            "search_cache_bytes", "Estimated memory held by cached results.", ("cache",)
+        ).labels(name)
+
+    @property
+    def provider(self) -> CompositeSearchProvider:
+        return self._provider
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                negative_hits=self._stats.negative_hits,
+                coalesced=self._stats.coalesced,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._size_entries.set(0)
+            self._size_bytes.set(0)
+
+    def search(
+        self, query: str, *, filters: Mapping[str, object] | None = None
+    ) -> Sequence[Mapping[str, object]]:
+        return self._cached(
+            "search",
+            lambda: self._provider.search(query, filters=filters),
+            query=query,
+            filters=filters,
+        )
+
+    def search_flights(
+        self,
+        *,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: str | None,
+        travelers: int,
+        cabin: str | None,
+        max_stops: int | None,
+        loyalty_programs: Sequence[str],
+    ) -> Sequence[Mapping[str, object]]:
+        kwargs = {
+            "origin": origin,
+            "destination": destination,
+            "departure_date": departure_date,
+            "return_date": return_date,
+            "travelers": travelers,
+            "cabin": cabin,
+            "max_stops": max_stops,
+            "loyalty_programs": loyalty_programs,
+        }
+        return self._cached("search_flights", lambda: self._provider.search_flights(**kwargs), **kwargs)
+
+    def search_hotels(
+        self,
+        *,
+        destination: str,
+        check_in: str,
+        check_out: str,
+        travelers: int,
+        neighborhoods: Sequence[str],
+        amenities: Sequence[str],
+        loyalty_programs: Sequence[str],
+    ) -> Sequence[Mapping[str, object]]:
+        kwargs = {
+            "destination": destination,
+            "check_in": check_in,
+            "check_out": check_out,
+            "travelers": travelers,
+            "neighborhoods": neighborhoods,
+            "amenities": amenities,
+            "loyalty_programs": loyalty_programs,
+        }
+        return self._cached("search_hotels", lambda: self._provider.search_hotels(**kwargs), **kwargs)
+
+    def _cached(
+        self,
+        method: str,
+        fetch: Callable[[], Sequence[Mapping[str, object]]],
+        **kwargs: object,
+    ) -> Sequence[Mapping[str, object]]:
+        key = cache_key(method, kwargs)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    if not entry.value:
+                        self._stats.negative_hits += 1
+                    self._record_lookup(method, "hit")
+                    return entry.value
+                self._discard(key)
+                self._stats.expirations += 1
+            flight = self._inflight.get(key)
+            if flight is None:
+                flight = self._inflight[key] = Future()
+                self._stats.misses += 1
+                self._record_lookup(method, "miss")
+                leader = True
+            else:
+                self._stats.coalesced += 1
+                self._record_lookup(method, "coalesced")
+                leader = False
+
+        if not leader:
+            return flight.result()
+        try:
+            value = tuple(fetch())
+            self._store(key, method, value)
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(value)
+        finally:
+            with self._lock:
+                del self._inflight[key]
+        return value
+
+    def _store(self, key: Hashable, method: str, value: Sequence[Mapping[str, object]]) -> None:
+        ttl = self._ttls[method] if value else self._negative_ttl
+        if ttl is None or ttl <= 0:
+            return
+        size = _estimate_size(value)
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            self._entries[key] = _Entry(value=value, expires_at=self._clock() + ttl, size=size)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self._stats.evictions += 1
+                self._evictions.inc()
+            self._size_entries.set(len(self._entries))
+            self._size_bytes.set(self._bytes)
+
+    def _record_lookup(self, method: str, result: str) -> None:
+        self._lookups.labels(self._name, method, result).inc()
+        self._hit_ratio.set(self._stats.hit_ratio)
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+def cache_key(method: str, kwargs: Mapping[str, object]) -> Tuple[Hashable, ...]:
+    """Build a hashable, order-insensitive key for a provider call."""
+
+    return (method,) + tuple((name, _freeze(kwargs[name])) for name in sorted(kwargs))
+
+
+def _freeze(value: object) -> Hashable:
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(sorted((_freeze(item) for item in value), key=repr))
+    return repr(value)
+
+
+def _estimate_size(value: object) -> int:
+    """Roughly estimate the memory held by a provider result."""
+
+    size = sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        size += sum(_estimate_size(key) + _estimate_size(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item) for item in value)
+    return size
@@ -0,0 +1,166 @@
+"""Detect changes between successive offer snapshots."""
+
+from __future__ import annotations
+
+import enum
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Iterable, List, Sequence, Tuple, TypeVar
+
+from models import FlightOffer, HotelOffer
+
+_Offer = TypeVar("_Offer")
+
+
+class OfferEventKind(str, enum.Enum):
+    """Kinds of change reported by :class:`OfferChangeDetector`."""
+
+    NEW = "new"
+    PRICE_DROPPED = "price_dropped"
+    PRICE_RAISED = "price_raised"
+    DISAPPEARED = "disappeared"
+
+
+@dataclass(frozen=True, slots=True)
+class OfferEvent(Generic[_Offer]):
+    """A change observed for a single offer."""
+
+    kind: OfferEventKind
+    offer: _Offer
+    previous_price: float | None = None
+
+
+def flight_offer_key(offer: FlightOffer) -> Tuple[str, ...]:
+    """Stable identity of a flight offer: carrier, flight number and times."""
+
+    return (
+        offer.airline,
+        offer.flight_number,
+        offer.departure_time.isoformat(),
+        offer.arrival_time.isoformat(),
+    )
+
+
+def hotel_offer_key(offer: HotelOffer) -> Tuple[str, ...]:
+    """Stable identity of a hotel offer: hotel, stay dates and room notes.
+
+    The room notes (board type, room description) tell apart several room
+    offers of the same hotel for the same dates.
+    """
+
+    return (
+        offer.name,
+        offer.location or "",
+        offer.check_in.isoformat(),
+        offer.check_out.isoformat(),
+        "|".join(offer.notes),
+    )
+
+
+class OfferChangeDetector(Generic[_Offer]):
+    """Compare offer snapshots and emit typed change events.
+
+    Prices are remembered for at most *capacity* offer identities in an LRU
+    map, so memory stays bounded however long a monitor runs. Offers present
+    in the previous snapshot but missing from the current one are reported as
+    :attr:`OfferEventKind.DISAPPEARED`. Price moves smaller than *min_change*
+    are ignored. :meth:`export_state` and :meth:`load_state` let a monitor
+    survive restarts without re-announcing every offer.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[_Offer], Hashable],
+        *,
+        price: Callable[[_Offer], float],
+        capacity: int = 10_000,
+        min_change: float = 0.0,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._key = key
+        self._price = price
+        self._capacity = capacity
+        self._min_change = min_change
+        self._known: OrderedDict[Hashable, float] = OrderedDict()
+        self._last: Dict[Hashable, _Offer] = {}
+
+    @classmethod
+    def for_flights(cls, *, capacity: int = 10_000, min_change: float = 0.0) -> "OfferChangeDetector[FlightOffer]":
+        return cls(flight_offer_key, price=lambda offer: offer.price, capacity=capacity, min_change=min_change)
+
+    @classmethod
+    def for_hotels(cls, *, capacity: int = 10_000, min_change: float = 0.0) -> "OfferChangeDetector[HotelOffer]":
+        return cls(
+            hotel_offer_key, price=lambda offer: offer.price_per_night, capacity=capacity, min_change=min_change
+        )
+
+    def __len__(self) -> int:
+        return len(self._known)
+
+    def diff(self, offers: Iterable[_Offer]) -> List[OfferEvent[_Offer]]:
+        """Record *offers* as the current snapshot and return the changes."""
+
+        events: List[OfferEvent[_Offer]] = []
+        current: Dict[Hashable, _Offer] = {}
+        for offer in offers:
+            identity = self._key(offer)
+            if identity in current:
+                # Keep the cheaper of two duplicates within one snapshot.
+                if self._price(offer) >= self._price(current[identity]):
+                    continue
+            current[identity] = offer
+
+        for identity, offer in current.items():
+            price = self._price(offer)
+            previous = self._known.get(identity)
+            if previous is None:
+                events.append(OfferEvent(OfferEventKind.NEW, offer))
+            elif price < previous - self._min_change:
+                events.append(OfferEvent(OfferEventKind.PRICE_DROPPED, offer, previous))
+            elif price > previous + self._min_change:
+                events.append(OfferEvent(OfferEventKind.PRICE_RAISED, offer, previous))
+            else:
+                price = previous
+            self._known[identity] = price
+            self._known.move_to_end(identity)
+
+        for identity, offer in self._last.items():
+            if identity not in current:
+                events.append(OfferEvent(OfferEventKind.DISAPPEARED, offer, self._known.pop(identity, None)))
+
+        while len(self._known) > self._capacity:
+            self._known.popitem(last=False)
+        self._last = current
+        return events
+
+    def export_state(self) -> List[Tuple[object, float]]:
+        """Return the remembered prices in a JSON-serialisable form."""
+
+        return [
+            (list(identity) if isinstance(identity, tuple) else identity, price)
+            for identity, price in self._known.items()
+        ]
+
+    def load_state(self, state: Iterable[Sequence[object]]) -> None:
+        """Restore prices saved by :meth:`export_state`."""
+
+        self._known.clear()
+        self._last = {}
+        for identity, price in state:
+            key = tuple(identity) if isinstance(identity, list) else identity
+            self._known[key] = float(price)  # type: ignore[arg-type]
+        while len(self._known) > self._capacity:
+            self._known.popitem(last=False)
+
+
+def notable_offers(events: Iterable[OfferEvent[_Offer]]) -> Tuple[_Offer, ...]:
+    """Return the offers users are alerted about: new ones and price drops."""
+
+    return tuple(
+        event.offer for event in events if event.kind in (OfferEventKind.NEW, OfferEventKind.PRICE_DROPPED)
+    )
+
+
+EventCallback = Callable[[Sequence[OfferEvent[object]]], None]
+"""Type alias for callbacks receiving change events."""
@@ -0,0 +1,147 @@
+"""Remove duplicate activities returned by overlapping searches."""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import re
+import unicodedata
+from typing import Dict, Hashable, Iterable, List, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from models import Activity
+
+_TRACKING_PREFIXES = ("utm_",)
+_TRACKING_PARAMETERS = frozenset({"gclid", "fbclid", "spm", "ref"})
+_PUNCTUATION = re.compile(r"[\W_]+", re.UNICODE)
+# Coordinates are bucketed to roughly 100 m; neighbouring buckets are probed
+# so that two points straddling a bucket edge still match.
+_COORDINATE_PRECISION = 3
+_COORDINATE_STEP = 10 ** -_COORDINATE_PRECISION
+_ACTIVITY_FIELDS = tuple(item.name for item in dataclasses.fields(Activity))
+
+
+@functools.lru_cache(maxsize=16384)
+def normalize_url(url: str | None) -> str | None:
+    """Canonical form of *url* for equality checks.
+
+    The scheme and host are lower-cased, a leading ``www.``, the fragment,
+    tracking parameters and trailing slashes are dropped and the remaining
+    query parameters are sorted.
+    """
+
+    if not url:
+        return None
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return None
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(_TRACKING_PREFIXES) and key.lower() not in _TRACKING_PARAMETERS
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(("", host, path, urlencode(query), ""))
+
+
+@functools.lru_cache(maxsize=16384)
+def normalize_name(name: str) -> str:
+    """Case-, width- and punctuation-insensitive form of a place name.
+
+    Space-separated words are sorted so that "Palace Museum" and
+    "Museum, Palace" compare equal.
+    """
+
+    text = unicodedata.normalize("NFKC", name).casefold()
+    words = [word for word in _PUNCTUATION.split(text) if word]
+    return " ".join(sorted(words))
+
+
+class ActivityDeduplicator:
+    """Merge activities that describe the same place.
+
+    Two activities are duplicates when their normalized booking URLs match,
+    or when their normalized names match and they are at the same place:
+    within about 100 m when both have coordinates, otherwise at the same
+    normalized ``location`` text (or both without a location). Every key is
+    a hash lookup, so the cost is linear in the number of activities. The
+    first occurrence is kept and missing fields are filled in from its
+    duplicates.
+    """
+
+    def __init__(self) -> None:
+        self._index: Dict[Hashable, int] = {}
+        self._activities: List[Activity] = []
+        self.duplicates = 0
+
+    def add(self, activity: Activity) -> bool:
+        """Record *activity*; return ``False`` if it duplicated an earlier one."""
+
+        lookups, keys = self._keys(activity)
+        for key in lookups:
+            position = self._index.get(key)
+            if position is not None:
+                self._activities[position] = _merge(self._activities[position], activity)
+                for own_key in keys:
+                    self._index.setdefault(own_key, position)
+                self.duplicates += 1
+                return False
+        position = len(self._activities)
+        self._activities.append(activity)
+        for key in keys:
+            self._index.setdefault(key, position)
+        return True
+
+    def extend(self, activities: Iterable[Activity]) -> None:
+        for activity in activities:
+            self.add(activity)
+
+    @property
+    def activities(self) -> List[Activity]:
+        return list(self._activities)
+
+    @staticmethod
+    def _keys(activity: Activity) -> tuple[List[Hashable], List[Hashable]]:
+        """Return the keys to probe and the keys to register for *activity*."""
+
+        lookups: List[Hashable] = []
+        keys: List[Hashable] = []
+        url = normalize_url(activity.booking_url)
+        if url is not None:
+            lookups.append(("url", url))
+            keys.append(("url", url))
+        name = normalize_name(activity.name or "")
+        if not name:
+            return lookups, keys
+        if activity.latitude is not None and activity.longitude is not None:
+            row = round(activity.latitude / _COORDINATE_STEP)
+            column = round(activity.longitude / _COORDINATE_STEP)
+            keys.append(("geo", name, row, column))
+            lookups.extend(
+                ("geo", name, row + d_row, column + d_column) for d_row in (-1, 0, 1) for d_column in (-1, 0, 1)
+            )
+        else:
+            place = normalize_name(activity.location or "")
+            keys.append(("place", name, place))
+            lookups.append(("place", name, place))
+        return lookups, keys
+
+
+def deduplicate_activities(activities: Sequence[Activity]) -> List[Activity]:
+    """Return *activities* without duplicates, keeping first-seen order."""
+
+    deduplicator = ActivityDeduplicator()
+    deduplicator.extend(activities)
+    return deduplicator.activities
+
+
+def _merge(kept: Activity, duplicate: Activity) -> Activity:
+    missing = {
+        name: getattr(duplicate, name)
+        for name in _ACTIVITY_FIELDS
+        if getattr(kept, name) in (None, "") and getattr(duplicate, name) not in (None, "")
+    }
+    return dataclasses.replace(kept, **missing) if missing else kept
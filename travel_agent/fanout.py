@@ -0,0 +1,241 @@
+"""Query several flight or hotel providers at once and merge their offers."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, List, Mapping, Sequence, TypeVar
+
+from changes import flight_offer_key, hotel_offer_key
+from models import FlightOffer, HotelOffer
+from search import FlightSearchProvider, HotelSearchProvider
+
+_P = TypeVar("_P")
+
+
+@dataclass(slots=True)
+class FanOutStats:
+    """Counters describing the behaviour of a fan-out provider."""
+
+    searches: int = 0
+    partial_results: int = 0
+    timeouts: int = 0
+    failures: int = 0
+    duplicates: int = 0
+
+
+class _FanOut(Generic[_P]):
+    """Shared machinery of :class:`FanOutFlightSearchProvider` and
+    :class:`FanOutHotelSearchProvider`."""
+
+    def __init__(
+        self,
+        providers: Sequence[_P],
+        *,
+        timeout: float | None,
+        executor: Executor | None,
+        identity: Callable[[Mapping[str, object]], Hashable],
+        price: Callable[[Mapping[str, object]], float],
+    ) -> None:
+        if not providers:
+            raise ValueError("At least one provider is required")
+        self._providers = tuple(providers)
+        self._timeout = timeout
+        self._executor = executor
+        self._identity = identity
+        self._price = price
+        self._stats = FanOutStats()
+        self._lock = threading.Lock()
+
+    @property
+    def providers(self) -> Sequence[_P]:
+        return self._providers
+
+    @property
+    def stats(self) -> FanOutStats:
+        with self._lock:
+            return FanOutStats(**{name: getattr(self._stats, name) for name in FanOutStats.__slots__})
+
+    def _gather(
+        self, call: Callable[[_P], Sequence[Mapping[str, object]]]
+    ) -> Sequence[Mapping[str, object]]:
+        """Run *call* against every provider and merge what arrives in time.
+
+        Providers that fail or miss the shared deadline are skipped. An error
+        is raised only when no provider answered at all.
+        """
+
+        executor = self._executor
+        owned = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=len(self._providers), thread_name_prefix="fan-out"
+            )
+        try:
+            futures: List[Future[Sequence[Mapping[str, object]]]] = [
+                executor.submit(call, provider) for provider in self._providers
+            ]
+            done, not_done = wait(futures, timeout=self._timeout)
+        finally:
+            if owned:
+                # Stragglers finish in the background; their results are dropped.
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        answered: List[Sequence[Mapping[str, object]]] = []
+        errors: List[BaseException] = []
+        # Iterate in provider order so that ties between equal prices are stable.
+        for future in futures:
+            if future not in done:
+                future.cancel()
+                continue
+            error = future.exception()
+            if error is None:
+                answered.append(future.result())
+            else:
+                errors.append(error)
+
+        with self._lock:
+            self._stats.searches += 1
+            self._stats.timeouts += len(not_done)
+            self._stats.failures += len(errors)
+            if answered and len(answered) < len(self._providers):
+                self._stats.partial_results += 1
+        if not answered:
+            if errors:
+                raise errors[0]
+            raise TimeoutError(f"No provider answered within {self._timeout} seconds")
+        return self._merge(answered)
+
+    def _merge(self, batches: Sequence[Sequence[Mapping[str, object]]]) -> Sequence[Mapping[str, object]]:
+        """Keep the cheapest result per offer identity, in first-seen order."""
+
+        best: Dict[Hashable, tuple[float, Mapping[str, object]]] = {}
+        duplicates = 0
+        for batch in batches:
+            for raw in batch:
+                try:
+                    key = self._identity(raw)
+                    price = self._price(raw)
+                except (TypeError, ValueError):
+                    # Results that cannot be identified are passed through untouched.
+                    key, price = ("unparsed", id(raw)), float("inf")
+                current = best.get(key)
+                if current is None:
+                    best[key] = (price, raw)
+                    continue
+                duplicates += 1
+                if price < current[0]:
+                    best[key] = (price, raw)
+        with self._lock:
+            self._stats.duplicates += duplicates
+        return tuple(raw for _, raw in best.values())
+
+
+class FanOutFlightSearchProvider(_FanOut[FlightSearchProvider], FlightSearchProvider):
+    """Search several flight providers concurrently and merge their offers.
+
+    Every provider is queried at once and the search waits at most *timeout*
+    seconds for all of them together, so the latency is that of the slowest
+    provider that makes the deadline rather than their sum. Offers are
+    identified with :func:`~changes.flight_offer_key`; when several providers
+    return the same flight, the cheapest copy is kept. Providers that fail or
+    miss the deadline are left out of the result, which is only an error when
+    no provider answered.
+
+    Parameters
+    ----------
+    providers:
+        Backends to query, e.g. Amadeus and an internal fare cache.
+    timeout:
+        Shared deadline in seconds for one search; ``None`` waits for all.
+    executor:
+        Pool to run the searches on. By default a short-lived pool with one
+        thread per provider is used for every search.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[FlightSearchProvider],
+        *,
+        timeout: float | None = 10.0,
+        executor: Executor | None = None,
+    ) -> None:
+        super().__init__(
+            providers,
+            timeout=timeout,
+            executor=executor,
+            identity=lambda raw: flight_offer_key(FlightOffer.from_mapping(raw)),
+            price=lambda raw: float(raw.get("price", 0.0)),
+        )
+
+    def search_flights(
+        self,
+        *,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: str | None,
+        travelers: int,
+        cabin: str | None,
+        max_stops: int | None,
+        loyalty_programs: Sequence[str],
+    ) -> Sequence[Mapping[str, object]]:
+        return self._gather(
+            lambda provider: provider.search_flights(
+                origin=origin,
+                destination=destination,
+                departure_date=departure_date,
+                return_date=return_date,
+                travelers=travelers,
+                cabin=cabin,
+                max_stops=max_stops,
+                loyalty_programs=loyalty_programs,
+            )
+        )
+
+
+class FanOutHotelSearchProvider(_FanOut[HotelSearchProvider], HotelSearchProvider):
+    """Search several hotel providers concurrently and merge their offers.
+
+    Works like :class:`FanOutFlightSearchProvider`; offers are identified
+    with :func:`~changes.hotel_offer_key` and the lowest nightly price wins.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[HotelSearchProvider],
+        *,
+        timeout: float | None = 10.0,
+        executor: Executor | None = None,
+    ) -> None:
+        super().__init__(
+            providers,
+            timeout=timeout,
+            executor=executor,
+            identity=lambda raw: hotel_offer_key(HotelOffer.from_mapping(raw)),
+            price=lambda raw: float(raw.get("price_per_night", 0.0)),
+        )
+
+    def search_hotels(
+        self,
+        *,
+        destination: str,
+        check_in: str,
+        check_out: str,
+        travelers: int,
+        neighborhoods: Sequence[str],
+        amenities: Sequence[str],
+        loyalty_programs: Sequence[str],
+    ) -> Sequence[Mapping[str, object]]:
+        return self._gather(
+            lambda provider: provider.search_hotels(
+                destination=destination,
+                check_in=check_in,
+                check_out=check_out,
+                travelers=travelers,
+                neighborhoods=neighborhoods,
+                amenities=amenities,
+                loyalty_programs=loyalty_programs,
+            )
+        )
@@ -3,33 +3,220 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
-from typing import Callable, List, Mapping, Sequence
+import contextlib
+import copy
+import dataclasses
+import heapq
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Callable, Iterator, List, Mapping, Sequence
 
-from models import FlightOffer, FlightPreference, TripRequest
-from search import FlightSearchProvider
+from changes import OfferChangeDetector, OfferEvent, notable_offers
+from metrics import MetricsRegistry, MonitorMetrics
+from models import FareCell, FareMatrix, FlightOffer, FlightPreference, TripRequest
+from ranking import RankingWeights, rank_flights
+from search import (
+    AsyncFlightSearchProvider,
+    FlightSearchProvider,
+    StreamingFlightSearchProvider,
+    as_async_provider,
+)
+from tracing import span
 
 
 class FlightMonitor:
-    """Search and monitor flights for a planned itinerary."""
+    """Search and monitor flights for a planned itinerary.
 
-    def __init__(self, provider: FlightSearchProvider) -> None:
-        self._provider = provider
+    The monitor accepts either a synchronous or an async provider. Synchronous
+    providers are also usable from :meth:`find_best_flights_async` through an
+    executor-backed adapter; async-only providers cannot serve the blocking
+    :meth:`find_best_flights`.
+
+    Parameters
+    ----------
+    executor:
+        Executor used to run a synchronous provider off the event loop. When
+        omitted and *max_concurrency* is set, a dedicated thread pool of that
+        size is created and shut down by :meth:`close`; otherwise the loop's
+        default executor is used.
+    max_concurrency:
+        Upper bound on provider calls in flight at once from this monitor.
+    weights:
+        :class:`~ranking.RankingWeights` used to order offers; by default
+        offers are ranked by price with a small bonus for preferred airlines.
+    metrics:
+        :class:`~metrics.MetricsRegistry` receiving cycle durations, lag and
+        normalization times; the shared :data:`~metrics.REGISTRY` by default.
+    """
 
-    def find_best_flights(self, request: TripRequest, preference: FlightPreference) -> List[FlightOffer]:
-        """Return the best available flights based on preferences."""
-
-        results = self._provider.search_flights(
-            origin=request.origin,
-            destination=request.destination,
-            departure_date=request.start_date.isoformat(),
-            return_date=request.end_date.isoformat(),
-            travelers=request.travelers,
-            cabin=preference.cabin,
-            max_stops=preference.max_stops,
-            loyalty_programs=preference.loyalty_programs,
+    def __init__(
+        self,
+        provider: FlightSearchProvider | AsyncFlightSearchProvider,
+        *,
+        executor: Executor | None = None,
+        max_concurrency: int | None = None,
+        weights: RankingWeights | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._owns_executor = (
+            executor is None and max_concurrency is not None and isinstance(provider, FlightSearchProvider)
+        )
+        if self._owns_executor:
+            executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="flight-monitor")
+        self._provider = provider
+        self._async_provider = as_async_provider(provider, executor=executor)
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        # asyncio primitives bind to the loop they are first used on, so keep one semaphore per loop.
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
         )
-        return [self._normalize_offer(result) for result in results]
+        self._weights = weights
+        self._metrics = MonitorMetrics(metrics, "flights")
+
+    @property
+    def provider(self) -> FlightSearchProvider | AsyncFlightSearchProvider:
+        return self._provider
+
+    def with_provider(self, provider: FlightSearchProvider | AsyncFlightSearchProvider) -> "FlightMonitor":
+        """Return a copy of this monitor that searches *provider* with the same settings."""
+
+        clone = copy.copy(self)
+        clone._provider = provider
+        clone._async_provider = as_async_provider(provider, executor=self._executor)
+        # The copy borrows this monitor's thread pool; only the original shuts it down.
+        clone._owns_executor = False
+        return clone
+
+    def close(self) -> None:
+        """Shut down the thread pool this monitor created for *max_concurrency*.
+
+        Executors passed in by the caller are left running, as are copies
+        made by :meth:`with_provider`, which share this monitor's pool.
+        """
+
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "FlightMonitor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _limit(self) -> contextlib.AbstractAsyncContextManager[object]:
+        if self._max_concurrency is None:
+            return contextlib.nullcontext()
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+        return semaphore
+
+    def find_best_flights(
+        self, request: TripRequest, preference: FlightPreference, *, limit: int | None = None
+    ) -> List[FlightOffer]:
+        """Return the best available flights based on preferences.
+
+        Offers above ``preference.max_price`` or with more than
+        ``preference.max_stops`` stops are dropped and the rest are returned
+        best first. *limit* keeps only that many offers.
+        """
+
+        if not isinstance(self._provider, FlightSearchProvider):
+            raise TypeError("find_best_flights requires a synchronous FlightSearchProvider")
+        with span("provider.search_flights", provider=type(self._provider).__name__):
+            results = self._provider.search_flights(**self._search_kwargs(request, preference))
+        return self._offers(results, preference, limit)
+
+    def iter_best_flights(self, request: TripRequest, preference: FlightPreference) -> Iterator[FlightOffer]:
+        """Yield offers one at a time instead of building a list.
+
+        Offers are yielded in provider order without filtering or ranking.
+        Providers implementing :class:`~search.StreamingFlightSearchProvider`
+        parse the response body incrementally, so a large payload is never
+        held in memory as a whole.
+        """
+
+        if isinstance(self._provider, StreamingFlightSearchProvider):
+            yield from self._provider.iter_flight_offers(**self._search_kwargs(request, preference))
+            return
+        if not isinstance(self._provider, FlightSearchProvider):
+            raise TypeError("iter_best_flights requires a synchronous FlightSearchProvider")
+        for result in self._provider.search_flights(**self._search_kwargs(request, preference)):
+            yield self._normalize_offer(result)
+
+    async def find_best_flights_async(
+        self, request: TripRequest, preference: FlightPreference, *, limit: int | None = None
+    ) -> List[FlightOffer]:
+        """Coroutine variant of :meth:`find_best_flights`."""
+
+        async with self._limit():
+            with span("provider.search_flights", provider=type(self._async_provider).__name__):
+                results = await self._async_provider.search_flights(**self._search_kwargs(request, preference))
+        return self._offers(results, preference, limit)
+
+    def find_fare_matrix(
+        self,
+        request: TripRequest,
+        preference: FlightPreference,
+        *,
+        flex_days: int = 1,
+        max_workers: int = 8,
+        top: int = 5,
+    ) -> FareMatrix:
+        """Search every date pair within ±*flex_days* of the requested dates.
+
+        The ``(2 * flex_days + 1) ** 2`` searches run on a pool of at most
+        *max_workers* threads. Wrap the provider in a
+        :class:`~cache.CachingSearchProvider` to share results between
+        overlapping matrices and monitors. The *top* cheapest cells are
+        returned in :attr:`FareMatrix.cheapest`.
+        """
+
+        departures, returns, pairs = self._fare_grid(request, flex_days)
+        results: dict[tuple[date, date], List[FlightOffer] | None] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs) or 1))) as pool:
+            futures = {
+                pool.submit(self.find_best_flights, self._shift(request, pair), preference): pair for pair in pairs
+            }
+            for future, pair in futures.items():
+                try:
+                    results[pair] = future.result()
+                except Exception:  # noqa: BLE001 - a failing cell must not sink the whole matrix
+                    results[pair] = None
+        return self._build_matrix(departures, returns, results, top)
+
+    async def find_fare_matrix_async(
+        self,
+        request: TripRequest,
+        preference: FlightPreference,
+        *,
+        flex_days: int = 1,
+        max_workers: int = 8,
+        top: int = 5,
+    ) -> FareMatrix:
+        """Coroutine variant of :meth:`find_fare_matrix`.
+
+        At most *max_workers* cells are searched at once, and the monitor's
+        ``max_concurrency`` still applies on top of that.
+        """
+
+        departures, returns, pairs = self._fare_grid(request, flex_days)
+        limit = asyncio.Semaphore(max(1, max_workers))
+
+        async def search(pair: tuple[date, date]) -> List[FlightOffer]:
+            async with limit:
+                return await self.find_best_flights_async(self._shift(request, pair), preference)
+
+        outcomes = await asyncio.gather(*(search(pair) for pair in pairs), return_exceptions=True)
+        results = {
+            pair: None if isinstance(outcome, BaseException) else outcome for pair, outcome in zip(pairs, outcomes)
+        }
+        return self._build_matrix(departures, returns, results, top)
 
     async def monitor(
         self,
@@ -39,49 +226,109 @@ class FlightMonitor:
         interval_seconds: int = 3600,
         callback: Callable[[Sequence[FlightOffer]], None] | None = None,
         max_cycles: int | None = None,
+        on_event: Callable[[Sequence[OfferEvent[FlightOffer]]], None] | None = None,
+        detector: OfferChangeDetector[FlightOffer] | None = None,
     ) -> None:
-        """Continuously poll the provider and invoke *callback* with new offers."""
+        """Continuously poll the provider and report offer changes.
+
+        *callback* receives offers that are new or dropped in price since the
+        previous cycle; *on_event* receives every :class:`~changes.OfferEvent`,
+        including price rises and disappeared offers. Pass a *detector* to
+        bound its memory differently or to resume from saved state.
+        """
 
         if not preference.alerts and max_cycles is None:
             return
 
         cycles = 0
-        seen: set[str] = set()
+        loop = asyncio.get_running_loop()
+        due = loop.time()
+        detector = detector if detector is not None else OfferChangeDetector.for_flights()
         while preference.alerts or (max_cycles is not None and cycles < max_cycles):
-            offers = self.find_best_flights(request, preference)
-            fresh = [offer for offer in offers if offer.booking_url not in seen]
-            for offer in fresh:
-                seen.add(offer.booking_url)
-            if fresh and callback:
-                callback(tuple(fresh))
+            started = loop.time()
+            self._metrics.lag.set(max(0.0, started - due))
+            with span("monitor.cycle", kind="flights", cycle=cycles + 1):
+                offers = await self.find_best_flights_async(request, preference)
+                events = detector.diff(offers)
+                if events and on_event:
+                    on_event(tuple(events))
+                fresh = notable_offers(events)
+                if fresh and callback:
+                    callback(fresh)
+            self._metrics.cycle_finished(loop.time() - started, events)
             cycles += 1
             if max_cycles is not None and cycles >= max_cycles:
                 break
+            due = loop.time() + interval_seconds
             await asyncio.sleep(interval_seconds)
 
-    def _normalize_offer(self, raw: Mapping[str, object]) -> FlightOffer:
-        return FlightOffer(
-            price=float(raw.get("price", 0.0)),
-            currency=str(raw.get("currency", "USD")),
-            departure_time=self._parse_datetime(raw.get("departure_time")),
-            arrival_time=self._parse_datetime(raw.get("arrival_time")),
-            airline=str(raw.get("airline", "")),
-            flight_number=str(raw.get("flight_number", "")),
-            booking_url=str(raw.get("booking_url", "")),
-            loyalty_cost=self._maybe_int(raw.get("loyalty_cost")),
-            loyalty_program=raw.get("loyalty_program"),
-        )
+    @staticmethod
+    def _fare_grid(
+        request: TripRequest, flex_days: int
+    ) -> tuple[List[date], List[date], List[tuple[date, date]]]:
+        if flex_days < 0:
+            raise ValueError("flex_days must not be negative")
+        offsets = [timedelta(days=delta) for delta in range(-flex_days, flex_days + 1)]
+        departures = [request.start_date + offset for offset in offsets]
+        returns = [request.end_date + offset for offset in offsets]
+        pairs = [(departure, back) for departure in departures for back in returns if back >= departure]
+        return departures, returns, pairs
 
     @staticmethod
-    def _parse_datetime(value: object) -> datetime:
-        if isinstance(value, datetime):
-            return value
-        if isinstance(value, str):
-            return datetime.fromisoformat(value)
-        raise ValueError(f"Unsupported datetime value: {value!r}")
+    def _shift(request: TripRequest, pair: tuple[date, date]) -> TripRequest:
+        return dataclasses.replace(request, start_date=pair[0], end_date=pair[1])
 
     @staticmethod
-    def _maybe_int(value: object) -> int | None:
-        if value is None:
-            return None
-        return int(value)
+    def _build_matrix(
+        departures: List[date],
+        returns: List[date],
+        results: Mapping[tuple[date, date], List[FlightOffer] | None],
+        top: int,
+    ) -> FareMatrix:
+        prices: List[List[float | None]] = [[None] * len(returns) for _ in departures]
+        cells: List[FareCell] = []
+        failed: List[tuple[date, date]] = []
+        for row, departure in enumerate(departures):
+            for column, back in enumerate(returns):
+                if (departure, back) not in results:
+                    continue
+                offers = results[(departure, back)]
+                if offers is None:
+                    failed.append((departure, back))
+                    continue
+                if not offers:
+                    continue
+                best = min(offers, key=lambda offer: offer.price)
+                prices[row][column] = best.price
+                cells.append(FareCell(departure_date=departure, return_date=back, price=best.price, offer=best))
+        cheapest = heapq.nsmallest(top, cells, key=lambda cell: (cell.price, cell.departure_date, cell.return_date))
+        return FareMatrix(
+            departure_dates=departures, return_dates=returns, prices=prices, cheapest=cheapest, failed=failed
+        )
+
+    @staticmethod
+    def _search_kwargs(request: TripRequest, preference: FlightPreference) -> dict[str, object]:
+        return {
+            "origin": request.origin,
+            "destination": request.destination,
+            "departure_date": request.start_date.isoformat(),
+            "return_date": request.end_date.isoformat(),
+            "travelers": request.travelers,
+            "cabin": preference.cabin,
+            "max_stops": preference.max_stops,
+            "loyalty_programs": preference.loyalty_programs,
+        }
+
+    def _offers(
+        self, results: Sequence[Mapping[str, object]], preference: FlightPreference, limit: int | None
+    ) -> List[FlightOffer]:
+        with self._metrics.normalize.time(), span("normalize_offers", count=len(results)):
+            return self._rank([self._normalize_offer(result) for result in results], preference, limit)
+
+    def _rank(
+        self, offers: List[FlightOffer], preference: FlightPreference, limit: int | None
+    ) -> List[FlightOffer]:
+        return rank_flights(offers, preference, weights=self._weights, limit=limit)
+
+    def _normalize_offer(self, raw: Mapping[str, object]) -> FlightOffer:
+        return FlightOffer.from_mapping(raw)
@@ -0,0 +1,188 @@
+"""Coordinates helpers and a grid index for proximity ranking."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections import defaultdict
+from typing import Callable, Dict, Generic, Iterable, List, Mapping, Sequence, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+KM_PER_DEGREE = 6371.0088 * math.pi / 180
+_AGGREGATES = ("mean", "max")
+POINTS_PER_CELL = 16
+
+
+def parse_coordinates(raw: Mapping[str, object]) -> Tuple[float | None, float | None]:
+    """Read ``latitude``/``longitude`` from *raw* or its Amadeus ``geoCode``."""
+
+    geo_code = raw.get("geoCode")
+    source = geo_code if raw.get("latitude") is None and isinstance(geo_code, Mapping) else raw
+    try:
+        latitude = float(source["latitude"])
+        longitude = float(source["longitude"])
+    except (KeyError, TypeError, ValueError):
+        return None, None
+    return latitude, longitude
+
+
+class GridIndex(Generic[_T]):
+    """Uniform grid over points projected onto a local plane.
+
+    Coordinates are projected with an equirectangular projection around
+    *reference_latitude* (the mean latitude of the points by default), which
+    is accurate to well under a percent at city scale. Each grid cell is
+    *cell_km* wide; by default the size is chosen so that a cell holds about
+    :data:`POINTS_PER_CELL` points.
+    """
+
+    def __init__(
+        self,
+        points: Iterable[Tuple[float, float, _T]],
+        *,
+        cell_km: float | None = None,
+        reference_latitude: float | None = None,
+    ) -> None:
+        if cell_km is not None and cell_km <= 0:
+            raise ValueError("cell_km must be positive")
+        entries = list(points)
+        if reference_latitude is None:
+            reference_latitude = sum(lat for lat, _, _ in entries) / len(entries) if entries else 0.0
+        self._x_scale = KM_PER_DEGREE * math.cos(math.radians(reference_latitude))
+        projected = [(*self.project(latitude, longitude), item) for latitude, longitude, item in entries]
+        self._cell = cell_km if cell_km is not None else _auto_cell_size(projected)
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, _T]]] = defaultdict(list)
+        for x, y, item in projected:
+            self._cells[(math.floor(x / self._cell), math.floor(y / self._cell))].append((x, y, item))
+        self._size = len(entries)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def project(self, latitude: float, longitude: float) -> Tuple[float, float]:
+        """Return planar ``(x, y)`` coordinates in kilometres."""
+
+        return longitude * self._x_scale, latitude * KM_PER_DEGREE
+
+    def within(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[float, _T]]:
+        """Return ``(distance_km, item)`` pairs within *radius_km*, nearest first."""
+
+        x, y = self.project(latitude, longitude)
+        reach = math.ceil(radius_km / self._cell)
+        cx, cy = math.floor(x / self._cell), math.floor(y / self._cell)
+        found: List[Tuple[float, int, _T]] = []
+        for gx in range(cx - reach, cx + reach + 1):
+            for gy in range(cy - reach, cy + reach + 1):
+                for px, py, item in self._cells.get((gx, gy), ()):
+                    distance = math.hypot(px - x, py - y)
+                    if distance <= radius_km:
+                        found.append((distance, len(found), item))
+        found.sort(key=lambda entry: (entry[0], entry[1]))
+        return [(distance, item) for distance, _, item in found]
+
+    def closest_to_all(
+        self,
+        targets: Sequence[Tuple[float, float]],
+        *,
+        k: int,
+        aggregate: str = "mean",
+    ) -> List[Tuple[float, _T]]:
+        """Return the *k* items with the smallest mean or max distance to *targets*.
+
+        Cells are visited in order of a lower bound on the aggregate distance
+        of any point inside them, and the search stops as soon as that bound
+        exceeds the *k*-th best exact score, so only points near the targets
+        are scored individually.
+        """
+
+        return self.closest_to_groups([targets], k=k, aggregate=aggregate)
+
+    def closest_to_groups(
+        self,
+        groups: Sequence[Sequence[Tuple[float, float]]],
+        *,
+        k: int,
+        aggregate: str = "mean",
+    ) -> List[Tuple[float, _T]]:
+        """Like :meth:`closest_to_all`, scoring each item by the mean over *groups*
+        of its mean or max distance to the targets in that group.
+
+        Empty groups are ignored.
+        """
+
+        if aggregate not in _AGGREGATES:
+            raise ValueError(f"aggregate must be one of {_AGGREGATES}")
+        projected_groups = [
+            [self.project(latitude, longitude) for latitude, longitude in group] for group in groups if group
+        ]
+        if k <= 0 or not projected_groups or not self._size:
+            return []
+        combiners = [_combiner(aggregate, len(projected)) for projected in projected_groups]
+        # Cheap lower bounds per group: the mean distance to the targets is at
+        # least the distance to their centroid, and the max distance is at
+        # least the distance to any single target, in particular the extreme
+        # ones. The mean of the group bounds bounds the overall score.
+        if aggregate == "mean":
+            anchor_groups = [
+                [(sum(x for x, _ in projected) / len(projected), sum(y for _, y in projected) / len(projected))]
+                for projected in projected_groups
+            ]
+        else:
+            anchor_groups = [
+                list({min(projected), max(projected), min(projected, key=_y), max(projected, key=_y)})
+                for projected in projected_groups
+            ]
+
+        bounds = []
+        for (gx, gy), members in self._cells.items():
+            low_x, low_y = gx * self._cell, gy * self._cell
+            high_x, high_y = low_x + self._cell, low_y + self._cell
+            bound = sum(
+                max(
+                    math.hypot(max(low_x - ax, 0.0, ax - high_x), max(low_y - ay, 0.0, ay - high_y))
+                    for ax, ay in anchors
+                )
+                for anchors in anchor_groups
+            ) / len(anchor_groups)
+            bounds.append((bound, gx, gy, members))
+        heapq.heapify(bounds)
+
+        best: List[Tuple[float, int, _T]] = []  # max-heap of (-score, -order, item)
+        order = 0
+        while bounds:
+            bound, _, _, members = heapq.heappop(bounds)
+            if len(best) >= k and bound > -best[0][0]:
+                break
+            for px, py, item in members:
+                score = sum(
+                    combine(math.hypot(px - tx, py - ty) for tx, ty in projected)
+                    for combine, projected in zip(combiners, projected_groups)
+                ) / len(projected_groups)
+                entry = (-score, -order, item)
+                order += 1
+                if len(best) < k:
+                    heapq.heappush(best, entry)
+                elif entry[:2] > best[0][:2]:
+                    heapq.heapreplace(best, entry)
+        ranked = sorted(best, key=lambda entry: (-entry[0], -entry[1]))
+        return [(-score, item) for score, _, item in ranked]
+
+
+def _y(point: Tuple[float, float]) -> float:
+    return point[1]
+
+
+def _combiner(aggregate: str, count: int) -> Callable[[Iterable[float]], float]:
+    if aggregate == "max":
+        return max
+    return lambda distances: sum(distances) / count
+
+
+def _auto_cell_size(points: Sequence[Tuple[float, float, object]]) -> float:
+    if len(points) <= POINTS_PER_CELL:
+        return 1.0
+    width = max(x for x, _, _ in points) - min(x for x, _, _ in points)
+    height = max(y for _, y, _ in points) - min(y for _, y, _ in points)
+    area = max(width, 0.01) * max(height, 0.01)
+    return max(math.sqrt(area * POINTS_PER_CELL / len(points)), 0.01)
@@ -3,30 +3,186 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import date
-from typing import Callable, List, Mapping, Sequence
+import contextlib
+import copy
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Iterator, List, Mapping, Sequence
 
-from models import HotelOffer, HotelPreference, TripRequest
-from search import HotelSearchProvider
+from changes import OfferChangeDetector, OfferEvent, notable_offers
+from geo import GridIndex
+from metrics import MetricsRegistry, MonitorMetrics
+from models import HotelOffer, HotelPreference, Itinerary, TripRequest
+from ranking import RankingWeights, rank_hotels
+from search import (
+    AsyncHotelSearchProvider,
+    HotelSearchProvider,
+    StreamingHotelSearchProvider,
+    as_async_provider,
+)
+from tracing import span
 
 
 class HotelMonitor:
-    """Search and monitor hotels for a planned itinerary."""
+    """Search and monitor hotels for a planned itinerary.
 
-    def __init__(self, provider: HotelSearchProvider) -> None:
+    See :class:`FlightMonitor` for the meaning of *executor*,
+    *max_concurrency*, *weights* and *metrics*.
+    """
+
+    def __init__(
+        self,
+        provider: HotelSearchProvider | AsyncHotelSearchProvider,
+        *,
+        executor: Executor | None = None,
+        max_concurrency: int | None = None,
+        weights: RankingWeights | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._owns_executor = (
+            executor is None and max_concurrency is not None and isinstance(provider, HotelSearchProvider)
+        )
+        if self._owns_executor:
+            executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="hotel-monitor")
         self._provider = provider
+        self._async_provider = as_async_provider(provider, executor=executor)
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        # asyncio primitives bind to the loop they are first used on, so keep one semaphore per loop.
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._weights = weights
+        self._metrics = MonitorMetrics(metrics, "hotels")
+
+    @property
+    def provider(self) -> HotelSearchProvider | AsyncHotelSearchProvider:
+        return self._provider
+
+    def with_provider(self, provider: HotelSearchProvider | AsyncHotelSearchProvider) -> "HotelMonitor":
+        """Return a copy of this monitor that searches *provider* with the same settings."""
+
+        clone = copy.copy(self)
+        clone._provider = provider
+        clone._async_provider = as_async_provider(provider, executor=self._executor)
+        # The copy borrows this monitor's thread pool; only the original shuts it down.
+        clone._owns_executor = False
+        return clone
+
+    def close(self) -> None:
+        """Shut down the thread pool this monitor created for *max_concurrency*.
+
+        Executors passed in by the caller are left running, as are copies
+        made by :meth:`with_provider`, which share this monitor's pool.
+        """
+
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "HotelMonitor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _limit(self) -> contextlib.AbstractAsyncContextManager[object]:
+        if self._max_concurrency is None:
+            return contextlib.nullcontext()
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+        return semaphore
+
+    def find_best_hotels(
+        self, request: TripRequest, preference: HotelPreference, *, limit: int | None = None
+    ) -> List[HotelOffer]:
+        """Return hotels within ``min_rating``/``max_price_per_night``, best first."""
+
+        if not isinstance(self._provider, HotelSearchProvider):
+            raise TypeError("find_best_hotels requires a synchronous HotelSearchProvider")
+        with span("provider.search_hotels", provider=type(self._provider).__name__):
+            results = self._provider.search_hotels(**self._search_kwargs(request, preference))
+        return self._offers(results, preference, limit)
+
+    def iter_best_hotels(self, request: TripRequest, preference: HotelPreference) -> Iterator[HotelOffer]:
+        """Yield offers lazily; see :meth:`FlightMonitor.iter_best_flights`."""
+
+        if isinstance(self._provider, StreamingHotelSearchProvider):
+            yield from self._provider.iter_hotel_offers(**self._search_kwargs(request, preference))
+            return
+        if not isinstance(self._provider, HotelSearchProvider):
+            raise TypeError("iter_best_hotels requires a synchronous HotelSearchProvider")
+        for result in self._provider.search_hotels(**self._search_kwargs(request, preference)):
+            yield self._normalize_offer(result)
 
-    def find_best_hotels(self, request: TripRequest, preference: HotelPreference) -> List[HotelOffer]:
-        results = self._provider.search_hotels(
-            destination=request.destination,
-            check_in=request.start_date.isoformat(),
-            check_out=request.end_date.isoformat(),
-            travelers=request.travelers,
-            neighborhoods=preference.neighborhoods,
-            amenities=preference.amenities,
-            loyalty_programs=preference.loyalty_programs,
+    async def find_best_hotels_async(
+        self, request: TripRequest, preference: HotelPreference, *, limit: int | None = None
+    ) -> List[HotelOffer]:
+        async with self._limit():
+            with span("provider.search_hotels", provider=type(self._async_provider).__name__):
+                results = await self._async_provider.search_hotels(**self._search_kwargs(request, preference))
+        return self._offers(results, preference, limit)
+
+    def find_hotels_near(
+        self,
+        request: TripRequest,
+        preference: HotelPreference,
+        itinerary: Itinerary,
+        *,
+        aggregate: str = "mean",
+        limit: int = 20,
+    ) -> List[HotelOffer]:
+        """Return hotels matching *preference* closest to the itinerary's activities."""
+
+        return self.rank_by_distance(
+            self.find_best_hotels(request, preference), itinerary, aggregate=aggregate, limit=limit
         )
-        return [self._normalize_offer(result) for result in results]
+
+    @staticmethod
+    def rank_by_distance(
+        offers: Sequence[HotelOffer],
+        itinerary: Itinerary,
+        *,
+        aggregate: str = "mean",
+        limit: int = 20,
+        cell_km: float | None = None,
+    ) -> List[HotelOffer]:
+        """Order *offers* by distance to the activities planned in *itinerary*.
+
+        Each day is scored separately: *aggregate* selects whether a hotel's
+        score for a day is its ``"mean"`` or ``"max"`` distance to that day's
+        activities with known coordinates, and hotels are ranked by the mean
+        of their day scores, so a day packed with activities does not
+        outweigh the others. Hotels are looked up through a
+        :class:`~geo.GridIndex` with cells *cell_km* wide (sized
+        automatically by default), so only those near the activities are
+        scored exactly. Hotels without coordinates are left out; if no
+        activity has coordinates the first *limit* offers are returned
+        unchanged.
+        """
+
+        days = [
+            [
+                (activity.latitude, activity.longitude)
+                for activity in day.activities
+                if activity.latitude is not None and activity.longitude is not None
+            ]
+            for day in itinerary.days
+        ]
+        if not any(days):
+            return list(offers[:limit])
+        index = GridIndex(
+            (
+                (offer.latitude, offer.longitude, offer)
+                for offer in offers
+                if offer.latitude is not None and offer.longitude is not None
+            ),
+            cell_km=cell_km,
+        )
+        return [offer for _, offer in index.closest_to_groups(days, k=limit, aggregate=aggregate)]
 
     async def monitor(
         self,
@@ -36,55 +192,56 @@ class HotelMonitor:
         interval_seconds: int = 3600,
         callback: Callable[[Sequence[HotelOffer]], None] | None = None,
         max_cycles: int | None = None,
+        on_event: Callable[[Sequence[OfferEvent[HotelOffer]]], None] | None = None,
+        detector: OfferChangeDetector[HotelOffer] | None = None,
     ) -> None:
         if not preference.alerts and max_cycles is None:
             return
 
         cycles = 0
-        seen: set[str] = set()
+        loop = asyncio.get_running_loop()
+        due = loop.time()
+        detector = detector if detector is not None else OfferChangeDetector.for_hotels()
         while preference.alerts or (max_cycles is not None and cycles < max_cycles):
-            offers = self.find_best_hotels(request, preference)
-            fresh = [offer for offer in offers if offer.booking_url not in seen]
-            for offer in fresh:
-                seen.add(offer.booking_url)
-            if fresh and callback:
-                callback(tuple(fresh))
+            started = loop.time()
+            self._metrics.lag.set(max(0.0, started - due))
+            with span("monitor.cycle", kind="hotels", cycle=cycles + 1):
+                offers = await self.find_best_hotels_async(request, preference)
+                events = detector.diff(offers)
+                if events and on_event:
+                    on_event(tuple(events))
+                fresh = notable_offers(events)
+                if fresh and callback:
+                    callback(fresh)
+            self._metrics.cycle_finished(loop.time() - started, events)
             cycles += 1
             if max_cycles is not None and cycles >= max_cycles:
                 break
+            due = loop.time() + interval_seconds
             await asyncio.sleep(interval_seconds)
 
-    def _normalize_offer(self, raw: Mapping[str, object]) -> HotelOffer:
-        return HotelOffer(
-            name=str(raw.get("name", "")),
-            price_per_night=float(raw.get("price_per_night", 0.0)),
-            currency=str(raw.get("currency", "USD")),
-            check_in=self._parse_date(raw.get("check_in")),
-            check_out=self._parse_date(raw.get("check_out")),
-            rating=self._maybe_float(raw.get("rating")),
-            location=raw.get("location"),
-            booking_url=str(raw.get("booking_url", "")),
-            loyalty_cost=self._maybe_int(raw.get("loyalty_cost")),
-            loyalty_program=raw.get("loyalty_program"),
-            notes=tuple(raw.get("notes", ()) or ()),
-        )
-
     @staticmethod
-    def _parse_date(value: object) -> date:
-        if isinstance(value, date):
-            return value
-        if isinstance(value, str):
-            return date.fromisoformat(value)
-        raise ValueError(f"Unsupported date value: {value!r}")
+    def _search_kwargs(request: TripRequest, preference: HotelPreference) -> dict[str, object]:
+        return {
+            "destination": request.destination,
+            "check_in": request.start_date.isoformat(),
+            "check_out": request.end_date.isoformat(),
+            "travelers": request.travelers,
+            "neighborhoods": preference.neighborhoods,
+            "amenities": preference.amenities,
+            "loyalty_programs": preference.loyalty_programs,
+        }
 
-    @staticmethod
-    def _maybe_float(value: object) -> float | None:
-        if value is None:
-            return None
-        return float(value)
+    def _offers(
+        self, results: Sequence[Mapping[str, object]], preference: HotelPreference, limit: int | None
+    ) -> List[HotelOffer]:
+        with self._metrics.normalize.time(), span("normalize_offers", count=len(results)):
+            return self._rank([self._normalize_offer(result) for result in results], preference, limit)
 
-    @staticmethod
-    def _maybe_int(value: object) -> int | None:
-        if value is None:
-            return None
-        return int(value)
+    def _rank(
+        self, offers: List[HotelOffer], preference: HotelPreference, limit: int | None
+    ) -> List[HotelOffer]:
+        return rank_hotels(offers, preference, weights=self._weights, limit=limit)
+
+    def _normalize_offer(self, raw: Mapping[str, object]) -> HotelOffer:
+        return HotelOffer.from_mapping(raw)
@@ -2,19 +2,77 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import List, Sequence
+import asyncio
+import contextvars
+import copy
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from datetime import datetime, time as time_of_day
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
 
+from dedup import deduplicate_activities
+from geo import parse_coordinates
 from models import Activity, Itinerary, ItineraryDay, TripRequest
-from search import SearchProvider
+from search import AsyncSearchProvider, SearchProvider, as_async_provider
+from timetable import DayScheduler
+from tracing import span
+
+
+_LOCALE_FILTERS = {"locale": "zh-CN"}
 
 
 class ItineraryPlanner:
-    """Plan itineraries with the help of a search provider."""
+    """Plan itineraries with the help of a search provider.
+
+    One search is issued per interest. Up to *max_concurrency* searches run
+    at once (on *executor*, or on a short-lived thread pool for synchronous
+    providers), and a search still running *query_timeout* seconds after it
+    started is abandoned. Results are merged in interest order whatever the
+    completion order; failed or timed-out searches are reported in
+    :attr:`Itinerary.notes` instead of failing the plan. The same attraction
+    returned by several queries is kept once (see
+    :class:`~dedup.ActivityDeduplicator`). Activities are laid
+    out over the trip days by *day_scheduler* (a default
+    :class:`~timetable.DayScheduler` when omitted).
+    """
 
-    def __init__(self, search_provider: SearchProvider) -> None:
+    def __init__(
+        self,
+        search_provider: SearchProvider | AsyncSearchProvider,
+        *,
+        executor: Executor | None = None,
+        max_concurrency: int = 8,
+        query_timeout: float | None = None,
+        day_scheduler: DayScheduler | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self._search = search_provider
+        self._async_search = as_async_provider(search_provider, executor=executor)
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        self._query_timeout = query_timeout
+        self._day_scheduler = day_scheduler or DayScheduler()
+
+    @property
+    def provider(self) -> SearchProvider | AsyncSearchProvider:
+        return self._search
+
+    def with_provider(
+        self, provider: SearchProvider | AsyncSearchProvider, *, executor: Executor | None = None
+    ) -> "ItineraryPlanner":
+        """Return a copy of this planner that searches *provider* with the same settings.
+
+        When *executor* is given the copy runs its searches there instead of
+        on this planner's executor.
+        """
+
+        clone = copy.copy(self)
+        if executor is not None:
+            clone._executor = executor
+        clone._search = provider
+        clone._async_search = as_async_provider(provider, executor=clone._executor)
+        return clone
 
     def plan_trip(self, request: TripRequest) -> Itinerary:
         """Create an itinerary leveraging live search results.
@@ -26,51 +84,142 @@ class ItineraryPlanner:
         agents).
         """
 
-        suggestions = self._gather_suggestions(request)
-        days = self._build_days(request, suggestions)
+        if not isinstance(self._search, SearchProvider):
+            raise TypeError("plan_trip requires a synchronous SearchProvider")
+        suggestions, failures = self._gather_suggestions(request)
+        return self._assemble(request, suggestions, failures)
+
+    async def plan_trip_async(self, request: TripRequest) -> Itinerary:
+        """Coroutine variant of :meth:`plan_trip` issuing all searches concurrently."""
+
+        suggestions, failures = await self._gather_suggestions_async(request)
+        return self._assemble(request, suggestions, failures)
+
+    def _assemble(
+        self, request: TripRequest, suggestions: Sequence[Activity], failures: Sequence[str] = ()
+    ) -> Itinerary:
+        days, unscheduled = self._build_days(request, deduplicate_activities(suggestions))
         notes = [
             "Generated with live search results; verify availability before booking.",
             "Consider adjusting based on traveler preferences and local events.",
         ]
+        notes.extend(failures)
+        if unscheduled:
+            notes.append(f"{len(unscheduled)} suggested activities did not fit into the daily schedule.")
         return Itinerary(request=request, days=days, notes=notes)
 
-    def _gather_suggestions(self, request: TripRequest) -> Sequence[Activity]:
-        queries = [
+    def _gather_suggestions(self, request: TripRequest) -> Tuple[Sequence[Activity], List[str]]:
+        queries = self._queries(request)
+        outcomes: Dict[int, Sequence[Mapping[str, object]] | BaseException] = {}
+        started: Dict[int, float] = {}
+
+        def run(position: int, query: str) -> Sequence[Mapping[str, object]]:
+            started[position] = time.monotonic()
+            with span("provider.search", query=query):
+                return self._search.search(query, filters=dict(_LOCALE_FILTERS))
+
+        executor = self._executor
+        owned = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=min(self._max_concurrency, len(queries)), thread_name_prefix="itinerary-planner"
+            )
+        try:
+            pending: Dict[Future[Sequence[Mapping[str, object]]], int] = {
+                # Each search runs in a copy of the caller's context so that its span nests under the plan.
+                executor.submit(contextvars.copy_context().run, run, position, query): position
+                for position, query in enumerate(queries)
+            }
+            while pending:
+                timeout = self._next_timeout(pending.values(), started)
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    position = pending.pop(future)
+                    error = future.exception()
+                    outcomes[position] = error if error is not None else future.result()
+                if self._query_timeout is None:
+                    continue
+                now = time.monotonic()
+                for future, position in list(pending.items()):
+                    if position in started and now - started[position] >= self._query_timeout:
+                        del pending[future]
+                        outcomes[position] = TimeoutError(f"no response within {self._query_timeout:g}s")
+        finally:
+            if owned:
+                # Do not wait for abandoned searches; their threads finish in the background.
+                executor.shutdown(wait=False, cancel_futures=True)
+        return self._merge(queries, outcomes)
+
+    async def _gather_suggestions_async(self, request: TripRequest) -> Tuple[Sequence[Activity], List[str]]:
+        queries = self._queries(request)
+        limit = asyncio.Semaphore(self._max_concurrency)
+
+        async def run(query: str) -> Sequence[Mapping[str, object]]:
+            async with limit:
+                search = self._async_search.search(query, filters=dict(_LOCALE_FILTERS))
+                with span("provider.search", query=query):
+                    if self._query_timeout is None:
+                        return await search
+                    try:
+                        return await asyncio.wait_for(search, self._query_timeout)
+                    except asyncio.TimeoutError:
+                        raise TimeoutError(f"no response within {self._query_timeout:g}s") from None
+
+        batches = await asyncio.gather(*(run(query) for query in queries), return_exceptions=True)
+        return self._merge(queries, dict(enumerate(batches)))
+
+    def _next_timeout(self, positions: Iterable[int], started: Mapping[int, float]) -> float | None:
+        """Seconds until the earliest running search exceeds its timeout."""
+
+        if self._query_timeout is None:
+            return None
+        running = [started[position] for position in positions if position in started]
+        if not running:
+            # Nothing has started yet; poll again shortly.
+            return min(self._query_timeout, 0.05)
+        return max(0.0, min(running) + self._query_timeout - time.monotonic())
+
+    def _merge(
+        self,
+        queries: Sequence[str],
+        outcomes: Mapping[int, Sequence[Mapping[str, object]] | BaseException],
+    ) -> Tuple[List[Activity], List[str]]:
+        suggestions: List[Activity] = []
+        failures: List[str] = []
+        for position, query in enumerate(queries):
+            outcome = outcomes.get(position)
+            if isinstance(outcome, BaseException):
+                failures.append(f"Search for '{query}' failed: {str(outcome) or type(outcome).__name__}")
+                continue
+            suggestions.extend(self._to_activity(result) for result in outcome or ())
+        return suggestions, failures
+
+    @staticmethod
+    def _queries(request: TripRequest) -> List[str]:
+        return [
             f"{request.destination_label} {interest}" for interest in (request.interests or ("top sights",))
         ]
-        suggestions: List[Activity] = []
-        for query in queries:
-            results = self._search.search(query, filters={"locale": "zh-CN"})
-            for result in results:
-                suggestions.append(
-                    Activity(
-                        name=result.get("title", ""),
-                        description=result.get("snippet", ""),
-                        location=result.get("location"),
-                        start_time=self._parse_datetime(result.get("start_time")),
-                        end_time=self._parse_datetime(result.get("end_time")),
-                        booking_url=result.get("url"),
-                    )
-                )
-        return suggestions
-
-    def _build_days(self, request: TripRequest, activities: Sequence[Activity]) -> List[ItineraryDay]:
-        grouped: dict[str, List[Activity]] = defaultdict(list)
-        current_date = request.start_date
-        for activity in activities:
-            key = activity.start_time.date().isoformat() if activity.start_time else current_date.isoformat()
-            grouped[key].append(activity)
-            current_date += timedelta(days=1)
-            if current_date > request.end_date:
-                current_date = request.start_date
-
-        days: List[ItineraryDay] = []
-        day_cursor = request.start_date
-        while day_cursor <= request.end_date:
-            day_key = day_cursor.isoformat()
-            days.append(ItineraryDay(date=day_cursor, activities=grouped.get(day_key, [])))
-            day_cursor += timedelta(days=1)
-        return days
+
+    def _to_activity(self, result: Mapping[str, object]) -> Activity:
+        latitude, longitude = parse_coordinates(result)
+        return Activity(
+            name=result.get("title", ""),
+            description=result.get("snippet", ""),
+            location=result.get("location"),
+            start_time=self._parse_datetime(result.get("start_time")),
+            end_time=self._parse_datetime(result.get("end_time")),
+            booking_url=result.get("url"),
+            latitude=latitude,
+            longitude=longitude,
+            opens_at=self._parse_time(result.get("opens_at")),
+            closes_at=self._parse_time(result.get("closes_at")),
+        )
+
+    def _build_days(
+        self, request: TripRequest, activities: Sequence[Activity]
+    ) -> Tuple[List[ItineraryDay], List[Activity]]:
+        with span("build_days", activities=len(activities)):
+            return self._day_scheduler.schedule(request.start_date, request.end_date, activities)
 
     @staticmethod
     def _parse_datetime(value: object) -> datetime | None:
@@ -84,3 +233,14 @@ class ItineraryPlanner:
             except ValueError:
                 return None
         return None
+
+    @staticmethod
+    def _parse_time(value: object) -> time_of_day | None:
+        if isinstance(value, time_of_day):
+            return value
+        if isinstance(value, str) and value:
+            try:
+                return time_of_day.fromisoformat(value)
+            except ValueError:
+                return None
+        return None
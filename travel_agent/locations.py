@@ -0,0 +1,217 @@
+"""Local prefix index over airport and city reference data."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import unicodedata
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Hashable, Iterable, List, Mapping, Sequence, Set, Tuple
+
+# Filters the index can answer locally; anything else goes upstream.
+LOCAL_FILTERS = frozenset({"countryCode"})
+
+
+def normalize_keyword(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).casefold().strip()
+
+
+class LocationIndex:
+    """Prefix index answering location autocomplete queries locally.
+
+    Locations are indexed under their IATA code, name, detailed name, city
+    name and every word of their name in one sorted array, so a prefix query
+    is a binary search followed by a scan of the matching run.
+
+    The index only answers a query when it knows the answer is complete: a
+    keyword is *covered* once an upstream response for it, or for one of its
+    prefixes, returned every match. Any keyword extending a covered prefix can
+    only match a subset of those locations. :meth:`load` can mark a bulk seed
+    file as complete, which covers every keyword.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: List[Mapping[str, object]] = []
+        self._ids: Dict[Hashable, int] = {}
+        self._keys: List[Tuple[str, int]] = []
+        self._pending: List[Tuple[str, int]] = []
+        self._covered: Set[Tuple[str, str | None]] = set()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike[str], *, complete: bool = True) -> "LocationIndex":
+        index = cls()
+        index.load(path, complete=complete)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def load(self, path: str | os.PathLike[str], *, complete: bool = True) -> None:
+        """Add locations from a JSON or JSON Lines seed file.
+
+        The file holds either a list of Amadeus location objects, an object
+        with such a list under ``data``, or one location object per line.
+        With *complete*, the file is trusted to contain every location and
+        all queries are answered locally from then on.
+        """
+
+        text = Path(path).read_text(encoding="utf-8")
+        stripped = text.lstrip()
+        if stripped.startswith("["):
+            items = json.loads(text)
+        elif stripped.startswith("{") and Path(path).suffix != ".jsonl":
+            payload = json.loads(text)
+            items = payload.get("data", []) if isinstance(payload, Mapping) else []
+        else:
+            items = [json.loads(line) for line in text.splitlines() if line.strip()]
+        self.add(item for item in items if isinstance(item, Mapping))
+        if complete:
+            with self._lock:
+                self._covered.add(("", None))
+
+    def add(self, locations: Iterable[Mapping[str, object]]) -> None:
+        """Index *locations*, replacing earlier copies of the same location."""
+
+        with self._lock:
+            for location in locations:
+                identity = _identity(location)
+                position = self._ids.get(identity)
+                keys = _index_keys(location)
+                if position is not None:
+                    # Keys of the replaced copy stay indexed; only words new to this copy are added.
+                    keys -= _index_keys(self._records[position])
+                    self._records[position] = location
+                else:
+                    position = len(self._records)
+                    self._records.append(location)
+                    self._ids[identity] = position
+                self._pending.extend((key, position) for key in keys)
+
+    def record(
+        self,
+        keyword: str,
+        filters: Mapping[str, object] | None,
+        locations: Sequence[Mapping[str, object]],
+        *,
+        complete: bool,
+    ) -> None:
+        """Learn from an upstream response for *keyword*.
+
+        *complete* tells whether the response contained every match, in
+        which case the keyword becomes covered for the given filters.
+        """
+
+        self.add(locations)
+        if complete and _answerable(filters):
+            with self._lock:
+                self._covered.add((normalize_keyword(keyword), _country(filters)))
+
+    def lookup(
+        self, keyword: str, filters: Mapping[str, object] | None = None
+    ) -> Sequence[Mapping[str, object]] | None:
+        """Return the matches for *keyword*, or ``None`` if upstream must be asked."""
+
+        prefix = normalize_keyword(keyword)
+        country = _country(filters)
+        with self._lock:
+            if not _answerable(filters) or not self._is_covered(prefix, country):
+                self.misses += 1
+                return None
+            self.hits += 1
+            if self._pending:
+                self._keys.extend(self._pending)
+                self._pending.clear()
+                self._keys.sort()
+            keys = self._keys
+            seen: Set[int] = set()
+            matches: List[Mapping[str, object]] = []
+            for index in range(bisect_left(keys, (prefix, -1)), len(keys)):
+                key, position = keys[index]
+                if not key.startswith(prefix):
+                    break
+                if position in seen:
+                    continue
+                seen.add(position)
+                location = self._records[position]
+                if country is None or _location_country(location) == country:
+                    matches.append(location)
+        code = prefix.upper()
+        # Exact IATA code matches first, then cities before airports, then by name.
+        matches.sort(
+            key=lambda location: (
+                location.get("iataCode") != code,
+                location.get("subType") != "CITY",
+                str(location.get("name", "")),
+            )
+        )
+        return tuple(matches)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._ids.clear()
+            self._keys.clear()
+            self._pending.clear()
+            self._covered.clear()
+
+    def _is_covered(self, prefix: str, country: str | None) -> bool:
+        for end in range(len(prefix) + 1):
+            head = prefix[:end]
+            if (head, None) in self._covered or (country is not None and (head, country) in self._covered):
+                return True
+        return False
+
+
+def response_is_complete(response: Mapping[str, object], returned: int) -> bool:
+    """Whether an Amadeus list response holds every match rather than a page."""
+
+    meta = response.get("meta")
+    if not isinstance(meta, Mapping):
+        return True
+    links = meta.get("links")
+    if isinstance(links, Mapping) and links.get("next"):
+        return False
+    count = meta.get("count")
+    return not isinstance(count, int) or count <= returned
+
+
+def _answerable(filters: Mapping[str, object] | None) -> bool:
+    return not filters or all(key in LOCAL_FILTERS or value in (None, "") for key, value in filters.items())
+
+
+def _country(filters: Mapping[str, object] | None) -> str | None:
+    value = (filters or {}).get("countryCode")
+    return str(value).upper() if value else None
+
+
+def _location_country(location: Mapping[str, object]) -> str | None:
+    address = location.get("address")
+    if isinstance(address, Mapping) and address.get("countryCode"):
+        return str(address["countryCode"]).upper()
+    return None
+
+
+def _identity(location: Mapping[str, object]) -> Hashable:
+    if location.get("id"):
+        return ("id", str(location["id"]))
+    return ("location", location.get("subType"), location.get("iataCode"), location.get("name"))
+
+
+def _index_keys(location: Mapping[str, object]) -> Set[str]:
+    names = [location.get("iataCode"), location.get("name"), location.get("detailedName")]
+    address = location.get("address")
+    if isinstance(address, Mapping):
+        names.append(address.get("cityName"))
+    keys: Set[str] = set()
+    for name in names:
+        if not name:
+            continue
+        text = normalize_keyword(str(name))
+        keys.add(text)
+        keys.update(word for word in text.replace(",", " ").replace("/", " ").split() if word)
+    return keys
@@ -0,0 +1,341 @@
+"""In-process metrics with Prometheus text exposition.
+
+Components take a ``metrics`` argument and fall back to the module level
+:data:`REGISTRY`, so a single scrape endpoint sees the HTTP client, token
+manager, caches and monitors together::
+
+    server = serve_metrics(port=9464)   # GET http://127.0.0.1:9464/metrics
+
+Anything exposing ``counter``, ``gauge`` and ``histogram`` with the same
+signatures as :class:`MetricsRegistry` can be passed instead, e.g. an adapter
+forwarding to another metrics backend.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, Generic, Iterable, Iterator, List, Sequence, Tuple, Type, TypeVar
+
+if TYPE_CHECKING:
+    # Only the optional scrape endpoint needs http.server, which is slow to import.
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds, from a local cache hit up to a slow upstream call with retries.
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTE_BUCKETS: Tuple[float, ...] = tuple(float(1024 * 4 ** power) for power in range(8))
+
+_Child = TypeVar("_Child")
+
+
+class CounterValue:
+    """A monotonically increasing value."""
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def _samples(self, name: str) -> Iterator[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        yield name, (), self._value
+
+
+class GaugeValue:
+    """A value that can go up and down."""
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def _samples(self, name: str) -> Iterator[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        yield name, (), self._value
+
+
+class HistogramValue:
+    """Counts observations into cumulative buckets."""
+
+    __slots__ = ("_lock", "_bounds", "_counts", "_sum", "_count")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self._lock = threading.Lock()
+        self._bounds = tuple(bounds)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+        self._count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    @contextlib.contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall-clock duration of the ``with`` block."""
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def _samples(self, name: str) -> Iterator[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self._sum, self._count
+        cumulative = 0
+        for bound, bucket in zip(self._bounds + (math.inf,), counts):
+            cumulative += bucket
+            yield f"{name}_bucket", (("le", _format_value(bound)),), cumulative
+        yield f"{name}_sum", (), total
+        yield f"{name}_count", (), count
+
+
+class MetricFamily(Generic[_Child]):
+    """A named metric with one child value per combination of label values.
+
+    Families without label names have a single child, ``family.labels()``.
+    """
+
+    def __init__(
+        self, kind: str, name: str, documentation: str, labelnames: Sequence[str], factory: Type[_Child], *args: object
+    ) -> None:
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._args = args
+        self._children: Dict[Tuple[str, ...], _Child] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: object, **named: object) -> _Child:
+        if named:
+            values = tuple(named[label] for label in self.labelnames)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._factory(*self._args))
+        return child
+
+    def render(self) -> List[str]:
+        with self._lock:
+            children = list(self._children.items())
+        lines = [f"# HELP {self.name} {_escape_help(self.documentation)}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(children):
+            base = tuple(zip(self.labelnames, values))
+            for sample, extra, value in child._samples(self.name):  # type: ignore[attr-defined]
+                labels = base + extra
+                rendered = "{" + ",".join(f'{key}="{_escape_label(item)}"' for key, item in labels) + "}" if labels else ""
+                lines.append(f"{sample}{rendered} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Thread-safe collection of counters, gauges and histograms.
+
+    Asking for an existing name returns the metric registered earlier, so
+    several clients or caches can share one registry and their series add
+    up under distinct label values.
+    """
+
+    def __init__(self) -> None:
+        self._families: Dict[str, MetricFamily[object]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> MetricFamily[CounterValue]:
+        return self._register("counter", name, documentation, labelnames, CounterValue)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> MetricFamily[GaugeValue]:
+        return self._register("gauge", name, documentation, labelnames, GaugeValue)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> MetricFamily[HistogramValue]:
+        bounds = tuple(sorted(float(bound) for bound in buckets if not math.isinf(bound)))
+        return self._register("histogram", name, documentation, labelnames, HistogramValue, bounds)
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+
+        with self._lock:
+            families = [self._families[name] for name in sorted(self._families)]
+        lines: List[str] = []
+        for family in families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._families.clear()
+
+    def _register(
+        self, kind: str, name: str, documentation: str, labelnames: Sequence[str], factory: type, *args: object
+    ) -> MetricFamily:  # type: ignore[type-arg]
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = MetricFamily(kind, name, documentation, labelnames, factory, *args)
+                self._families[name] = family
+            elif family.kind != kind or family.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered as a {family.kind} with {family.labelnames}")
+            return family
+
+
+REGISTRY = MetricsRegistry()
+"""Registry used by components that are not given one explicitly."""
+
+
+class MonitorMetrics:
+    """Metrics recorded by :class:`~flights.FlightMonitor` and
+    :class:`~hotels.HotelMonitor`, labelled with the monitor *kind*."""
+
+    def __init__(self, registry: MetricsRegistry | None, kind: str) -> None:
+        source = registry if registry is not None else REGISTRY
+        self.cycles = source.counter("monitor_cycles_total", "Completed monitor polling cycles.", ("kind",)).labels(kind)
+        self.cycle_duration = source.histogram(
+            "monitor_cycle_duration_seconds", "Duration of one monitor polling cycle.", ("kind",)
+        ).labels(kind)
+        self.lag = source.gauge(
+            "monitor_lag_seconds", "How late the latest monitor cycle started after it was due.", ("kind",)
+        ).labels(kind)
+        self.events = source.counter(
+            "monitor_events_total", "Offer changes reported by monitors.", ("kind", "event")
+        )
+        self.normalize = source.histogram(
+            "offer_normalize_duration_seconds", "Time spent turning provider results into ranked offers.", ("kind",)
+        ).labels(kind)
+        self._kind = kind
+
+    def cycle_finished(self, duration: float, events: Iterable[object]) -> None:
+        self.cycles.inc()
+        self.cycle_duration.observe(duration)
+        for event in events:
+            kind = getattr(event, "kind", None)
+            self.events.labels(self._kind, getattr(kind, "value", kind)).inc()
+
+
+def make_metrics_handler(registry: MetricsRegistry | None = None) -> type[BaseHTTPRequestHandler]:
+    """Return a request handler class serving *registry* on ``GET /metrics``."""
+
+    from http.server import BaseHTTPRequestHandler
+
+    source = registry if registry is not None else REGISTRY
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = source.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - scrapes are not worth logging
+            return
+
+    return MetricsHandler
+
+
+def serve_metrics(
+    registry: MetricsRegistry | None = None, *, host: str = "127.0.0.1", port: int = 9464
+) -> ThreadingHTTPServer:
+    """Serve *registry* over HTTP from a daemon thread.
+
+    Pass ``port=0`` to pick a free port (see ``server.server_address``) and
+    call ``server.shutdown()`` to stop.
+    """
+
+    from http.server import ThreadingHTTPServer
+
+    server = ThreadingHTTPServer((host, port), make_metrics_handler(registry))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    return server
+
+
+def error_class(exc: BaseException) -> str:
+    """Short, low-cardinality label describing why a call failed."""
+
+    cause = exc.__cause__ if exc.__cause__ is not None else exc
+    status = getattr(cause, "status_code", None)
+    if isinstance(status, int):
+        return "http_429" if status == 429 else f"http_{status // 100}xx"
+    if isinstance(cause, ValueError):
+        return "invalid_payload"
+    name = type(cause).__name__
+    if "Timeout" in name:
+        return "timeout"
+    if "Connection" in name or isinstance(cause, OSError):
+        return "connection"
+    return name.lower()
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
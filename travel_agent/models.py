@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import date, datetime
-from typing import Callable, Iterable, List, Optional, Sequence
+from datetime import date, datetime, time
+from typing import Callable, Iterable, List, Mapping, Optional, Sequence
 
 
 @dataclass(slots=True)
@@ -44,6 +44,10 @@ class Activity:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     booking_url: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    opens_at: Optional[time] = None
+    closes_at: Optional[time] = None
 
 
 @dataclass(slots=True)
@@ -88,6 +92,60 @@ class FlightOffer:
     booking_url: str
     loyalty_cost: Optional[int] = None
     loyalty_program: Optional[str] = None
+    stops: Optional[int] = None
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, object]) -> "FlightOffer":
+        """Build an offer from a provider result dictionary."""
+
+        return cls(
+            price=float(raw.get("price", 0.0)),
+            currency=str(raw.get("currency", "USD")),
+            departure_time=_parse_datetime(raw.get("departure_time")),
+            arrival_time=_parse_datetime(raw.get("arrival_time")),
+            airline=str(raw.get("airline", "")),
+            flight_number=str(raw.get("flight_number", "")),
+            booking_url=str(raw.get("booking_url", "")),
+            loyalty_cost=_maybe_int(raw.get("loyalty_cost")),
+            loyalty_program=raw.get("loyalty_program"),
+            stops=_maybe_int(raw.get("stops")),
+        )
+
+
+@dataclass(slots=True)
+class FareCell:
+    """Cheapest offer found for one departure/return date pair."""
+
+    departure_date: date
+    return_date: date
+    price: float
+    offer: FlightOffer
+
+
+@dataclass(slots=True)
+class FareMatrix:
+    """Prices for a grid of departure and return dates.
+
+    ``prices[i][j]`` holds the cheapest fare departing on
+    ``departure_dates[i]`` and returning on ``return_dates[j]``, or ``None``
+    when the pair is not bookable, returned no offers, or failed.
+    """
+
+    departure_dates: List[date]
+    return_dates: List[date]
+    prices: List[List[Optional[float]]]
+    cheapest: List[FareCell] = field(default_factory=list)
+    failed: List[tuple[date, date]] = field(default_factory=list)
+
+    def price(self, departure_date: date, return_date: date) -> Optional[float]:
+        """Return the cheapest fare for a date pair, if any."""
+
+        try:
+            row = self.departure_dates.index(departure_date)
+            column = self.return_dates.index(return_date)
+        except ValueError:
+            return None
+        return self.prices[row][column]
 
 
 @dataclass(slots=True)
@@ -118,6 +176,56 @@ class HotelOffer:
     loyalty_cost: Optional[int] = None
     loyalty_program: Optional[str] = None
     notes: Sequence[str] = field(default_factory=tuple)
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, object]) -> "HotelOffer":
+        """Build an offer from a provider result dictionary."""
+
+        return cls(
+            name=str(raw.get("name", "")),
+            price_per_night=float(raw.get("price_per_night", 0.0)),
+            currency=str(raw.get("currency", "USD")),
+            check_in=_parse_date(raw.get("check_in")),
+            check_out=_parse_date(raw.get("check_out")),
+            rating=_maybe_float(raw.get("rating")),
+            location=raw.get("location"),
+            booking_url=str(raw.get("booking_url", "")),
+            loyalty_cost=_maybe_int(raw.get("loyalty_cost")),
+            loyalty_program=raw.get("loyalty_program"),
+            notes=tuple(raw.get("notes", ()) or ()),
+            latitude=_maybe_float(raw.get("latitude")),
+            longitude=_maybe_float(raw.get("longitude")),
+        )
+
+
+def _parse_datetime(value: object) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    raise ValueError(f"Unsupported datetime value: {value!r}")
+
+
+def _parse_date(value: object) -> date:
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    raise ValueError(f"Unsupported date value: {value!r}")
+
+
+def _maybe_float(value: object) -> float | None:
+    if value is None:
+        return None
+    return float(value)
+
+
+def _maybe_int(value: object) -> int | None:
+    if value is None:
+        return None
+    return int(value)
 
 
 Callback = Callable[[Iterable[object]], None]
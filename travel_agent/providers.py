@@ -2,16 +2,49 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import threading
 import time
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Mapping, MutableMapping, Sequence
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, Iterator, Mapping, MutableMapping, Sequence
 
-import requests
+from auth import AccessToken, TokenManager, TokenStore
+from geo import parse_coordinates
+from locations import LocationIndex, response_is_complete
+from metrics import BYTE_BUCKETS, REGISTRY, MetricsRegistry, error_class
+from models import FlightOffer, HotelOffer
+from ratelimit import RateLimiter, RetryPolicy, retry_after_seconds
+from resilience import CircuitBreaker, CircuitBreakers, ResilienceStats, StaleStore
+from search import (
+    AsyncCompositeSearchProvider,
+    AsyncFlightSearchProvider,
+    AsyncHotelSearchProvider,
+    CompositeSearchProvider,
+    FlightSearchProvider,
+    HotelSearchProvider,
+    StreamingFlightSearchProvider,
+    StreamingHotelSearchProvider,
+)
+from singleflight import AsyncSingleFlight, SingleFlight
+from streaming import iter_json_array
+from tracing import span
+
+if TYPE_CHECKING:
+    import requests
+
+
+def _requests() -> ModuleType:
+    """Import the HTTP client on first use; it is the slowest part of importing this module."""
 
-from search import CompositeSearchProvider, FlightSearchProvider, HotelSearchProvider
+    import requests
+
+    return requests
 
 
 class ProviderError(RuntimeError):
@@ -113,17 +146,284 @@ class AmadeusConfig:
         return cls(client_id=client_id, client_secret=client_secret, hostname=hostname, timeout=timeout)
 
 
+def amadeus_token_manager(
+    config: AmadeusConfig,
+    *,
+    session: requests.Session | None = None,
+    store: TokenStore | None = None,
+    refresh_ahead: float | None = 120.0,
+    metrics: MetricsRegistry | None = None,
+) -> TokenManager:
+    """Create a :class:`TokenManager` fetching OAuth tokens for *config*.
+
+    Clients sharing the returned manager (or processes sharing *store*) reuse
+    one access token instead of each authenticating separately.
+    """
+
+    token_session = session or _requests().Session(raise_for_status=False)
+
+    def fetch() -> AccessToken:
+        now = time.time()
+        try:
+            response = token_session.post(
+                f"{config.hostname}/v1/security/oauth2/token",
+                data={
+                    "grant_type": "client_credentials",
+                    "client_id": config.client_id,
+                    "client_secret": config.client_secret,
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=config.timeout,
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except (_requests().RequestException, ValueError) as exc:
+            raise ProviderError(f"Unable to obtain Amadeus access token: {exc}") from exc
+        token = payload.get("access_token") if isinstance(payload, Mapping) else None
+        if not token:
+            raise ProviderError(f"Unable to obtain Amadeus access token: {payload!r}")
+        expires_in = float(payload.get("expires_in", 1800))
+        return AccessToken(value=str(token), expires_at=now + expires_in)
+
+    return TokenManager(
+        fetch,
+        key=f"{config.hostname}|{config.client_id}",
+        store=store,
+        refresh_ahead=refresh_ahead,
+        metrics=metrics,
+    )
+
+
+class _ClientMetrics:
+    """Per-endpoint request metrics shared by the sync and async clients."""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.requests = registry.counter(
+            "amadeus_requests_total", "Amadeus API calls by endpoint and outcome.", ("endpoint", "outcome")
+        )
+        self.latency = registry.histogram(
+            "amadeus_request_duration_seconds",
+            "Time until an Amadeus response arrived, including rate limiting and retries.",
+            ("endpoint",),
+        )
+        self.response_bytes = registry.histogram(
+            "amadeus_response_bytes", "Size of Amadeus response bodies.", ("endpoint",), buckets=BYTE_BUCKETS
+        )
+        self.decode = registry.histogram(
+            "amadeus_json_decode_seconds", "Time spent decoding Amadeus JSON payloads.", ("endpoint",)
+        )
+        self.errors = registry.counter(
+            "amadeus_request_errors_total", "Failed Amadeus calls by endpoint and error class.", ("endpoint", "error")
+        )
+        self.retries = registry.counter(
+            "amadeus_retries_total", "Amadeus attempts that were retried, by endpoint and reason.", ("endpoint", "reason")
+        )
+
+    def received(self, path: str, started: float, response: requests.Response | None = None) -> None:
+        self.latency.labels(path).observe(time.perf_counter() - started)
+        if response is not None:
+            self.response_bytes.labels(path).observe(len(response.content))
+
+    def succeeded(self, path: str) -> None:
+        self.requests.labels(path, "ok").inc()
+
+    def failed(self, path: str, exc: BaseException) -> None:
+        self.requests.labels(path, "error").inc()
+        self.errors.labels(path, error_class(exc)).inc()
+
+
 class _AmadeusClient:
-    """Light-weight helper for handling Amadeus authentication and requests."""
+    """Light-weight helper for handling Amadeus authentication and requests.
+
+    Every request first takes a slot from *rate_limiter*, which is shared by
+    all providers built on the same client. Throttled (429), failing (5xx)
+    and unreachable calls are retried according to *retry_policy*, honouring
+    ``Retry-After`` and giving up once the policy's deadline budget is spent.
 
-    def __init__(self, config: AmadeusConfig, *, session: requests.Session | None = None) -> None:
+    GETs go through a per-endpoint circuit breaker: while an endpoint's
+    circuit is open, calls fail fast or return the last good response for
+    the same request. With *hedge_after* set, a GET still unanswered after
+    that many seconds is sent a second time and the first response wins.
+    Hedged requests run on *hedge_executor*, or on a private pool of 32
+    threads created on first use.
+
+    :meth:`close` shuts down that private pool and the session and token
+    manager the client created itself; injected ones are left to their owner.
+    """
+
+    def __init__(
+        self,
+        config: AmadeusConfig,
+        *,
+        session: requests.Session | None = None,
+        coalesce: bool = True,
+        token_manager: TokenManager | None = None,
+        token_store: TokenStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge_after: float | None = None,
+        hedge_executor: Executor | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        stale_entries: int = 256,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
         self._config = config
-        self._session = session or requests.Session()
-        self._token: str | None = None
-        self._token_expiry: float = 0.0
+        self._owns_session = session is None
+        self._owns_tokens = token_manager is None
+        self._session = session or _requests().Session(raise_for_status=False)
+        self._metrics = _ClientMetrics(metrics if metrics is not None else REGISTRY)
+        self._tokens = token_manager or amadeus_token_manager(
+            config, session=self._session, store=token_store, metrics=metrics
+        )
+        self._inflight = SingleFlight() if coalesce else None
+        self._limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self._retry = retry_policy if retry_policy is not None else RetryPolicy()
+        self._hedge_after = hedge_after
+        self._hedge_pool = hedge_executor
+        self._owns_hedge_pool = hedge_executor is None
+        self._breakers = circuit_breakers if circuit_breakers is not None else CircuitBreakers()
+        self._stale: StaleStore[Mapping[str, object]] = StaleStore(stale_entries)
+        self._stats = ResilienceStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> ResilienceStats:
+        with self._lock:
+            return ResilienceStats(**{name: getattr(self._stats, name) for name in ResilienceStats.__slots__})
+
+    def close(self) -> None:
+        """Release the hedging threads, session and token refreshes this client owns.
+
+        Slower hedged requests still in flight finish in the background.
+        """
+
+        with self._lock:
+            pool = self._hedge_pool if self._owns_hedge_pool else None
+            if pool is not None:
+                self._hedge_pool = None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        if self._owns_tokens:
+            self._tokens.close()
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "_AmadeusClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def get(self, path: str, *, params: Mapping[str, object] | None = None) -> Mapping[str, object]:
-        return self._request("GET", path, params=params)
+        key = _request_key(path, params)
+        if self._inflight is None:
+            return self._guarded_get(path, params, key)
+        # Identical concurrent GETs share one upstream call and its result.
+        return self._inflight.do(key, lambda: self._guarded_get(path, params, key))
+
+    def _guarded_get(
+        self, path: str, params: Mapping[str, object] | None, key: Hashable
+    ) -> Mapping[str, object]:
+        breaker = self._breakers.for_path(path)
+        self._count("requests")
+        if not breaker.allow():
+            return self._short_circuit(path, key)
+        try:
+            if self._hedge_after is None:
+                result = self._request("GET", path, params=params)
+            else:
+                result = self._hedged_get(path, params)
+        except ProviderError as exc:
+            _record_outcome(breaker, exc, self._count)
+            raise
+        except BaseException:
+            # Local errors and cancellation say nothing about the upstream, but a
+            # half-open probe must still be released or the circuit never recovers.
+            breaker.release()
+            raise
+        breaker.record_success()
+        self._stale.put(key, result)
+        return result
+
+    def _hedged_get(self, path: str, params: Mapping[str, object] | None) -> Mapping[str, object]:
+        pool = self._hedge_executor()
+        primary = pool.submit(self._request, "GET", path, params=params)
+        try:
+            return primary.result(timeout=self._hedge_after)
+        except FutureTimeoutError:
+            pass
+        hedge = pool.submit(self._request, "GET", path, params=params)
+        self._count("hedges_sent")
+        error: BaseException | None = None
+        for future in as_completed((primary, hedge)):
+            try:
+                result = future.result()
+            except ProviderError as exc:
+                error = exc
+                continue
+            if future is hedge:
+                self._count("hedge_wins")
+            # The slower request is left to finish in the background.
+            return result
+        assert error is not None
+        raise error
+
+    def _hedge_executor(self) -> Executor:
+        with self._lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="amadeus-hedge")
+            return self._hedge_pool
+
+    def _short_circuit(self, path: str, key: Hashable) -> Mapping[str, object]:
+        self._count("short_circuited")
+        stale = self._stale.get(key)
+        if stale is None:
+            raise ProviderError(f"Amadeus endpoint {path} is unavailable (circuit open)")
+        self._count("stale_served")
+        return stale
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self._stats, name, getattr(self._stats, name) + 1)
+
+    def iter_items(
+        self, path: str, *, params: Mapping[str, object] | None = None, key: str = "data"
+    ) -> Iterator[object]:
+        """Stream the items of the *key* array of a GET response.
+
+        The body is decoded incrementally, so only one item is materialised
+        at a time. Streamed requests bypass request coalescing, hedging and
+        the stale fallback, but still respect the endpoint's circuit.
+        """
+
+        breaker = self._breakers.for_path(path)
+        if not breaker.allow():
+            self._count("short_circuited")
+            raise ProviderError(f"Amadeus endpoint {path} is unavailable (circuit open)")
+        started = time.perf_counter()
+        try:
+            with span("amadeus.request", endpoint=path, stream=True):
+                response = self._send("GET", path, params=params, stream=True)
+            self._metrics.received(path, started)
+            with response:
+                try:
+                    yield from iter_json_array(response.iter_content(), key=key)
+                except _requests().RequestException as exc:
+                    raise ProviderError(f"Failed to read Amadeus response: {exc}") from exc
+                except ValueError as exc:
+                    raise ProviderError("Invalid JSON payload from Amadeus API") from exc
+        except ProviderError as exc:
+            # A body cut off mid-stream is as much an upstream failure as an error status.
+            _record_outcome(breaker, exc, self._count)
+            self._metrics.failed(path, exc)
+            raise
+        except BaseException:
+            # Local errors, cancellation and consumers stopping early (GeneratorExit)
+            # say nothing about the upstream, but a half-open probe must be released.
+            breaker.release()
+            raise
+        breaker.record_success()
+        self._metrics.succeeded(path)
 
     def _request(
         self,
@@ -131,62 +431,347 @@ class _AmadeusClient:
         path: str,
         *,
         params: Mapping[str, object] | None = None,
-        retry: bool = True,
     ) -> Mapping[str, object]:
-        token = self._ensure_token()
+        started = time.perf_counter()
+        try:
+            with span("amadeus.request", endpoint=path):
+                response = self._send(method, path, params=params)
+                self._metrics.received(path, started, response)
+                with self._metrics.decode.labels(path).time(), span("amadeus.json_decode", bytes=len(response.content)):
+                    data = _decode_payload(response)
+        except ProviderError as exc:
+            self._metrics.failed(path, exc)
+            raise
+        self._metrics.succeeded(path)
+        return data
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, object] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        deadline = _deadline(self._retry)
         url = f"{self._config.hostname}{path}"
-        headers = {"Authorization": f"Bearer {token}"}
+        query = {k: v for k, v in (params or {}).items() if v not in (None, "")}
+        attempt = 0
+        refreshed = False
+        while True:
+            attempt += 1
+            wait = self._limiter.reserve(path, max_wait=_remaining(deadline))
+            if wait is None:
+                raise ProviderError(f"Rate limit for {path} leaves no time within the call deadline")
+            if wait:
+                time.sleep(wait)
+            token = self._tokens.get_token()
+            try:
+                response = self._session.request(
+                    method,
+                    url,
+                    params=query,
+                    headers={"Authorization": f"Bearer {token}"},
+                    timeout=_request_timeout(self._config.timeout, deadline),
+                    stream=stream,
+                )
+            except _requests().HTTPError as exc:
+                # Injected sessions may raise on error statuses; inspect the response all the same.
+                if exc.response is None:
+                    raise ProviderError(f"Amadeus API returned an error: {exc}") from exc
+                response = exc.response
+            except _requests().RequestException as exc:
+                delay = _retry_delay(self._retry, attempt, None, deadline)
+                if delay is None:
+                    raise ProviderError(f"Failed to contact Amadeus API: {exc}") from exc
+                self._metrics.retries.labels(path, error_class(exc)).inc()
+                time.sleep(delay)
+                continue
+            if response.status_code == 401 and not refreshed:
+                # Token likely expired – refresh and retry once.
+                response.close()
+                self._tokens.invalidate(token)
+                self._metrics.retries.labels(path, "http_401").inc()
+                refreshed = True
+                continue
+            if response.status_code in self._retry.retry_statuses:
+                retry_after = retry_after_seconds(response.headers)
+                if retry_after is not None:
+                    self._limiter.pause(path, retry_after)
+                delay = _retry_delay(self._retry, attempt, retry_after, deadline)
+                if delay is not None:
+                    self._metrics.retries.labels(path, f"http_{response.status_code}").inc()
+                    response.close()
+                    time.sleep(delay)
+                    continue
+            try:
+                response.raise_for_status()
+            except _requests().HTTPError as exc:
+                raise ProviderError(f"Amadeus API returned an error: {exc}") from exc
+            return response
+
+
+class _AsyncAmadeusClient:
+    """Asyncio counterpart of :class:`_AmadeusClient`.
+
+    Tokens come from the same :class:`~auth.TokenManager` machinery as the
+    synchronous client; a refresh runs on the default executor so the event
+    loop never blocks, and many coroutines hitting an expired token trigger a
+    single refresh. Pass the ``token_manager`` of a synchronous client to
+    share its token. Rate limiting, retries, circuit breaking and hedging
+    behave as in :class:`_AmadeusClient`; a losing hedged request is
+    cancelled.
+    """
+
+    def __init__(
+        self,
+        config: AmadeusConfig,
+        *,
+        session: requests.AsyncSession | None = None,
+        coalesce: bool = True,
+        token_manager: TokenManager | None = None,
+        token_store: TokenStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge_after: float | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        stale_entries: int = 256,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self._config = config
+        self._session = session or _requests().AsyncSession(raise_for_status=False)
+        self._metrics = _ClientMetrics(metrics if metrics is not None else REGISTRY)
+        self._tokens = token_manager or amadeus_token_manager(config, store=token_store, metrics=metrics)
+        self._inflight = AsyncSingleFlight() if coalesce else None
+        self._limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self._retry = retry_policy if retry_policy is not None else RetryPolicy()
+        self._hedge_after = hedge_after
+        self._breakers = circuit_breakers if circuit_breakers is not None else CircuitBreakers()
+        self._stale: StaleStore[Mapping[str, object]] = StaleStore(stale_entries)
+        self._stats = ResilienceStats()
+
+    @property
+    def stats(self) -> ResilienceStats:
+        return ResilienceStats(**{name: getattr(self._stats, name) for name in ResilienceStats.__slots__})
+
+    async def get(self, path: str, *, params: Mapping[str, object] | None = None) -> Mapping[str, object]:
+        key = _request_key(path, params)
+        if self._inflight is None:
+            return await self._guarded_get(path, params, key)
+        return await self._inflight.do(key, lambda: self._guarded_get(path, params, key))
+
+    async def _guarded_get(
+        self, path: str, params: Mapping[str, object] | None, key: Hashable
+    ) -> Mapping[str, object]:
+        breaker = self._breakers.for_path(path)
+        self._count("requests")
+        if not breaker.allow():
+            self._count("short_circuited")
+            stale = self._stale.get(key)
+            if stale is None:
+                raise ProviderError(f"Amadeus endpoint {path} is unavailable (circuit open)")
+            self._count("stale_served")
+            return stale
         try:
-            response = self._session.request(
-                method,
-                url,
-                params={k: v for k, v in (params or {}).items() if v not in (None, "")},
-                headers=headers,
-                timeout=self._config.timeout,
-            )
-        except requests.RequestException as exc:
-            raise ProviderError(f"Failed to contact Amadeus API: {exc}") from exc
-        if response.status_code == 401 and retry:
-            # Token likely expired – refresh and retry once.
-            self._token = None
-            self._token_expiry = 0.0
-            return self._request(method, path, params=params, retry=False)
+            if self._hedge_after is None:
+                result = await self._request("GET", path, params=params)
+            else:
+                result = await self._hedged_get(path, params)
+        except ProviderError as exc:
+            _record_outcome(breaker, exc, self._count)
+            raise
+        except BaseException:
+            # Local errors and cancellation say nothing about the upstream, but a
+            # half-open probe must still be released or the circuit never recovers.
+            breaker.release()
+            raise
+        breaker.record_success()
+        self._stale.put(key, result)
+        return result
+
+    async def _hedged_get(self, path: str, params: Mapping[str, object] | None) -> Mapping[str, object]:
+        primary = asyncio.ensure_future(self._request("GET", path, params=params))
+        tasks = {primary}
         try:
-            response.raise_for_status()
-        except requests.HTTPError as exc:  # pragma: no cover - defensive branch
-            raise ProviderError(f"Amadeus API returned an error: {exc}") from exc
+            done, _ = await asyncio.wait(tasks, timeout=self._hedge_after)
+            if done:
+                return primary.result()
+            hedge = asyncio.ensure_future(self._request("GET", path, params=params))
+            tasks.add(hedge)
+            self._count("hedges_sent")
+            error: BaseException | None = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._count("hedge_wins")
+                        return task.result()
+                    error = task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _count(self, name: str) -> None:
+        setattr(self._stats, name, getattr(self._stats, name) + 1)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, object] | None = None,
+    ) -> Mapping[str, object]:
+        started = time.perf_counter()
         try:
-            data = response.json()
-        except ValueError as exc:  # pragma: no cover - defensive branch
-            raise ProviderError("Invalid JSON payload from Amadeus API") from exc
-        if not isinstance(data, MutableMapping):
-            raise ProviderError(f"Unexpected response payload from Amadeus: {data!r}")
+            with span("amadeus.request", endpoint=path):
+                response = await self._send(method, path, params=params)
+                self._metrics.received(path, started, response)
+                with self._metrics.decode.labels(path).time(), span("amadeus.json_decode", bytes=len(response.content)):
+                    data = _decode_payload(response)
+        except ProviderError as exc:
+            self._metrics.failed(path, exc)
+            raise
+        self._metrics.succeeded(path)
         return data
 
-    def _ensure_token(self) -> str:
-        now = time.time()
-        if self._token and now < self._token_expiry:
-            return self._token
-        response = self._session.post(
-            f"{self._config.hostname}/v1/security/oauth2/token",
-            data={
-                "grant_type": "client_credentials",
-                "client_id": self._config.client_id,
-                "client_secret": self._config.client_secret,
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=self._config.timeout,
-        )
-        response.raise_for_status()
-        payload = response.json()
-        token = payload.get("access_token")
-        expires_in = float(payload.get("expires_in", 1800))
-        if not token:
-            raise ProviderError(f"Unable to obtain Amadeus access token: {payload!r}")
-        self._token = str(token)
-        # Refresh the token slightly before it expires to avoid race conditions.
-        self._token_expiry = now + max(expires_in - 60, 0)
-        return self._token
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, object] | None = None,
+    ) -> requests.Response:
+        deadline = _deadline(self._retry)
+        url = f"{self._config.hostname}{path}"
+        query = {k: v for k, v in (params or {}).items() if v not in (None, "")}
+        attempt = 0
+        refreshed = False
+        while True:
+            attempt += 1
+            wait = self._limiter.reserve(path, max_wait=_remaining(deadline))
+            if wait is None:
+                raise ProviderError(f"Rate limit for {path} leaves no time within the call deadline")
+            if wait:
+                await asyncio.sleep(wait)
+            token = await self._ensure_token()
+            try:
+                response = await self._session.request(
+                    method,
+                    url,
+                    params=query,
+                    headers={"Authorization": f"Bearer {token}"},
+                    timeout=_request_timeout(self._config.timeout, deadline),
+                )
+            except _requests().HTTPError as exc:
+                # Injected sessions may raise on error statuses; inspect the response all the same.
+                if exc.response is None:
+                    raise ProviderError(f"Amadeus API returned an error: {exc}") from exc
+                response = exc.response
+            except _requests().RequestException as exc:
+                delay = _retry_delay(self._retry, attempt, None, deadline)
+                if delay is None:
+                    raise ProviderError(f"Failed to contact Amadeus API: {exc}") from exc
+                self._metrics.retries.labels(path, error_class(exc)).inc()
+                await asyncio.sleep(delay)
+                continue
+            if response.status_code == 401 and not refreshed:
+                # Token likely expired – refresh and retry once.
+                self._tokens.invalidate(token)
+                self._metrics.retries.labels(path, "http_401").inc()
+                refreshed = True
+                continue
+            if response.status_code in self._retry.retry_statuses:
+                retry_after = retry_after_seconds(response.headers)
+                if retry_after is not None:
+                    self._limiter.pause(path, retry_after)
+                delay = _retry_delay(self._retry, attempt, retry_after, deadline)
+                if delay is not None:
+                    self._metrics.retries.labels(path, f"http_{response.status_code}").inc()
+                    await asyncio.sleep(delay)
+                    continue
+            try:
+                response.raise_for_status()
+            except _requests().HTTPError as exc:
+                raise ProviderError(f"Amadeus API returned an error: {exc}") from exc
+            return response
+
+    async def _ensure_token(self) -> str:
+        token = self._tokens.token
+        if token is not None:
+            return token
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._tokens.get_token)
+
+
+def _decode_payload(response: requests.Response) -> Mapping[str, object]:
+    try:
+        data = response.json()
+    except ValueError as exc:
+        raise ProviderError("Invalid JSON payload from Amadeus API") from exc
+    if not isinstance(data, MutableMapping):
+        raise ProviderError(f"Unexpected response payload from Amadeus: {data!r}")
+    return data
+
+
+def _record_outcome(breaker: CircuitBreaker, exc: ProviderError, count: Callable[[str], None]) -> None:
+    """Feed a failed call into *breaker*.
+
+    Client errors (4xx other than 429) show that the upstream is responsive,
+    so only throttling, server errors and transport failures count.
+    """
+
+    cause = exc.__cause__
+    status = getattr(cause, "status_code", None) if isinstance(cause, _requests().HTTPError) else None
+    if status is not None and status < 500 and status != 429:
+        breaker.record_success()
+    elif breaker.record_failure():
+        count("circuit_opens")
+
+
+def _deadline(policy: RetryPolicy) -> float | None:
+    return None if policy.deadline is None else time.monotonic() + policy.deadline
+
+
+def _remaining(deadline: float | None) -> float | None:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def _request_timeout(timeout: float, deadline: float | None) -> float:
+    """Cap the socket timeout so that a single attempt cannot outlive the deadline."""
+
+    remaining = _remaining(deadline)
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise ProviderError("Amadeus call deadline exceeded")
+    return min(timeout, remaining)
+
+
+def _retry_delay(
+    policy: RetryPolicy, attempt: int, retry_after: float | None, deadline: float | None
+) -> float | None:
+    """Seconds to wait before the next attempt, or ``None`` to give up."""
+
+    if attempt >= policy.max_attempts:
+        return None
+    delay = policy.backoff(attempt, retry_after)
+    remaining = _remaining(deadline)
+    if remaining is not None and delay >= remaining:
+        return None
+    return delay
+
+
+def _request_key(path: str, params: Mapping[str, object] | None) -> tuple[object, ...]:
+    """Return a hashable key identifying a GET request for coalescing."""
+
+    return (path,) + tuple(
+        sorted((key, str(value)) for key, value in (params or {}).items() if value not in (None, ""))
+    )
 
 
 def _normalise_amadeus_url(value: object, *, hostname: str) -> str:
@@ -204,7 +789,196 @@ def _normalise_amadeus_url(value: object, *, hostname: str) -> str:
     return ""
 
 
-class AmadeusFlightSearchProvider(FlightSearchProvider):
+def _booking_url(raw_links: object, *, hostname: str) -> str:
+    links = raw_links if isinstance(raw_links, Mapping) else {}
+    for key in ("deeplink", "self"):
+        candidate = _normalise_amadeus_url(links.get(key), hostname=hostname)
+        if candidate:
+            return candidate
+    return ""
+
+
+def _flight_search_params(
+    *,
+    origin: str,
+    destination: str,
+    departure_date: str,
+    return_date: str | None,
+    travelers: int,
+    cabin: str | None,
+    max_stops: int | None,
+    loyalty_programs: Sequence[str],
+) -> dict[str, object]:
+    params: dict[str, object] = {
+        "originLocationCode": origin,
+        "destinationLocationCode": destination,
+        "departureDate": departure_date,
+        "adults": travelers,
+        "currencyCode": "USD",
+    }
+    if return_date:
+        params["returnDate"] = return_date
+    if cabin:
+        params["travelClass"] = cabin.upper()
+    if max_stops is not None:
+        params["max"] = max_stops
+    if loyalty_programs:
+        params["includedAirlineCodes"] = ",".join(sorted(loyalty_programs))
+    return params
+
+
+def _parse_flight_offer(offer: object, *, hostname: str) -> Mapping[str, object] | None:
+    """Convert a single Amadeus flight offer into the provider result shape."""
+
+    if not isinstance(offer, MutableMapping):
+        return None
+    itineraries = offer.get("itineraries") or []
+    if not itineraries:
+        return None
+    first_itinerary = itineraries[0]
+    segments = first_itinerary.get("segments") or []
+    if not segments:
+        return None
+    first_segment = segments[0]
+    departure = (first_segment.get("departure") or {}).get("at")
+    arrival = (first_segment.get("arrival") or {}).get("at")
+    carrier = first_segment.get("carrierCode", "")
+    number = first_segment.get("number", "")
+    price = (offer.get("price") or {}).get("total")
+    currency = (offer.get("price") or {}).get("currency")
+    booking_url = _booking_url(offer.get("links"), hostname=hostname)
+
+    traveler_pricing = offer.get("travelerPricings") or []
+    loyalty_cost = None
+    loyalty_program = None
+    if traveler_pricing:
+        loyalty_program = (
+            (traveler_pricing[0].get("loyaltyProgramme") or {})
+            if isinstance(traveler_pricing[0], MutableMapping)
+            else None
+        )
+        if isinstance(loyalty_program, MutableMapping):
+            loyalty_cost = loyalty_program.get("points")
+            loyalty_program = loyalty_program.get("program")
+
+    return {
+        "price": float(price) if price is not None else 0.0,
+        "currency": currency or "USD",
+        "departure_time": departure,
+        "arrival_time": arrival,
+        "airline": carrier,
+        "flight_number": f"{carrier}{number}".strip(),
+        "booking_url": booking_url,
+        "loyalty_cost": loyalty_cost,
+        "loyalty_program": loyalty_program,
+        "stops": len(segments) - 1,
+    }
+
+
+def _parse_flight_offers(response: Mapping[str, object], *, hostname: str) -> Sequence[Mapping[str, object]]:
+    data = response.get("data", [])
+    if not isinstance(data, Iterable):
+        return ()
+    results: list[Mapping[str, object]] = []
+    for offer in data:
+        parsed = _parse_flight_offer(offer, hostname=hostname)
+        if parsed is not None:
+            results.append(parsed)
+    return tuple(results)
+
+
+def _hotel_search_params(
+    *,
+    destination: str,
+    check_in: str,
+    check_out: str,
+    travelers: int,
+    neighborhoods: Sequence[str],
+    amenities: Sequence[str],
+    loyalty_programs: Sequence[str],
+) -> dict[str, object]:
+    params: dict[str, object] = {
+        "cityCode": destination,
+        "checkInDate": check_in,
+        "checkOutDate": check_out,
+        "adults": travelers,
+        "roomQuantity": 1,
+        "view": "FULL",
+    }
+    if neighborhoods:
+        params["hotelIds"] = ",".join(sorted(neighborhoods))
+    if amenities:
+        params["amenities"] = ",".join(sorted(amenities))
+    if loyalty_programs:
+        params["loyaltyProgrammes"] = ",".join(sorted(loyalty_programs))
+    return params
+
+
+def _parse_hotel_entry(
+    entry: object, *, hostname: str, check_in: str, check_out: str
+) -> list[Mapping[str, object]]:
+    """Convert one Amadeus hotel entry into one result per room offer."""
+
+    if not isinstance(entry, MutableMapping):
+        return []
+    hotel = entry.get("hotel") or {}
+    offers = entry.get("offers") or []
+    results: list[Mapping[str, object]] = []
+    for offer in offers:
+        if not isinstance(offer, MutableMapping):
+            continue
+        price = (offer.get("price") or {}).get("total")
+        currency = (offer.get("price") or {}).get("currency")
+        notes: list[str] = []
+        if offer.get("boardType"):
+            notes.append(f"Board: {offer['boardType']}")
+        if offer.get("room") and isinstance(offer["room"], MutableMapping):
+            room_desc = offer["room"].get("description")
+            if isinstance(room_desc, MutableMapping):
+                text = room_desc.get("text")
+                if text:
+                    notes.append(str(text))
+        loyalty = offer.get("loyaltyProgramme") or {}
+        loyalty_cost = loyalty.get("points") if isinstance(loyalty, MutableMapping) else None
+        loyalty_program = loyalty.get("program") if isinstance(loyalty, MutableMapping) else None
+        location = None
+        lat, lng = parse_coordinates(hotel) if isinstance(hotel, MutableMapping) else (None, None)
+        if lat is not None and lng is not None:
+            location = f"{lat}, {lng}"
+        booking_url = _booking_url(offer.get("links"), hostname=hostname)
+        results.append(
+            {
+                "name": hotel.get("name", ""),
+                "price_per_night": float(price) if price is not None else 0.0,
+                "currency": currency or "USD",
+                "check_in": check_in,
+                "check_out": check_out,
+                "rating": hotel.get("rating"),
+                "location": location,
+                "booking_url": booking_url or "",
+                "loyalty_cost": loyalty_cost,
+                "loyalty_program": loyalty_program,
+                "notes": tuple(notes),
+                "latitude": lat,
+                "longitude": lng,
+            }
+        )
+    return results
+
+
+def _parse_hotel_offers(
+    response: Mapping[str, object], *, hostname: str, check_in: str, check_out: str
+) -> Sequence[Mapping[str, object]]:
+    data = response.get("data", [])
+    if not isinstance(data, Iterable):
+        return ()
+    results: list[Mapping[str, object]] = []
+    for entry in data:
+        results.extend(_parse_hotel_entry(entry, hostname=hostname, check_in=check_in, check_out=check_out))
+    return tuple(results)
+
+
+class AmadeusFlightSearchProvider(StreamingFlightSearchProvider):
     """Implementation of :class:`FlightSearchProvider` backed by Amadeus APIs."""
 
     def __init__(
@@ -214,6 +988,7 @@ class AmadeusFlightSearchProvider(FlightSearchProvider):
         session: requests.Session | None = None,
         client: _AmadeusClient | None = None,
     ) -> None:
+        self._owns_client = client is None
         if client is not None:
             self._client = client
         elif config is not None:
@@ -221,6 +996,18 @@ class AmadeusFlightSearchProvider(FlightSearchProvider):
         else:  # pragma: no cover - defensive branch
             raise ValueError("Either config or client must be provided")
 
+    def close(self) -> None:
+        """Close the client this provider created; a shared *client* is left open."""
+
+        if self._owns_client:
+            self._client.close()
+
+    def __enter__(self) -> "AmadeusFlightSearchProvider":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def search_flights(
         self,
         *,
@@ -233,86 +1020,49 @@ class AmadeusFlightSearchProvider(FlightSearchProvider):
         max_stops: int | None,
         loyalty_programs: Sequence[str],
     ) -> Sequence[Mapping[str, object]]:
-        params: dict[str, object] = {
-            "originLocationCode": origin,
-            "destinationLocationCode": destination,
-            "departureDate": departure_date,
-            "adults": travelers,
-            "currencyCode": "USD",
-        }
-        if return_date:
-            params["returnDate"] = return_date
-        if cabin:
-            params["travelClass"] = cabin.upper()
-        if max_stops is not None:
-            params["max"] = max_stops
-        if loyalty_programs:
-            params["includedAirlineCodes"] = ",".join(sorted(loyalty_programs))
-
+        params = _flight_search_params(
+            origin=origin,
+            destination=destination,
+            departure_date=departure_date,
+            return_date=return_date,
+            travelers=travelers,
+            cabin=cabin,
+            max_stops=max_stops,
+            loyalty_programs=loyalty_programs,
+        )
         response = self._client.get("/v2/shopping/flight-offers", params=params)
-        data = response.get("data", [])
-        results: list[Mapping[str, object]] = []
-        if not isinstance(data, Iterable):
-            return results
-        for offer in data:
-            if not isinstance(offer, MutableMapping):
-                continue
-            itineraries = offer.get("itineraries") or []
-            if not itineraries:
-                continue
-            first_itinerary = itineraries[0]
-            segments = first_itinerary.get("segments") or []
-            if not segments:
-                continue
-            first_segment = segments[0]
-            departure = (first_segment.get("departure") or {}).get("at")
-            arrival = (first_segment.get("arrival") or {}).get("at")
-            carrier = first_segment.get("carrierCode", "")
-            number = first_segment.get("number", "")
-            price = (offer.get("price") or {}).get("total")
-            currency = (offer.get("price") or {}).get("currency")
-            raw_links = offer.get("links")
-            links = raw_links if isinstance(raw_links, Mapping) else {}
-            booking_url = ""
-            for key in ("deeplink", "self"):
-                candidate = _normalise_amadeus_url(
-                    links.get(key),
-                    hostname=self._client._config.hostname,
-                )
-                if candidate:
-                    booking_url = candidate
-                    break
-
-            traveler_pricing = offer.get("travelerPricings") or []
-            loyalty_cost = None
-            loyalty_program = None
-            if traveler_pricing:
-                loyalty_program = (
-                    (traveler_pricing[0].get("loyaltyProgramme") or {})
-                    if isinstance(traveler_pricing[0], MutableMapping)
-                    else None
-                )
-                if isinstance(loyalty_program, MutableMapping):
-                    loyalty_cost = loyalty_program.get("points")
-                    loyalty_program = loyalty_program.get("program")
-
-            results.append(
-                {
-                    "price": float(price) if price is not None else 0.0,
-                    "currency": currency or "USD",
-                    "departure_time": departure,
-                    "arrival_time": arrival,
-                    "airline": carrier,
-                    "flight_number": f"{carrier}{number}".strip(),
-                    "booking_url": booking_url,
-                    "loyalty_cost": loyalty_cost,
-                    "loyalty_program": loyalty_program,
-                }
-            )
-        return tuple(results)
+        return _parse_flight_offers(response, hostname=self._client._config.hostname)
+
+    def iter_flight_offers(
+        self,
+        *,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: str | None,
+        travelers: int,
+        cabin: str | None,
+        max_stops: int | None,
+        loyalty_programs: Sequence[str],
+    ) -> Iterator[FlightOffer]:
+        params = _flight_search_params(
+            origin=origin,
+            destination=destination,
+            departure_date=departure_date,
+            return_date=return_date,
+            travelers=travelers,
+            cabin=cabin,
+            max_stops=max_stops,
+            loyalty_programs=loyalty_programs,
+        )
+        hostname = self._client._config.hostname
+        for item in self._client.iter_items("/v2/shopping/flight-offers", params=params):
+            parsed = _parse_flight_offer(item, hostname=hostname)
+            if parsed is not None:
+                yield FlightOffer.from_mapping(parsed)
 
 
-class AmadeusHotelSearchProvider(HotelSearchProvider):
+class AmadeusHotelSearchProvider(StreamingHotelSearchProvider):
     """Implementation of :class:`HotelSearchProvider` backed by Amadeus APIs."""
 
     def __init__(
@@ -322,6 +1072,7 @@ class AmadeusHotelSearchProvider(HotelSearchProvider):
         session: requests.Session | None = None,
         client: _AmadeusClient | None = None,
     ) -> None:
+        self._owns_client = client is None
         if client is not None:
             self._client = client
         elif config is not None:
@@ -329,6 +1080,18 @@ class AmadeusHotelSearchProvider(HotelSearchProvider):
         else:  # pragma: no cover - defensive branch
             raise ValueError("Either config or client must be provided")
 
+    def close(self) -> None:
+        """Close the client this provider created; a shared *client* is left open."""
+
+        if self._owns_client:
+            self._client.close()
+
+    def __enter__(self) -> "AmadeusHotelSearchProvider":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def search_hotels(
         self,
         *,
@@ -340,85 +1103,47 @@ class AmadeusHotelSearchProvider(HotelSearchProvider):
         amenities: Sequence[str],
         loyalty_programs: Sequence[str],
     ) -> Sequence[Mapping[str, object]]:
-        params: dict[str, object] = {
-            "cityCode": destination,
-            "checkInDate": check_in,
-            "checkOutDate": check_out,
-            "adults": travelers,
-            "roomQuantity": 1,
-            "view": "FULL",
-        }
-        if neighborhoods:
-            params["hotelIds"] = ",".join(sorted(neighborhoods))
-        if amenities:
-            params["amenities"] = ",".join(sorted(amenities))
-        if loyalty_programs:
-            params["loyaltyProgrammes"] = ",".join(sorted(loyalty_programs))
-
+        params = _hotel_search_params(
+            destination=destination,
+            check_in=check_in,
+            check_out=check_out,
+            travelers=travelers,
+            neighborhoods=neighborhoods,
+            amenities=amenities,
+            loyalty_programs=loyalty_programs,
+        )
         response = self._client.get("/v2/shopping/hotel-offers", params=params)
-        data = response.get("data", [])
-        results: list[Mapping[str, object]] = []
-        if not isinstance(data, Iterable):
-            return results
-        for entry in data:
-            if not isinstance(entry, MutableMapping):
-                continue
-            hotel = entry.get("hotel") or {}
-            offers = entry.get("offers") or []
-            if not offers:
-                continue
-            for offer in offers:
-                if not isinstance(offer, MutableMapping):
-                    continue
-                price = (offer.get("price") or {}).get("total")
-                currency = (offer.get("price") or {}).get("currency")
-                notes: list[str] = []
-                if offer.get("boardType"):
-                    notes.append(f"Board: {offer['boardType']}")
-                if offer.get("room") and isinstance(offer["room"], MutableMapping):
-                    room_desc = offer["room"].get("description")
-                    if isinstance(room_desc, MutableMapping):
-                        text = room_desc.get("text")
-                        if text:
-                            notes.append(str(text))
-                loyalty = offer.get("loyaltyProgramme") or {}
-                loyalty_cost = loyalty.get("points") if isinstance(loyalty, MutableMapping) else None
-                loyalty_program = loyalty.get("program") if isinstance(loyalty, MutableMapping) else None
-                location = None
-                if isinstance(hotel, MutableMapping):
-                    geo = hotel.get("geoCode")
-                    if isinstance(geo, MutableMapping):
-                        lat = geo.get("latitude")
-                        lng = geo.get("longitude")
-                        if lat is not None and lng is not None:
-                            location = f"{lat}, {lng}"
-                raw_links = offer.get("links")
-                links = raw_links if isinstance(raw_links, Mapping) else {}
-                booking_url = ""
-                for key in ("deeplink", "self"):
-                    candidate = _normalise_amadeus_url(
-                        links.get(key),
-                        hostname=self._client._config.hostname,
-                    )
-                    if candidate:
-                        booking_url = candidate
-                        break
-                results.append(
-                    {
-                        "name": hotel.get("name", ""),
-                        "price_per_night": float(price) if price is not None else 0.0,
-                        "currency": currency or "USD",
-                        "check_in": check_in,
-                        "check_out": check_out,
-                        "rating": hotel.get("rating"),
-                        "location": location,
-                        "booking_url": booking_url or "",
-                        "loyalty_cost": loyalty_cost,
-                        "loyalty_program": loyalty_program,
-                        "notes": tuple(notes),
-                    }
-                )
-        return tuple(results)
+        return _parse_hotel_offers(
+            response,
+            hostname=self._client._config.hostname,
+            check_in=check_in,
+            check_out=check_out,
+        )
+
+    def iter_hotel_offers(
+        self,
+        *,
+        destination: str,
+        check_in: str,
+        check_out: str,
+        travelers: int,
+        neighborhoods: Sequence[str],
+        amenities: Sequence[str],
+        loyalty_programs: Sequence[str],
+    ) -> Iterator[HotelOffer]:
+        params = _hotel_search_params(
+            destination=destination,
+            check_in=check_in,
+            check_out=check_out,
+            travelers=travelers,
+            neighborhoods=neighborhoods,
+            amenities=amenities,
+            loyalty_programs=loyalty_programs,
+        )
+        hostname = self._client._config.hostname
+        for entry in self._client.iter_items("/v2/shopping/hotel-offers", params=params):
+            for parsed in _parse_hotel_entry(entry, hostname=hostname, check_in=check_in, check_out=check_out):
+                yield HotelOffer.from_mapping(parsed)
 
 
 _ALLOWED_LOCATION_FILTERS = frozenset(
@@ -432,29 +1157,113 @@ _ALLOWED_LOCATION_FILTERS = frozenset(
 )
 
 
-class AmadeusSearchProvider(CompositeSearchProvider):
-    """Composite provider that reuses the same Amadeus credentials for all searches."""
+def _location_search_params(query: str, filters: Mapping[str, object] | None) -> dict[str, object]:
+    params: dict[str, object] = {"keyword": query, "subType": "AIRPORT,CITY"}
+    if filters:
+        params.update(
+            {
+                key: value
+                for key, value in filters.items()
+                if key in _ALLOWED_LOCATION_FILTERS and value not in (None, "")
+            }
+        )
+    return params
+
+
+def _parse_locations(response: Mapping[str, object]) -> Sequence[Mapping[str, object]]:
+    data = response.get("data", [])
+    if not isinstance(data, Iterable):
+        return ()
+    return tuple(item for item in data if isinstance(item, Mapping))
 
-    def __init__(self, config: AmadeusConfig, *, session: requests.Session | None = None) -> None:
-        self._client = _AmadeusClient(config, session=session)
+
+def _location_scope(params: Mapping[str, object]) -> dict[str, object]:
+    """Request parameters other than the keyword that narrow a location search."""
+
+    return {key: value for key, value in params.items() if key not in ("keyword", "subType")}
+
+
+def _remember_locations(
+    index: LocationIndex, query: str, scope: Mapping[str, object], response: Mapping[str, object]
+) -> Sequence[Mapping[str, object]]:
+    results = _parse_locations(response)
+    data = response.get("data")
+    returned = len(data) if isinstance(data, list) else len(results)
+    index.record(query, scope, results, complete=response_is_complete(response, returned))
+    return results
+
+
+class AmadeusSearchProvider(CompositeSearchProvider, StreamingFlightSearchProvider, StreamingHotelSearchProvider):
+    """Composite provider that reuses the same Amadeus credentials for all searches.
+
+    Flight, hotel and location searches share one client, and therefore one
+    :class:`~ratelimit.RateLimiter` (10 requests per second unless
+    *rate_limiter* says otherwise) and one :class:`~ratelimit.RetryPolicy`.
+    GETs are guarded by per-endpoint circuit breakers and, with
+    *hedge_after*, hedged against slow responses on *hedge_executor* (a
+    private pool by default); see :attr:`resilience_stats` for how often
+    either kicked in. :meth:`close` releases the client's threads and
+    connections.
+    """
+
+    def __init__(
+        self,
+        config: AmadeusConfig,
+        *,
+        session: requests.Session | None = None,
+        token_store: TokenStore | None = None,
+        location_index: LocationIndex | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge_after: float | None = None,
+        hedge_executor: Executor | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self._client = _AmadeusClient(
+            config,
+            session=session,
+            token_store=token_store,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            hedge_after=hedge_after,
+            hedge_executor=hedge_executor,
+            circuit_breakers=circuit_breakers,
+            metrics=metrics,
+        )
         self._flight = AmadeusFlightSearchProvider(client=self._client)
         self._hotel = AmadeusHotelSearchProvider(client=self._client)
+        self._locations = location_index if location_index is not None else LocationIndex()
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> "AmadeusSearchProvider":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def location_index(self) -> LocationIndex:
+        return self._locations
+
+    @property
+    def resilience_stats(self) -> ResilienceStats:
+        """Hedging and circuit breaker counters of the shared client."""
+
+        return self._client.stats
 
     def search(self, query: str, *, filters: Mapping[str, object] | None = None) -> Sequence[Mapping[str, object]]:
-        params = {"keyword": query, "subType": "AIRPORT,CITY"}
-        if filters:
-            params.update(
-                {
-                    key: value
-                    for key, value in filters.items()
-                    if key in _ALLOWED_LOCATION_FILTERS and value not in (None, "")
-                }
-            )
+        """Look up airports and cities, answering from the local index when possible."""
+
+        params = _location_search_params(query, filters)
+        scope = _location_scope(params)
+        local = self._locations.lookup(query, scope)
+        if local is not None:
+            return local
         response = self._client.get("/v1/reference-data/locations", params=params)
-        data = response.get("data", [])
-        if not isinstance(data, Iterable):
-            return ()
-        return tuple(item for item in data if isinstance(item, Mapping))
+        return _remember_locations(self._locations, query, scope, response)
 
     def search_flights(
         self,
@@ -501,3 +1310,232 @@ class AmadeusSearchProvider(CompositeSearchProvider):
             loyalty_programs=loyalty_programs,
         )
         return results
+
+    def iter_flight_offers(
+        self,
+        *,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: str | None,
+        travelers: int,
+        cabin: str | None,
+        max_stops: int | None,
+        loyalty_programs: Sequence[str],
+    ) -> Iterator[FlightOffer]:
+        return self._flight.iter_flight_offers(
+            origin=origin,
+            destination=destination,
+            departure_date=departure_date,
+            return_date=return_date,
+            travelers=travelers,
+            cabin=cabin,
+            max_stops=max_stops,
+            loyalty_programs=loyalty_programs,
+        )
+
+    def iter_hotel_offers(
+        self,
+        *,
+        destination: str,
+        check_in: str,
+        check_out: str,
+        travelers: int,
+        neighborhoods: Sequence[str],
+        amenities: Sequence[str],
+        loyalty_programs: Sequence[str],
+    ) -> Iterator[HotelOffer]:
+        return self._hotel.iter_hotel_offers(
+            destination=destination,
+            check_in=check_in,
+            check_out=check_out,
+            travelers=travelers,
+            neighborhoods=neighborhoods,
+            amenities=amenities,
+            loyalty_programs=loyalty_programs,
+        )
+
+
+class AsyncAmadeusFlightSearchProvider(AsyncFlightSearchProvider):
+    """Implementation of :class:`AsyncFlightSearchProvider` backed by Amadeus APIs."""
+
+    def __init__(
+        self,
+        config: AmadeusConfig | None = None,
+        *,
+        session: requests.AsyncSession | None = None,
+        client: _AsyncAmadeusClient | None = None,
+    ) -> None:
+        if client is not None:
+            self._client = client
+        elif config is not None:
+            self._client = _AsyncAmadeusClient(config, session=session)
+        else:  # pragma: no cover - defensive branch
+            raise ValueError("Either config or client must be provided")
+
+    async def search_flights(
+        self,
+        *,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: str | None,
+        travelers: int,
+        cabin: str | None,
+        max_stops: int | None,
+        loyalty_programs: Sequence[str],
+    ) -> Sequence[Mapping[str, object]]:
+        params = _flight_search_params(
+            origin=origin,
+            destination=destination,
+            departure_date=departure_date,
+            return_date=return_date,
+            travelers=travelers,
+            cabin=cabin,
+            max_stops=max_stops,
+            loyalty_programs=loyalty_programs,
+        )
+        response = await self._client.get("/v2/shopping/flight-offers", params=params)
+        return _parse_flight_offers(response, hostname=self._client._config.hostname)
+
+
+class AsyncAmadeusHotelSearchProvider(AsyncHotelSearchProvider):
+    """Implementation of :class:`AsyncHotelSearchProvider` backed by Amadeus APIs."""
+
+    def __init__(
+        self,
+        config: AmadeusConfig | None = None,
+        *,
+        session: requests.AsyncSession | None = None,
+        client: _AsyncAmadeusClient | None = None,
+    ) -> None:
+        if client is not None:
+            self._client = client
+        elif config is not None:
+            self._client = _AsyncAmadeusClient(config, session=session)
+        else:  # pragma: no cover - defensive branch
+            raise ValueError("Either config or client must be provided")
+
+    async def search_hotels(
+        self,
+        *,
+        destination: str,
+        check_in: str,
+        check_out: str,
+        travelers: int,
+        neighborhoods: Sequence[str],
+        amenities: Sequence[str],
+        loyalty_programs: Sequence[str],
+    ) -> Sequence[Mapping[str, object]]:
+        params = _hotel_search_params(
+            destination=destination,
+            check_in=check_in,
+            check_out=check_out,
+            travelers=travelers,
+            neighborhoods=neighborhoods,
+            amenities=amenities,
+            loyalty_programs=loyalty_programs,
+        )
+        response = await self._client.get("/v2/shopping/hotel-offers", params=params)
+        return _parse_hotel_offers(
+            response,
+            hostname=self._client._config.hostname,
+            check_in=check_in,
+            check_out=check_out,
+        )
+
+
+class AsyncAmadeusSearchProvider(AsyncCompositeSearchProvider):
+    """Async composite provider sharing one Amadeus client across all searches."""
+
+    def __init__(
+        self,
+        config: AmadeusConfig,
+        *,
+        session: requests.AsyncSession | None = None,
+        token_store: TokenStore | None = None,
+        location_index: LocationIndex | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge_after: float | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self._client = _AsyncAmadeusClient(
+            config,
+            session=session,
+            token_store=token_store,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            hedge_after=hedge_after,
+            circuit_breakers=circuit_breakers,
+            metrics=metrics,
+        )
+        self._flight = AsyncAmadeusFlightSearchProvider(client=self._client)
+        self._hotel = AsyncAmadeusHotelSearchProvider(client=self._client)
+        self._locations = location_index if location_index is not None else LocationIndex()
+
+    @property
+    def location_index(self) -> LocationIndex:
+        return self._locations
+
+    @property
+    def resilience_stats(self) -> ResilienceStats:
+        """Hedging and circuit breaker counters of the shared client."""
+
+        return self._client.stats
+
+    async def search(
+        self, query: str, *, filters: Mapping[str, object] | None = None
+    ) -> Sequence[Mapping[str, object]]:
+        params = _location_search_params(query, filters)
+        scope = _location_scope(params)
+        local = self._locations.lookup(query, scope)
+        if local is not None:
+            return local
+        response = await self._client.get("/v1/reference-data/locations", params=params)
+        return _remember_locations(self._locations, query, scope, response)
+
+    async def search_flights(
+        self,
+        *,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: str | None,
+        travelers: int,
+        cabin: str | None,
+        max_stops: int | None,
+        loyalty_programs: Sequence[str],
+    ) -> Sequence[Mapping[str, object]]:
+        return await self._flight.search_flights(
+            origin=origin,
+            destination=destination,
+            departure_date=departure_date,
+            return_date=return_date,
+            travelers=travelers,
+            cabin=cabin,
+            max_stops=max_stops,
+            loyalty_programs=loyalty_programs,
+        )
+
+    async def search_hotels(
+        self,
+        *,
+        destination: str,
+        check_in: str,
+        check_out: str,
+        travelers: int,
+        neighborhoods: Sequence[str],
+        amenities: Sequence[str],
+        loyalty_programs: Sequence[str],
+    ) -> Sequence[Mapping[str, object]]:
+        return await self._hotel.search_hotels(
+            destination=destination,
+            check_in=check_in,
+            check_out=check_out,
+            travelers=travelers,
+            neighborhoods=neighborhoods,
+            amenities=amenities,
+            loyalty_programs=loyalty_programs,
+        )
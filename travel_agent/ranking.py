@@ -0,0 +1,357 @@
+"""Column-wise filtering and ranking of search offers."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Generic, List, Sequence, TypeVar
+
+from models import FlightOffer, FlightPreference, HotelOffer, HotelPreference
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None  # type: ignore[assignment]
+
+_Offer = TypeVar("_Offer")
+_NAN = float("nan")
+
+
+@dataclass(frozen=True, slots=True)
+class RankingWeights:
+    """Relative weights of the criteria used to score offers.
+
+    Every criterion is min-max normalised over the offers that passed the
+    filters, so the weights are comparable regardless of units. Prices and
+    loyalty points per cash unit are normalised within each currency, as
+    amounts in different currencies cannot be compared without exchange
+    rates. Lower prices, durations, stop counts and loyalty points per cash
+    unit are better, as are higher ratings. *preferred_airline* is
+    subtracted from the score of offers operated by one of
+    ``FlightPreference.preferred_airlines``.
+    """
+
+    price: float = 1.0
+    duration: float = 0.0
+    stops: float = 0.0
+    rating: float = 0.0
+    loyalty: float = 0.0
+    preferred_airline: float = 0.1
+
+
+class OfferTable(Generic[_Offer]):
+    """Offers stored as parallel columns for vectorised filtering and ranking.
+
+    The columns are ``price``, ``currency`` (an index into :attr:`currencies`),
+    ``duration`` (minutes for flights, nights for hotels), ``stops``,
+    ``rating`` and ``points_per_unit`` (loyalty points per unit of cash
+    price). Missing values are stored as NaN. Cash-denominated columns are
+    only compared between offers in the same currency. NumPy arrays are used
+    when NumPy is installed; otherwise the same operations run on plain lists.
+    """
+
+    def __init__(
+        self,
+        offers: Sequence[_Offer],
+        *,
+        price: Sequence[float],
+        currency: Sequence[str],
+        duration: Sequence[float],
+        stops: Sequence[float],
+        rating: Sequence[float],
+        points_per_unit: Sequence[float],
+        airline: Sequence[str] | None = None,
+    ) -> None:
+        self._offers = list(offers)
+        self.currencies: List[str] = sorted(set(currency))
+        codes = {code: index for index, code in enumerate(self.currencies)}
+        self._airline = list(airline) if airline is not None else [""] * len(self._offers)
+        self._columns = {
+            "price": _column(price),
+            "currency": _column([codes[code] for code in currency]),
+            "duration": _column(duration),
+            "stops": _column(stops),
+            "rating": _column(rating),
+            "points_per_unit": _column(points_per_unit),
+        }
+
+    @classmethod
+    def from_flights(cls, offers: Sequence[FlightOffer]) -> "OfferTable[FlightOffer]":
+        return cls(
+            offers,
+            price=[offer.price for offer in offers],
+            currency=[offer.currency for offer in offers],
+            duration=[(offer.arrival_time - offer.departure_time).total_seconds() / 60 for offer in offers],
+            stops=[_NAN if offer.stops is None else offer.stops for offer in offers],
+            rating=[_NAN] * len(offers),
+            points_per_unit=[_points_per_unit(offer.loyalty_cost, offer.price) for offer in offers],
+            airline=[offer.airline for offer in offers],
+        )
+
+    @classmethod
+    def from_hotels(cls, offers: Sequence[HotelOffer]) -> "OfferTable[HotelOffer]":
+        return cls(
+            offers,
+            price=[offer.price_per_night for offer in offers],
+            currency=[offer.currency for offer in offers],
+            duration=[(offer.check_out - offer.check_in).days for offer in offers],
+            stops=[_NAN] * len(offers),
+            rating=[_NAN if offer.rating is None else offer.rating for offer in offers],
+            points_per_unit=[_points_per_unit(offer.loyalty_cost, offer.price_per_night) for offer in offers],
+        )
+
+    def __len__(self) -> int:
+        return len(self._offers)
+
+    @property
+    def offers(self) -> List[_Offer]:
+        return list(self._offers)
+
+    def column(self, name: str) -> Sequence[float]:
+        """Return the raw column *name* (a NumPy array when available)."""
+
+        return self._columns[name]
+
+    def flight_mask(self, preference: FlightPreference) -> Sequence[bool]:
+        """Rows satisfying ``max_price`` and ``max_stops``.
+
+        Offers with an unknown stop count are kept.
+        """
+
+        price = self._columns["price"]
+        stops = self._columns["stops"]
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            if preference.max_price is not None:
+                mask &= price <= preference.max_price
+            if preference.max_stops is not None:
+                mask &= ~(stops > preference.max_stops)
+            return mask
+        return [
+            (preference.max_price is None or p <= preference.max_price)
+            and (preference.max_stops is None or not s > preference.max_stops)
+            for p, s in zip(price, stops)
+        ]
+
+    def hotel_mask(self, preference: HotelPreference) -> Sequence[bool]:
+        """Rows satisfying ``min_rating`` and ``max_price_per_night``.
+
+        Offers without a rating fail a ``min_rating`` requirement.
+        """
+
+        price = self._columns["price"]
+        rating = self._columns["rating"]
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            if preference.min_rating is not None:
+                mask &= rating >= preference.min_rating
+            if preference.max_price_per_night is not None:
+                mask &= price <= preference.max_price_per_night
+            return mask
+        return [
+            (preference.min_rating is None or r >= preference.min_rating)
+            and (preference.max_price_per_night is None or p <= preference.max_price_per_night)
+            for p, r in zip(price, rating)
+        ]
+
+    def airline_mask(self, airlines: Sequence[str]) -> Sequence[bool]:
+        """Rows operated by one of *airlines*."""
+
+        wanted = {code.upper() for code in airlines}
+        flags = [code.upper() in wanted for code in self._airline]
+        return np.asarray(flags, dtype=bool) if np is not None else flags
+
+    def scores(
+        self,
+        weights: RankingWeights,
+        *,
+        mask: Sequence[bool] | None = None,
+        preferred: Sequence[bool] | None = None,
+    ) -> Sequence[float]:
+        """Weighted score of every row; lower is better.
+
+        Normalisation only considers rows selected by *mask*; rows outside it
+        get a score but should not be ranked.
+        """
+
+        # (column, weight, higher is better, denominated in the offer's currency)
+        terms = (
+            ("price", weights.price, False, True),
+            ("duration", weights.duration, False, False),
+            ("stops", weights.stops, False, False),
+            ("points_per_unit", weights.loyalty, False, True),
+            ("rating", weights.rating, True, False),
+        )
+        groups = self._columns["currency"] if len(self.currencies) > 1 else None
+        if np is not None:
+            total = np.zeros(len(self))
+            for name, weight, higher_is_better, per_currency in terms:
+                if not weight:
+                    continue
+                if per_currency and groups is not None:
+                    total += weight * _normalise_grouped_array(self._columns[name], groups, mask, higher_is_better)
+                else:
+                    total += weight * _normalise_array(self._columns[name], mask, higher_is_better)
+            if preferred is not None and weights.preferred_airline:
+                total -= weights.preferred_airline * np.asarray(preferred, dtype=float)
+            return total
+        total_list = [0.0] * len(self)
+        for name, weight, higher_is_better, per_currency in terms:
+            if not weight:
+                continue
+            if per_currency and groups is not None:
+                normalised = _normalise_grouped_list(self._columns[name], groups, mask, higher_is_better)
+            else:
+                normalised = _normalise_list(self._columns[name], mask, higher_is_better)
+            total_list = [score + weight * value for score, value in zip(total_list, normalised)]
+        if preferred is not None and weights.preferred_airline:
+            total_list = [
+                score - weights.preferred_airline * float(flag) for score, flag in zip(total_list, preferred)
+            ]
+        return total_list
+
+    def top_k(
+        self,
+        scores: Sequence[float],
+        *,
+        mask: Sequence[bool] | None = None,
+        k: int | None = None,
+    ) -> List[_Offer]:
+        """Return the *k* best offers within *mask*, best first.
+
+        Only the selected rows are ordered (a partial sort when *k* is
+        smaller than their number). Ties keep the provider's order.
+        """
+
+        if np is not None:
+            rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+            values = np.asarray(scores, dtype=float)[rows]
+            if k is not None and k < len(rows):
+                if k <= 0:
+                    return []
+                keep = np.argpartition(values, k - 1)[:k]
+                rows, values = rows[keep], values[keep]
+            order = np.lexsort((rows, values))
+            return [self._offers[row] for row in rows[order]]
+        candidates = [
+            (score, row) for row, score in enumerate(scores) if mask is None or mask[row]
+        ]
+        if k is not None and k < len(candidates):
+            candidates = heapq.nsmallest(max(k, 0), candidates)
+        else:
+            candidates.sort()
+        return [self._offers[row] for _, row in candidates]
+
+
+def rank_flights(
+    offers: Sequence[FlightOffer],
+    preference: FlightPreference,
+    *,
+    weights: RankingWeights | None = None,
+    limit: int | None = None,
+) -> List[FlightOffer]:
+    """Filter *offers* by *preference* and return them best first."""
+
+    if not offers:
+        return []
+    table = OfferTable.from_flights(offers)
+    mask = table.flight_mask(preference)
+    preferred = table.airline_mask(preference.preferred_airlines) if preference.preferred_airlines else None
+    scores = table.scores(weights or RankingWeights(), mask=mask, preferred=preferred)
+    return table.top_k(scores, mask=mask, k=limit)
+
+
+def rank_hotels(
+    offers: Sequence[HotelOffer],
+    preference: HotelPreference,
+    *,
+    weights: RankingWeights | None = None,
+    limit: int | None = None,
+) -> List[HotelOffer]:
+    """Filter *offers* by *preference* and return them best first."""
+
+    if not offers:
+        return []
+    table = OfferTable.from_hotels(offers)
+    mask = table.hotel_mask(preference)
+    scores = table.scores(weights or RankingWeights(), mask=mask)
+    return table.top_k(scores, mask=mask, k=limit)
+
+
+def _column(values: Sequence[float]) -> Sequence[float]:
+    if np is not None:
+        return np.asarray(values, dtype=float)
+    return [float(value) for value in values]
+
+
+def _points_per_unit(points: int | None, price: float) -> float:
+    if points is None or price <= 0:
+        return _NAN
+    return points / price
+
+
+def _normalise_array(values: "np.ndarray", mask: Sequence[bool] | None, invert: bool) -> "np.ndarray":
+    """Scale *values* to [0, 1]; missing values count as the worst (1)."""
+
+    selected = values if mask is None else values[np.asarray(mask, dtype=bool)]
+    known = selected[~np.isnan(selected)]
+    if known.size == 0:
+        return np.zeros(len(values))
+    low, high = known.min(), known.max()
+    span = high - low
+    if span > 0:
+        scaled = (values - low) / span
+        if invert:
+            scaled = 1.0 - scaled
+    else:
+        scaled = np.zeros(len(values))
+    return np.where(np.isnan(values), 1.0, scaled)
+
+
+def _normalise_list(values: Sequence[float], mask: Sequence[bool] | None, invert: bool) -> List[float]:
+    known = [
+        value for row, value in enumerate(values) if (mask is None or mask[row]) and not math.isnan(value)
+    ]
+    if not known:
+        return [0.0] * len(values)
+    low, high = min(known), max(known)
+    span = high - low
+    result = []
+    for value in values:
+        if math.isnan(value):
+            result.append(1.0)
+            continue
+        if span <= 0:
+            result.append(0.0)
+            continue
+        scaled = (value - low) / span
+        result.append(1.0 - scaled if invert else scaled)
+    return result
+
+
+def _normalise_grouped_array(
+    values: "np.ndarray", groups: "np.ndarray", mask: Sequence[bool] | None, invert: bool
+) -> "np.ndarray":
+    """:func:`_normalise_array` applied separately to the rows of each group."""
+
+    selected = np.ones(len(values), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+    result = np.zeros(len(values))
+    for group in np.unique(groups):
+        rows = groups == group
+        result[rows] = _normalise_array(values[rows], selected[rows], invert)
+    return result
+
+
+def _normalise_grouped_list(
+    values: Sequence[float], groups: Sequence[float], mask: Sequence[bool] | None, invert: bool
+) -> List[float]:
+    result = [0.0] * len(values)
+    for group in set(groups):
+        rows = [row for row, code in enumerate(groups) if code == group]
+        normalised = _normalise_list(
+            [values[row] for row in rows], None if mask is None else [mask[row] for row in rows], invert
+        )
+        for row, value in zip(rows, normalised):
+            result[row] = value
+    return result
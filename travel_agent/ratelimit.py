@@ -0,0 +1,172 @@
+"""Client-side pacing and retry policies for upstream APIs."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Mapping, Tuple
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at *rate* tokens per second.
+
+    Callers reserve a token and are told how long to wait for it, which
+    works the same way for threads (``time.sleep``) and coroutines
+    (``asyncio.sleep``). Reservations queue up fairly: each one pushes the
+    next free slot further into the future. A :meth:`pause` stops the refill
+    until it ends, so requests queued during it resume at *rate* instead of
+    firing together.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None, *, clock: Callable[[], float] = time.monotonic) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = rate
+        self._burst = burst if burst is not None else max(rate, 1.0)
+        if self._burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._clock = clock
+        self._tokens = self._burst
+        # Time up to which tokens have been refilled; it lies in the future during a pause.
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def reserve(self, *, max_wait: float | None = None) -> float | None:
+        """Take one token and return the seconds to wait before using it.
+
+        Returns ``None`` without taking a token if the wait would exceed
+        *max_wait*.
+        """
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            wait = self._updated - now + max(0.0, (1 - self._tokens) / self._rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for *seconds*, e.g. after a ``Retry-After``."""
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            # At most one request goes out when the pause ends; the rest follow at the normal rate.
+            self._tokens = min(self._tokens, 1.0)
+            self._updated = max(self._updated, now + seconds)
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """Sustained requests per second and the size of bursts above it."""
+
+    rate: float
+    burst: float | None = None
+
+
+class RateLimiter:
+    """Token buckets per endpoint, shared by every request of a client.
+
+    *limits* maps path prefixes such as ``"/v2/shopping/flight-offers"`` to
+    their own :class:`RateLimit`; the longest matching prefix wins. Paths
+    without a specific limit share one bucket built from *default* (no
+    pacing when *default* is ``None``).
+    """
+
+    def __init__(
+        self,
+        default: RateLimit | None = RateLimit(rate=10.0),
+        limits: Mapping[str, RateLimit] | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._default = TokenBucket(default.rate, default.burst, clock=clock) if default is not None else None
+        self._buckets: Dict[str, TokenBucket] = {
+            prefix: TokenBucket(limit.rate, limit.burst, clock=clock) for prefix, limit in (limits or {}).items()
+        }
+        self._prefixes = sorted(self._buckets, key=len, reverse=True)
+
+    def bucket(self, path: str) -> TokenBucket | None:
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                return self._buckets[prefix]
+        return self._default
+
+    def reserve(self, path: str, *, max_wait: float | None = None) -> float | None:
+        """Reserve a slot for *path*; see :meth:`TokenBucket.reserve`."""
+
+        bucket = self.bucket(path)
+        return 0.0 if bucket is None else bucket.reserve(max_wait=max_wait)
+
+    def pause(self, path: str, seconds: float) -> None:
+        bucket = self.bucket(path)
+        if bucket is not None:
+            bucket.pause(seconds)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter for throttled or failing calls.
+
+    Parameters
+    ----------
+    max_attempts:
+        Total attempts per call, including the first one.
+    base_delay, max_delay:
+        The delay before attempt *n* is drawn uniformly from
+        ``[0, min(max_delay, base_delay * 2 ** n)]``.
+    retry_statuses:
+        HTTP statuses worth retrying. Connection errors are always retried.
+    deadline:
+        Overall budget in seconds for one call including retries and
+        waiting for the rate limiter; ``None`` for no budget.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    deadline: float | None = 60.0
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """Seconds to wait before retry number *attempt* (starting at 1)."""
+
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+
+    value = next((item for key, item in headers.items() if key.lower() == "retry-after"), None)
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
@@ -8,17 +8,21 @@ module should not be considered a drop-in replacement for the real library.
 
 from __future__ import annotations
 
+import asyncio
+import http.client
 import json
-import urllib.error
+import ssl
+import threading
+import time
 import urllib.parse
-import urllib.request
-from dataclasses import dataclass
-from typing import Any, Mapping, MutableMapping
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Mapping, MutableMapping
 
 __all__ = [
     "RequestException",
     "HTTPError",
     "Session",
+    "AsyncSession",
 ]
 
 
@@ -43,22 +47,107 @@ class Response:
     url: str
     status_code: int
     headers: MutableMapping[str, str]
-    _body: bytes
+    _body: bytes = b""
+    _raw: http.client.HTTPResponse | None = field(default=None, repr=False)
+    _release: Callable[[bool], None] | None = field(default=None, repr=False)
+
+    @property
+    def content(self) -> bytes:
+        if self._raw is not None:
+            self._body = b"".join(self.iter_content())
+        return self._body
 
     @property
     def text(self) -> str:
-        return self._body.decode("utf-8", errors="replace")
+        return self.content.decode("utf-8", errors="replace")
+
+    def iter_content(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yield the body in chunks without holding all of it in memory.
+
+        For streamed responses the underlying connection goes back to the
+        pool once the body is exhausted; call :meth:`close` to abandon it
+        early.
+        """
+
+        raw = self._raw
+        if raw is None:
+            if self._body:
+                yield self._body
+            return
+        try:
+            while True:
+                chunk = raw.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        except (OSError, http.client.HTTPException) as exc:
+            self._finish(reusable=False)
+            raise RequestException(str(exc)) from exc
+        self._finish(reusable=True)
+
+    def close(self) -> None:
+        """Release a streamed response, discarding any unread body."""
+
+        if self._raw is not None:
+            self._finish(reusable=False)
+
+    def __enter__(self) -> "Response":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _finish(self, *, reusable: bool) -> None:
+        raw, release = self._raw, self._release
+        self._raw = None
+        self._release = None
+        if raw is not None and not reusable:
+            raw.close()
+        if release is not None:
+            release(reusable)
 
     def json(self) -> Any:
         return json.loads(self.text)
 
     def raise_for_status(self) -> None:
         if 400 <= self.status_code:
-            raise HTTPError(self.status_code, self.text, self.url)
+            error = HTTPError(self.status_code, self.text, self.url)
+            error.response = self
+            raise error
 
 
 class Session:
-    """Extremely small subset of :class:`requests.Session`."""
+    """Extremely small subset of :class:`requests.Session` with connection pooling.
+
+    Connections are kept alive per ``(scheme, host, port)`` and reused across
+    requests, so repeated calls to the same API skip the TCP and TLS
+    handshakes. At most *pool_size* idle connections are retained per host and
+    connections idle for longer than *idle_timeout* seconds are discarded.
+
+    Up to *max_redirects* redirects are followed. Error status codes raise
+    :class:`HTTPError` by default; with ``raise_for_status=False`` they are
+    returned as regular responses and only raised by
+    :meth:`Response.raise_for_status`, which lets callers inspect the status
+    and headers (for example ``Retry-After``) before deciding what to do.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = 10,
+        idle_timeout: float = 60.0,
+        max_redirects: int = 10,
+        raise_for_status: bool = True,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.max_redirects = max_redirects
+        self.raise_for_status = raise_for_status
+        self._pools: dict[tuple[str, str, int], list[tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: ssl.SSLContext | None = None
 
     def request(
         self,
@@ -69,55 +158,123 @@ class Session:
         data: Mapping[str, Any] | bytes | bytearray | None = None,
         headers: Mapping[str, str] | None = None,
         timeout: float | None = None,
+        stream: bool = False,
     ) -> Response:
-        query = ""
-        if params:
-            serialised = {
-                key: _stringify(value)
-                for key, value in params.items()
-                if value is not None
-            }
-            query = urllib.parse.urlencode(serialised)
-        target = f"{url}?{query}" if query else url
-
-        body: bytes | None
-        if isinstance(data, (bytes, bytearray)):
-            body = bytes(data)
-        elif isinstance(data, Mapping):
-            serialised_data = {
-                key: _stringify(value)
-                for key, value in data.items()
-                if value is not None
-            }
-            body = urllib.parse.urlencode(serialised_data).encode("utf-8")
-        elif data is None:
-            body = None
+        """Send a request, reusing a pooled connection when possible.
+
+        With ``stream=True`` the body is not read up front; consume it with
+        :meth:`Response.iter_content` and close the response when done.
+        """
+
+        prepared = _prepare(method, url, params, data, headers)
+        for _ in range(self.max_redirects + 1):
+            response = self._send(prepared, timeout, stream)
+            redirect = _redirect(prepared, response.status_code, response.headers)
+            if redirect is None:
+                break
+            # Drain the redirect body so its connection goes back to the pool.
+            response.content
+            prepared = redirect
         else:
-            body = _stringify(data).encode("utf-8")
+            raise RequestException(f"Exceeded {self.max_redirects} redirects for {url}")
+        if self.raise_for_status:
+            response.raise_for_status()
+        return response
 
-        request = urllib.request.Request(
-            target,
-            data=body,
-            headers=dict(headers or {}),
-            method=method.upper(),
-        )
+    def _send(self, prepared: _PreparedRequest, timeout: float | None, stream: bool) -> Response:
+        target, body, header_map = prepared.url, prepared.body, prepared.headers
+        parts = urllib.parse.urlsplit(target)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise RequestException(f"Unsupported URL: {target}")
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
 
-        try:
-            with urllib.request.urlopen(request, timeout=timeout) as response:
-                body_bytes = response.read()
-                status = response.getcode()
-                header_map = {key: value for key, value in response.getheaders()}
-                final_url = response.geturl()
-        except urllib.error.HTTPError as exc:  # pragma: no cover - exercised in example run
-            body_bytes = exc.read()
-            status = exc.code
-            header_map = dict(exc.headers.items()) if exc.headers else {}
-            final_url = exc.geturl()
-            raise HTTPError(status, body_bytes.decode("utf-8", errors="replace"), final_url) from exc
-        except urllib.error.URLError as exc:  # pragma: no cover - exercised in example run
-            raise RequestException(str(exc)) from exc
+        while True:
+            connection, reused = self._acquire(key, timeout)
+            try:
+                connection.request(prepared.method, path, body=body, headers=header_map)
+                response = connection.getresponse()
+                body_bytes = b"" if stream else response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+                connection.close()
+                if reused:
+                    # The server closed an idle keep-alive connection; retry on a fresh one.
+                    continue
+                raise RequestException(str(exc)) from exc
+            except (OSError, http.client.HTTPException) as exc:
+                connection.close()
+                raise RequestException(str(exc)) from exc
+            break
+
+        if stream:
+
+            def release(reusable: bool) -> None:
+                if reusable and not response.will_close:
+                    self._release(key, connection)
+                else:
+                    connection.close()
+
+            return Response(target, response.status, dict(response.getheaders()), _raw=response, _release=release)
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(key, connection)
+        return Response(target, response.status, dict(response.getheaders()), body_bytes)
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
 
-        return Response(final_url, status, header_map, body_bytes)
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for idle in pools.values():
+            for connection, _ in idle:
+                connection.close()
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _acquire(
+        self, key: tuple[str, str, int], timeout: float | None
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        connection: http.client.HTTPConnection | None = None
+        with self._lock:
+            idle = self._pools.get(key, [])
+            stale = [candidate for candidate, last_used in idle if now - last_used > self.idle_timeout]
+            fresh = [(candidate, last_used) for candidate, last_used in idle if now - last_used <= self.idle_timeout]
+            if fresh:
+                # Reuse the most recently released connection, which is the least likely to be dropped.
+                connection = fresh.pop()[0]
+            self._pools[key] = fresh
+        for candidate in stale:
+            candidate.close()
+
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _release(self, key: tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._pools.setdefault(key, [])
+            if len(idle) < self.pool_size:
+                idle.append((connection, time.monotonic()))
+                return
+        connection.close()
 
     def get(
         self,
@@ -126,8 +283,9 @@ class Session:
         params: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
         timeout: float | None = None,
+        stream: bool = False,
     ) -> Response:
-        return self.request("GET", url, params=params, headers=headers, timeout=timeout)
+        return self.request("GET", url, params=params, headers=headers, timeout=timeout, stream=stream)
 
     def post(
         self,
@@ -140,6 +298,307 @@ class Session:
         return self.request("POST", url, data=data, headers=headers, timeout=timeout)
 
 
+class AsyncSession:
+    """Asyncio counterpart of :class:`Session` built on :mod:`asyncio` streams.
+
+    Any number of requests can be in flight on a single event loop without
+    blocking it; each uses its own connection. Connections are kept alive per
+    ``(scheme, host, port)`` and reused by later requests on the same loop, at
+    most *pool_size* idle ones per host and none idle for longer than
+    *idle_timeout* seconds. Redirects and error status codes are handled as
+    in :class:`Session`.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = 100,
+        idle_timeout: float = 60.0,
+        max_redirects: int = 10,
+        raise_for_status: bool = True,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.max_redirects = max_redirects
+        self.raise_for_status = raise_for_status
+        self._pools: dict[tuple[str, str, int], list[_IdleStream]] = {}
+        self._ssl_context: ssl.SSLContext | None = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        data: Mapping[str, Any] | bytes | bytearray | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> Response:
+        prepared = _prepare(method, url, params, data, headers)
+        try:
+            response = await asyncio.wait_for(self._follow(prepared), timeout)
+        except asyncio.TimeoutError as exc:
+            raise RequestException(f"Request to {prepared.url} timed out") from exc
+        except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+            raise RequestException(str(exc)) from exc
+        if self.raise_for_status:
+            response.raise_for_status()
+        return response
+
+    async def get(
+        self,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> Response:
+        return await self.request("GET", url, params=params, headers=headers, timeout=timeout)
+
+    async def post(
+        self,
+        url: str,
+        *,
+        data: Mapping[str, Any] | bytes | bytearray | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> Response:
+        return await self.request("POST", url, data=data, headers=headers, timeout=timeout)
+
+    async def close(self) -> None:
+        """Close every idle pooled connection."""
+
+        pools, self._pools = self._pools, {}
+        for idle in pools.values():
+            for stream in idle:
+                await _close_writer(stream.writer)
+
+    async def __aenter__(self) -> "AsyncSession":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _follow(self, prepared: _PreparedRequest) -> Response:
+        for _ in range(self.max_redirects + 1):
+            response = await self._send(prepared)
+            redirect = _redirect(prepared, response.status_code, response.headers)
+            if redirect is None:
+                return response
+            prepared = redirect
+        raise RequestException(f"Exceeded {self.max_redirects} redirects for {prepared.url}")
+
+    async def _send(self, prepared: _PreparedRequest) -> Response:
+        target, body = prepared.url, prepared.body
+        parts = urllib.parse.urlsplit(target)
+        secure = parts.scheme == "https"
+        key = (parts.scheme, parts.hostname or "", parts.port or (443 if secure else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        lines = [f"{prepared.method} {path} HTTP/1.1", f"Host: {parts.netloc}"]
+        lines.extend(f"{key}: {value}" for key, value in prepared.headers.items())
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        request_head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        while True:
+            reader, writer, reused = await self._acquire(key)
+            try:
+                writer.write(request_head)
+                if body is not None:
+                    writer.write(body)
+                await writer.drain()
+                status_line = (await reader.readline()).decode("latin-1").strip()
+                if not status_line and reused:
+                    # The server closed an idle keep-alive connection; retry on a fresh one.
+                    await _close_writer(writer)
+                    continue
+                try:
+                    status = int(status_line.split()[1])
+                except (IndexError, ValueError) as exc:
+                    raise ValueError(f"Malformed status line: {status_line!r}") from exc
+                header_map: dict[str, str] = {}
+                while True:
+                    line = (await reader.readline()).decode("latin-1").strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    header_map[name.strip()] = value.strip()
+                body_bytes = await _read_body(reader, header_map)
+            except (ConnectionResetError, BrokenPipeError) as exc:
+                await _close_writer(writer)
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                # Includes cancellation by a timeout: the connection is mid-response and cannot be reused.
+                await _close_writer(writer)
+                raise
+            break
+
+        if _keeps_alive(header_map) and not reader.at_eof():
+            self._release(key, reader, writer)
+        else:
+            await _close_writer(writer)
+        return Response(target, status, header_map, body_bytes)
+
+    async def _acquire(
+        self, key: tuple[str, str, int]
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        now = time.monotonic()
+        loop = asyncio.get_running_loop()
+        idle = self._pools.get(key, [])
+        while idle:
+            stream = idle.pop()
+            # Streams belong to the loop that opened them; connections from an earlier loop are dropped.
+            if stream.loop is loop and now - stream.last_used <= self.idle_timeout and not stream.reader.at_eof():
+                return stream.reader, stream.writer, True
+            if stream.loop is loop:
+                await _close_writer(stream.writer)
+
+        scheme, host, port = key
+        ssl_context = None
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            ssl_context = self._ssl_context
+        reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        return reader, writer, False
+
+    def _release(self, key: tuple[str, str, int], reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        idle = self._pools.setdefault(key, [])
+        if len(idle) < self.pool_size:
+            idle.append(_IdleStream(reader, writer, asyncio.get_running_loop(), time.monotonic()))
+        else:
+            writer.close()
+
+
+@dataclass
+class _IdleStream:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    loop: asyncio.AbstractEventLoop
+    last_used: float
+
+
+def _keeps_alive(headers: Mapping[str, str]) -> bool:
+    lowered = {key.lower(): value.lower() for key, value in headers.items()}
+    if lowered.get("connection") == "close":
+        return False
+    # Without a length or chunked framing the body ends when the server closes the connection.
+    return "content-length" in lowered or lowered.get("transfer-encoding") == "chunked"
+
+
+async def _close_writer(writer: asyncio.StreamWriter) -> None:
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (OSError, RuntimeError):  # pragma: no cover - peer already gone or loop closed
+        pass
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Mapping[str, str]) -> bytes:
+    lowered = {key.lower(): value for key, value in headers.items()}
+    if lowered.get("transfer-encoding", "").lower() == "chunked":
+        chunks: list[bytes] = []
+        while True:
+            size_line = (await reader.readline()).split(b";", 1)[0].strip()
+            size = int(size_line or b"0", 16)
+            if size == 0:
+                # Consume optional trailers up to the terminating blank line.
+                while (await reader.readline()).strip():
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+    if "content-length" in lowered:
+        return await reader.readexactly(int(lowered["content-length"]))
+    return await reader.read()
+
+
+@dataclass(slots=True)
+class _PreparedRequest:
+    method: str
+    url: str
+    body: bytes | None
+    headers: dict[str, str]
+
+
+def _prepare(
+    method: str,
+    url: str,
+    params: Mapping[str, Any] | None,
+    data: Mapping[str, Any] | bytes | bytearray | None,
+    headers: Mapping[str, str] | None,
+) -> _PreparedRequest:
+    """Build the target URL, body and headers shared by :class:`Session` and :class:`AsyncSession`."""
+
+    header_map = dict(headers or {})
+    if isinstance(data, Mapping) and not any(key.lower() == "content-type" for key in header_map):
+        header_map["Content-Type"] = "application/x-www-form-urlencoded"
+    return _PreparedRequest(method.upper(), _build_target(url, params), _encode_body(data), header_map)
+
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+def _redirect(prepared: _PreparedRequest, status: int, headers: Mapping[str, str]) -> _PreparedRequest | None:
+    """Return the request to send next when *status* redirects, else ``None``.
+
+    As browsers do, 303 responses (and 301/302 responses to a POST) are
+    followed with a body-less GET. The ``Authorization`` header is dropped
+    when the redirect leaves the original host.
+    """
+
+    if status not in _REDIRECT_STATUSES:
+        return None
+    location = next((value for key, value in headers.items() if key.lower() == "location"), None)
+    if not location:
+        return None
+    target = urllib.parse.urljoin(prepared.url, location)
+    method, body, header_map = prepared.method, prepared.body, dict(prepared.headers)
+    if (status == 303 and method != "HEAD") or (status in (301, 302) and method == "POST"):
+        method, body = "GET", None
+        header_map = {
+            key: value
+            for key, value in header_map.items()
+            if key.lower() not in ("content-type", "content-length")
+        }
+    if urllib.parse.urlsplit(target).hostname != urllib.parse.urlsplit(prepared.url).hostname:
+        header_map = {key: value for key, value in header_map.items() if key.lower() != "authorization"}
+    return _PreparedRequest(method, target, body, header_map)
+
+
+def _build_target(url: str, params: Mapping[str, Any] | None) -> str:
+    if not params:
+        return url
+    serialised = {
+        key: _stringify(value)
+        for key, value in params.items()
+        if value is not None
+    }
+    query = urllib.parse.urlencode(serialised)
+    return f"{url}?{query}" if query else url
+
+
+def _encode_body(data: Mapping[str, Any] | bytes | bytearray | None) -> bytes | None:
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data)
+    if isinstance(data, Mapping):
+        serialised_data = {
+            key: _stringify(value)
+            for key, value in data.items()
+            if value is not None
+        }
+        return urllib.parse.urlencode(serialised_data).encode("utf-8")
+    if data is None:
+        return None
+    return _stringify(data).encode("utf-8")
+
+
 def _stringify(value: Any) -> str:
     if isinstance(value, bool):
         return "true" if value else "false"
@@ -0,0 +1,159 @@
+"""Circuit breaking, hedging and stale-response helpers for upstream clients."""
+
+from __future__ import annotations
+
+import enum
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, TypeVar
+
+_T = TypeVar("_T")
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(slots=True)
+class ResilienceStats:
+    """Counters for tuning hedging and circuit breaking."""
+
+    requests: int = 0
+    hedges_sent: int = 0
+    hedge_wins: int = 0
+    circuit_opens: int = 0
+    short_circuited: int = 0
+    stale_served: int = 0
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After *failure_threshold* failures in a row the circuit opens and
+    :meth:`allow` rejects calls for *recovery_time* seconds. It then lets a
+    single probe through (half-open): a success closes the circuit, a failure
+    opens it again.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self._threshold = failure_threshold
+        self._recovery_time = recovery_time
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.opens = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self._recovery_time:
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Return whether a call may go upstream now."""
+
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.OPEN:
+                if self._clock() - self._opened_at < self._recovery_time:
+                    return False
+                self._state = CircuitState.HALF_OPEN
+                self._probing = False
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def release(self) -> None:
+        """End a call that neither succeeded nor failed upstream, e.g. one that was cancelled.
+
+        Nothing is counted, but a half-open circuit lets the next probe through.
+        """
+
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; return ``True`` if it opened the circuit."""
+
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._state is CircuitState.HALF_OPEN or self._failures >= self._threshold:
+                opened = self._state is not CircuitState.OPEN
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+                if opened:
+                    self.opens += 1
+                return opened
+            return False
+
+
+class CircuitBreakers:
+    """Lazily created :class:`CircuitBreaker` per endpoint path."""
+
+    def __init__(self, *, failure_threshold: int = 5, recovery_time: float = 30.0) -> None:
+        self._failure_threshold = failure_threshold
+        self._recovery_time = recovery_time
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def for_path(self, path: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(path)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    failure_threshold=self._failure_threshold, recovery_time=self._recovery_time
+                )
+                self._breakers[path] = breaker
+            return breaker
+
+    def states(self) -> Dict[str, CircuitState]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {path: breaker.state for path, breaker in breakers.items()}
+
+
+class StaleStore(Generic[_T]):
+    """Bounded LRU map of the last good response per request key."""
+
+    def __init__(self, capacity: int = 256) -> None:
+        self._capacity = capacity
+        self._entries: OrderedDict[Hashable, _T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, key: Hashable, value: _T) -> None:
+        if self._capacity <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+
+    def get(self, key: Hashable) -> _T | None:
+        with self._lock:
+            return self._entries.get(key)
@@ -0,0 +1,282 @@
+"""Central scheduler that polls many flight and hotel watches from one queue."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from changes import OfferChangeDetector, OfferEvent, notable_offers
+from flights import FlightMonitor
+from hotels import HotelMonitor
+from models import FlightOffer, FlightPreference, HotelOffer, HotelPreference, TripRequest
+
+
+@dataclass(slots=True)
+class WatchStats:
+    """Counters describing how a single watch has been serviced."""
+
+    runs: int = 0
+    failures: int = 0
+    offers_delivered: int = 0
+    last_run: float | None = None
+    last_duration: float | None = None
+    last_lag: float | None = None
+    last_error: str | None = None
+
+
+@dataclass(slots=True)
+class Watch:
+    """A registered flight or hotel watch."""
+
+    watch_id: str
+    kind: str
+    request: TripRequest
+    preference: Union[FlightPreference, HotelPreference]
+    interval_seconds: float
+    detector: OfferChangeDetector[object]
+    callback: Callable[[Sequence[object]], None] | None = None
+    on_event: Callable[[Sequence[OfferEvent[object]]], None] | None = None
+    stats: WatchStats = field(default_factory=WatchStats)
+    next_run: float = 0.0
+
+
+class MonitorScheduler:
+    """Run thousands of watches from one deadline-ordered priority queue.
+
+    Instead of one coroutine and one ``asyncio.sleep`` per watch, every watch
+    is an entry in a single heap keyed on its next deadline. :meth:`run`
+    dispatches due watches to a fixed pool of worker coroutines, which poll
+    the monitor, report offer changes through each watch's bounded
+    :class:`~changes.OfferChangeDetector` and reschedule the watch. Watches
+    may be added or removed while the scheduler is running; these methods
+    must be called from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        flight_monitor: FlightMonitor | None = None,
+        hotel_monitor: HotelMonitor | None = None,
+        *,
+        workers: int = 16,
+        detector_capacity: int = 1_000,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._flight_monitor = flight_monitor
+        self._hotel_monitor = hotel_monitor
+        self._workers = workers
+        self._detector_capacity = detector_capacity
+        self._watches: Dict[str, Watch] = {}
+        self._heap: List[Tuple[float, int, Watch]] = []
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._running = False
+
+    @classmethod
+    def from_agent(cls, agent: object, *, workers: int = 16) -> "MonitorScheduler":
+        """Create a scheduler reusing the monitors of a :class:`TravelAgent`."""
+
+        return cls(agent.flight_monitor, agent.hotel_monitor, workers=workers)  # type: ignore[attr-defined]
+
+    def add_flight_watch(
+        self,
+        request: TripRequest,
+        preference: FlightPreference,
+        *,
+        interval_seconds: float = 3600,
+        callback: Callable[[Sequence[FlightOffer]], None] | None = None,
+        on_event: Callable[[Sequence[OfferEvent[FlightOffer]]], None] | None = None,
+        detector: OfferChangeDetector[FlightOffer] | None = None,
+        delay_seconds: float = 0.0,
+        watch_id: str | None = None,
+    ) -> str:
+        """Register a flight watch and return its identifier."""
+
+        if self._flight_monitor is None:
+            raise ValueError("No flight monitor configured for this scheduler")
+        return self._add(
+            "flight",
+            request,
+            preference,
+            interval_seconds,
+            callback,
+            on_event,
+            detector if detector is not None else OfferChangeDetector.for_flights(capacity=self._detector_capacity),
+            delay_seconds,
+            watch_id,
+        )
+
+    def add_hotel_watch(
+        self,
+        request: TripRequest,
+        preference: HotelPreference,
+        *,
+        interval_seconds: float = 3600,
+        callback: Callable[[Sequence[HotelOffer]], None] | None = None,
+        on_event: Callable[[Sequence[OfferEvent[HotelOffer]]], None] | None = None,
+        detector: OfferChangeDetector[HotelOffer] | None = None,
+        delay_seconds: float = 0.0,
+        watch_id: str | None = None,
+    ) -> str:
+        """Register a hotel watch and return its identifier."""
+
+        if self._hotel_monitor is None:
+            raise ValueError("No hotel monitor configured for this scheduler")
+        return self._add(
+            "hotel",
+            request,
+            preference,
+            interval_seconds,
+            callback,
+            on_event,
+            detector if detector is not None else OfferChangeDetector.for_hotels(capacity=self._detector_capacity),
+            delay_seconds,
+            watch_id,
+        )
+
+    def remove_watch(self, watch_id: str) -> bool:
+        """Unregister a watch. Returns ``False`` if it was not registered."""
+
+        # The heap entry is discarded lazily when it reaches the top.
+        return self._watches.pop(watch_id, None) is not None
+
+    def stats(self, watch_id: str) -> WatchStats:
+        """Return the live statistics of a watch."""
+
+        try:
+            return self._watches[watch_id].stats
+        except KeyError as exc:
+            raise KeyError(f"Unknown watch: {watch_id}") from exc
+
+    def watches(self) -> List[Watch]:
+        """Return a snapshot of the registered watches."""
+
+        return list(self._watches.values())
+
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    async def run(self) -> None:
+        """Dispatch due watches until :meth:`stop` is called."""
+
+        if self._running:
+            raise RuntimeError("MonitorScheduler is already running")
+        self._running = True
+        self._wakeup = asyncio.Event()
+        queue: asyncio.Queue[Watch] = asyncio.Queue(maxsize=self._workers)
+        workers = [asyncio.create_task(self._worker(queue)) for _ in range(self._workers)]
+        try:
+            while self._running:
+                self._wakeup.clear()
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, watch = heapq.heappop(self._heap)
+                    # Entries of removed watches linger in the heap; a watch re-added under the
+                    # same id is a different object with its own entry.
+                    if self._watches.get(watch.watch_id) is not watch:
+                        continue
+                    # Blocks while every worker is busy, which naturally applies backpressure.
+                    await queue.put(watch)
+                timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._running = False
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def stop(self) -> None:
+        """Ask :meth:`run` to return once the current dispatch step finishes."""
+
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _add(
+        self,
+        kind: str,
+        request: TripRequest,
+        preference: Union[FlightPreference, HotelPreference],
+        interval_seconds: float,
+        callback: Callable[[Sequence[object]], None] | None,
+        on_event: Callable[[Sequence[OfferEvent[object]]], None] | None,
+        detector: OfferChangeDetector[object],
+        delay_seconds: float,
+        watch_id: str | None,
+    ) -> str:
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        identifier = watch_id or f"{kind}-{next(self._sequence)}"
+        if identifier in self._watches:
+            raise ValueError(f"Watch already registered: {identifier}")
+        watch = Watch(
+            watch_id=identifier,
+            kind=kind,
+            request=request,
+            preference=preference,
+            interval_seconds=interval_seconds,
+            detector=detector,
+            callback=callback,
+            on_event=on_event,
+            next_run=time.monotonic() + delay_seconds,
+        )
+        self._watches[identifier] = watch
+        self._schedule(watch)
+        return identifier
+
+    def _schedule(self, watch: Watch) -> None:
+        entry = (watch.next_run, next(self._sequence), watch)
+        heapq.heappush(self._heap, entry)
+        # Only an earlier deadline than the one the dispatcher sleeps on needs to wake it.
+        if self._wakeup is not None and self._heap[0] is entry:
+            self._wakeup.set()
+
+    async def _worker(self, queue: "asyncio.Queue[Watch]") -> None:
+        while True:
+            watch = await queue.get()
+            try:
+                await self._run_watch(watch)
+            finally:
+                queue.task_done()
+
+    async def _run_watch(self, watch: Watch) -> None:
+        if self._watches.get(watch.watch_id) is not watch:
+            return
+        started = time.monotonic()
+        stats = watch.stats
+        stats.last_lag = max(started - watch.next_run, 0.0)
+        try:
+            if watch.kind == "flight":
+                offers: Sequence[FlightOffer | HotelOffer] = await self._flight_monitor.find_best_flights_async(  # type: ignore[union-attr]
+                    watch.request, watch.preference  # type: ignore[arg-type]
+                )
+            else:
+                offers = await self._hotel_monitor.find_best_hotels_async(  # type: ignore[union-attr]
+                    watch.request, watch.preference  # type: ignore[arg-type]
+                )
+            events = watch.detector.diff(offers)
+            if events and watch.on_event:
+                watch.on_event(tuple(events))
+            fresh = notable_offers(events)
+            if fresh and watch.callback:
+                watch.callback(fresh)
+            stats.offers_delivered += len(fresh)
+            stats.last_error = None
+        except Exception as exc:  # noqa: BLE001 - one failing watch must not stop the others
+            stats.failures += 1
+            stats.last_error = f"{type(exc).__name__}: {exc}"
+        finally:
+            finished = time.monotonic()
+            stats.runs += 1
+            stats.last_run = time.time()
+            stats.last_duration = finished - started
+        if self._watches.get(watch.watch_id) is watch:
+            watch.next_run = started + watch.interval_seconds
+            self._schedule(watch)
@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
 from abc import ABC, abstractmethod
-from typing import Iterable, Mapping, Sequence
+from concurrent.futures import Executor
+from typing import Callable, Iterable, Iterator, Mapping, Sequence, TypeVar, Union
+
+from models import FlightOffer, HotelOffer
+
+_T = TypeVar("_T")
 
 
 class SearchProvider(ABC):
@@ -40,6 +48,26 @@ class HotelSearchProvider(ABC):
         """Return hotel offers with flexible pricing options."""
 
 
+class StreamingFlightSearchProvider(FlightSearchProvider):
+    """Flight provider that can also yield parsed offers incrementally."""
+
+    @abstractmethod
+    def iter_flight_offers(self, *, origin: str, destination: str, departure_date: str, return_date: str | None,
+                           travelers: int, cabin: str | None, max_stops: int | None,
+                           loyalty_programs: Sequence[str]) -> Iterator[FlightOffer]:
+        """Yield offers as they are decoded from the upstream response."""
+
+
+class StreamingHotelSearchProvider(HotelSearchProvider):
+    """Hotel provider that can also yield parsed offers incrementally."""
+
+    @abstractmethod
+    def iter_hotel_offers(self, *, destination: str, check_in: str, check_out: str,
+                          travelers: int, neighborhoods: Sequence[str], amenities: Sequence[str],
+                          loyalty_programs: Sequence[str]) -> Iterator[HotelOffer]:
+        """Yield offers as they are decoded from the upstream response."""
+
+
 class CompositeSearchProvider(SearchProvider, FlightSearchProvider, HotelSearchProvider):
     """Convenience class for providers implementing all search interfaces."""
 
@@ -140,3 +168,142 @@ class InMemorySearchProvider(CompositeSearchProvider):
                       loyalty_programs: Sequence[str]) -> Sequence[Mapping[str, object]]:
         del destination, check_in, check_out, travelers, neighborhoods, amenities, loyalty_programs
         return tuple(self._hotels)
+
+
+class AsyncSearchProvider(ABC):
+    """Asyncio counterpart of :class:`SearchProvider`."""
+
+    @abstractmethod
+    async def search(
+        self, query: str, *, filters: Mapping[str, object] | None = None
+    ) -> Sequence[Mapping[str, object]]:
+        """Execute a generic search query without blocking the event loop."""
+
+
+class AsyncFlightSearchProvider(ABC):
+    """Asyncio counterpart of :class:`FlightSearchProvider`."""
+
+    @abstractmethod
+    async def search_flights(self, *, origin: str, destination: str, departure_date: str, return_date: str | None,
+                             travelers: int, cabin: str | None, max_stops: int | None,
+                             loyalty_programs: Sequence[str]) -> Sequence[Mapping[str, object]]:
+        """Return flight offers including cash and loyalty pricing."""
+
+
+class AsyncHotelSearchProvider(ABC):
+    """Asyncio counterpart of :class:`HotelSearchProvider`."""
+
+    @abstractmethod
+    async def search_hotels(self, *, destination: str, check_in: str, check_out: str,
+                            travelers: int, neighborhoods: Sequence[str], amenities: Sequence[str],
+                            loyalty_programs: Sequence[str]) -> Sequence[Mapping[str, object]]:
+        """Return hotel offers with flexible pricing options."""
+
+
+class AsyncCompositeSearchProvider(AsyncSearchProvider, AsyncFlightSearchProvider, AsyncHotelSearchProvider):
+    """Convenience class for async providers implementing all search interfaces."""
+
+    pass
+
+
+class AsyncSearchProviderAdapter(AsyncCompositeSearchProvider):
+    """Expose a synchronous provider through the async interfaces.
+
+    Every call is executed on *executor* (the event loop's default executor
+    when omitted) so that blocking HTTP round trips do not stall the loop.
+    Only the methods implemented by the wrapped provider may be awaited.
+    """
+
+    def __init__(
+        self,
+        provider: SearchProvider | FlightSearchProvider | HotelSearchProvider,
+        *,
+        executor: Executor | None = None,
+    ) -> None:
+        self._provider = provider
+        self._executor = executor
+
+    @property
+    def provider(self) -> SearchProvider | FlightSearchProvider | HotelSearchProvider:
+        return self._provider
+
+    async def search(
+        self, query: str, *, filters: Mapping[str, object] | None = None
+    ) -> Sequence[Mapping[str, object]]:
+        return await self._run(self._provider.search, query, filters=filters)  # type: ignore[union-attr]
+
+    async def search_flights(
+        self,
+        *,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: str | None,
+        travelers: int,
+        cabin: str | None,
+        max_stops: int | None,
+        loyalty_programs: Sequence[str],
+    ) -> Sequence[Mapping[str, object]]:
+        return await self._run(
+            self._provider.search_flights,  # type: ignore[union-attr]
+            origin=origin,
+            destination=destination,
+            departure_date=departure_date,
+            return_date=return_date,
+            travelers=travelers,
+            cabin=cabin,
+            max_stops=max_stops,
+            loyalty_programs=loyalty_programs,
+        )
+
+    async def search_hotels(
+        self,
+        *,
+        destination: str,
+        check_in: str,
+        check_out: str,
+        travelers: int,
+        neighborhoods: Sequence[str],
+        amenities: Sequence[str],
+        loyalty_programs: Sequence[str],
+    ) -> Sequence[Mapping[str, object]]:
+        return await self._run(
+            self._provider.search_hotels,  # type: ignore[union-attr]
+            destination=destination,
+            check_in=check_in,
+            check_out=check_out,
+            travelers=travelers,
+            neighborhoods=neighborhoods,
+            amenities=amenities,
+            loyalty_programs=loyalty_programs,
+        )
+
+    async def _run(self, func: Callable[..., _T], *args: object, **kwargs: object) -> _T:
+        loop = asyncio.get_running_loop()
+        # Run in a copy of the caller's context so that context variables (e.g. tracing spans) carry over.
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+
+AnySearchProvider = Union[
+    SearchProvider,
+    FlightSearchProvider,
+    HotelSearchProvider,
+    AsyncSearchProvider,
+    AsyncFlightSearchProvider,
+    AsyncHotelSearchProvider,
+]
+"""Type alias for any provider accepted by the agent components."""
+
+
+def as_async_provider(provider: AnySearchProvider, *, executor: Executor | None = None) -> AsyncCompositeSearchProvider:
+    """Return *provider* as an async provider, wrapping synchronous ones.
+
+    Providers that already implement one of the async interfaces are returned
+    unchanged; synchronous providers are wrapped in an
+    :class:`AsyncSearchProviderAdapter` bound to *executor*.
+    """
+
+    if isinstance(provider, (AsyncSearchProvider, AsyncFlightSearchProvider, AsyncHotelSearchProvider)):
+        return provider  # type: ignore[return-value]
+    return AsyncSearchProviderAdapter(provider, executor=executor)
@@ -0,0 +1,109 @@
+"""Collapse concurrent identical calls into a single upstream request."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True)
+class SingleFlightStats:
+    """Counters describing how many calls were coalesced."""
+
+    calls: int = 0
+    executions: int = 0
+
+    @property
+    def shared(self) -> int:
+        return self.calls - self.executions
+
+
+@dataclass(slots=True)
+class _Call(Generic[_T]):
+    done: threading.Event = field(default_factory=threading.Event)
+    result: _T | None = None
+    error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-safe single-flight group.
+
+    While a call for *key* is running, further :meth:`do` calls with the same
+    key block until it finishes and receive the same result, or the same
+    exception, instead of running *func* again. Nothing is cached once the
+    call completes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call[object]] = {}
+        self._stats = SingleFlightStats()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(calls=self._stats.calls, executions=self._stats.executions)
+
+    def do(self, key: Hashable, func: Callable[[], _T]) -> _T:
+        with self._lock:
+            self._stats.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._stats.executions += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result  # type: ignore[return-value]
+
+
+class AsyncSingleFlight:
+    """Asyncio single-flight group.
+
+    The first caller for a key starts *func* as a task; later callers await
+    the same task. Cancelling one waiter does not cancel the shared call.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future[object]] = {}
+        self._stats = SingleFlightStats()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(calls=self._stats.calls, executions=self._stats.executions)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[_T]]) -> _T:
+        self._stats.calls += 1
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            self._stats.executions += 1
+            task.add_done_callback(lambda finished: self._finish(key, finished))
+        return await asyncio.shield(task)  # type: ignore[return-value]
+
+    def _finish(self, key: Hashable, task: asyncio.Future[object]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled.
+            task.exception()
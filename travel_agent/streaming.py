@@ -0,0 +1,119 @@
+"""Incremental parsing of large JSON API responses."""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]}"
+_COMPACT_THRESHOLD = 64 * 1024
+
+
+class _Buffer:
+    """Text buffer fed from an iterable of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read at least as much new text as is currently unparsed.
+
+        Growing geometrically keeps re-parsing of a value that straddles
+        chunk boundaries linear overall.
+        """
+
+        if self.eof:
+            return False
+        if self.pos > _COMPACT_THRESHOLD:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        wanted = max(len(self.text) - self.pos, 1)
+        parts = [self.text]
+        added = 0
+        while added < wanted:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                parts.append(self._decoder.decode(b"", final=True))
+                self.eof = True
+                break
+            piece = self._decoder.decode(chunk)
+            parts.append(piece)
+            added += len(piece)
+        self.text = "".join(parts)
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at end of input)."""
+
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, *characters: str) -> str:
+        char = self.peek()
+        if char not in characters:
+            raise ValueError(f"Expected one of {characters!r} at offset {self.pos}, found {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self, decoder: json.JSONDecoder) -> object:
+        """Decode the next complete JSON value."""
+
+        self.peek()
+        while True:
+            try:
+                result, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number or literal is only complete once a delimiter follows it;
+            # "12" or "1." at the buffer edge may continue in the next chunk.
+            if self.text[self.pos] not in '{["' and not self.eof:
+                if end == len(self.text) or self.text[end] not in _DELIMITERS:
+                    self.fill()
+                    continue
+            self.pos = end
+            return result
+
+
+def iter_json_array(chunks: Iterable[bytes], *, key: str = "data") -> Iterator[object]:
+    """Yield the items of the array stored under *key* in a JSON object.
+
+    *chunks* is consumed lazily (for example from
+    :meth:`requests.Response.iter_content`), so only the item being decoded
+    and a small read-ahead window are held in memory. Other top-level members
+    are skipped; parsing stops once the array has been read. Nothing is
+    yielded if the document has no such member or it is ``null``.
+    """
+
+    decoder = json.JSONDecoder()
+    buffer = _Buffer(chunks)
+    buffer.expect("{")
+    if buffer.peek() == "}":
+        return
+    while True:
+        name = buffer.value(decoder)
+        buffer.expect(":")
+        if name == key and buffer.peek() == "[":
+            buffer.expect("[")
+            if buffer.peek() == "]":
+                return
+            while True:
+                yield buffer.value(decoder)
+                if buffer.expect(",", "]") == "]":
+                    return
+        buffer.value(decoder)
+        if buffer.expect(",", "}") == "}":
+            return
@@ -0,0 +1,489 @@
+"""Local stand-in for the Amadeus API for examples, benchmarks and load tests.
+
+:class:`StubAmadeusServer` answers the token, flight, hotel and location
+endpoints from a thread per connection (HTTP/1.1 keep-alive, so client
+connection pooling is exercised). Each endpoint's latency, payload and
+fault rates can be configured, tokens expire like real ones, and
+:attr:`StubAmadeusServer.stats` counts what was served::
+
+    with StubAmadeusServer(seed=1) as stub:
+        stub.configure(
+            "/v2/shopping/flight-offers",
+            EndpointBehavior(
+                payload=synthetic_flight_offers(5000),
+                latency=lognormal_latency(0.08, 0.5),
+                faults={429: 0.05, 503: 0.01},
+            ),
+        )
+        provider = AmadeusSearchProvider(AmadeusConfig("id", "secret", hostname=stub.base_url))
+        ...
+        assert stub.stats.statuses[429] > 0
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Mapping, Union
+from urllib.parse import parse_qsl, urlsplit
+
+TOKEN_PATH = "/v1/security/oauth2/token"
+FLIGHT_OFFERS_PATH = "/v2/shopping/flight-offers"
+HOTEL_OFFERS_PATH = "/v2/shopping/hotel-offers"
+LOCATIONS_PATH = "/v1/reference-data/locations"
+
+Latency = Callable[[random.Random], float]
+"""Draws one response delay in seconds."""
+
+Payload = Union[Mapping[str, object], bytes, Callable[[Mapping[str, str]], Union[Mapping[str, object], bytes]]]
+"""A JSON document, pre-encoded bytes, or a callable building either from the query parameters."""
+
+
+def fixed_latency(seconds: float) -> Latency:
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> Latency:
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, p99: float) -> Latency:
+    """Long-tailed delays with the given median and 99th percentile."""
+
+    if not 0 < median <= p99:
+        raise ValueError("expected 0 < median <= p99")
+    sigma = math.log(p99 / median) / 2.326
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+
+@dataclass(slots=True)
+class EndpointBehavior:
+    """How the stub answers one endpoint.
+
+    Parameters
+    ----------
+    payload:
+        Body of successful responses. Mappings are encoded once up front;
+        callables receive the query parameters on every request.
+    latency:
+        Delay before each response, e.g. :func:`lognormal_latency`.
+    faults:
+        Probability of answering with a given status instead, e.g.
+        ``{401: 0.01, 429: 0.05, 503: 0.02}``.
+    retry_after:
+        ``Retry-After`` seconds sent with injected 429 and 503 responses.
+    authenticated:
+        Whether requests need a valid bearer token, as the Amadeus API does.
+    """
+
+    payload: Payload = field(default_factory=lambda: {"data": []})
+    latency: Latency | None = None
+    faults: Mapping[int, float] = field(default_factory=dict)
+    retry_after: float | None = None
+    authenticated: bool = True
+
+
+@dataclass(slots=True)
+class StubStats:
+    """What the stub has served since it started or was last reset."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    statuses: Counter[int] = field(default_factory=Counter)
+    injected: Counter[int] = field(default_factory=Counter)
+    tokens_issued: int = 0
+    bytes_sent: int = 0
+
+
+class StubAmadeusServer:
+    """Threaded local Amadeus stand-in with latency and fault injection.
+
+    Parameters
+    ----------
+    endpoints:
+        Behaviour per path prefix; unconfigured Amadeus paths serve small
+        canned payloads.
+    token_ttl:
+        ``expires_in`` advertised for issued tokens.
+    token_valid_for:
+        Seconds after which the server rejects a token with 401; defaults to
+        *token_ttl*. Set it lower to simulate tokens revoked before expiry.
+    seed:
+        Seed for latency and fault draws, for reproducible runs.
+    """
+
+    def __init__(
+        self,
+        endpoints: Mapping[str, EndpointBehavior] | None = None,
+        *,
+        token_ttl: float = 1800.0,
+        token_valid_for: float | None = None,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.token_ttl = token_ttl
+        self.token_valid_for = token_valid_for if token_valid_for is not None else token_ttl
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointBehavior] = {}
+        self._encoded: Dict[str, bytes] = {}
+        self._tokens: Dict[str, float] = {}
+        self._token_ids = itertools.count(1)
+        self._stats = StubStats()
+        for path, behavior in default_endpoints().items():
+            self.configure(path, behavior)
+        for path, behavior in (endpoints or {}).items():
+            self.configure(path, behavior)
+        self._server = ThreadingHTTPServer((host, port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self  # type: ignore[attr-defined]
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self) -> StubStats:
+        with self._lock:
+            return StubStats(
+                requests=Counter(self._stats.requests),
+                statuses=Counter(self._stats.statuses),
+                injected=Counter(self._stats.injected),
+                tokens_issued=self._stats.tokens_issued,
+                bytes_sent=self._stats.bytes_sent,
+            )
+
+    def start(self) -> "StubAmadeusServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="stub-amadeus", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "StubAmadeusServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def configure(self, path: str, behavior: EndpointBehavior) -> None:
+        """Set the behaviour of every path starting with *path*."""
+
+        encoded = _encode(behavior.payload) if not callable(behavior.payload) else None
+        with self._lock:
+            self._endpoints[path] = behavior
+            if encoded is None:
+                self._encoded.pop(path, None)
+            else:
+                self._encoded[path] = encoded
+
+    def serve(self, path: str, payload: Payload) -> None:
+        """Replace the payload of *path*, keeping its latency and faults."""
+
+        with self._lock:
+            current = self._endpoints.get(path, EndpointBehavior())
+        self.configure(
+            path,
+            EndpointBehavior(
+                payload=payload,
+                latency=current.latency,
+                faults=current.faults,
+                retry_after=current.retry_after,
+                authenticated=current.authenticated,
+            ),
+        )
+
+    def revoke_tokens(self) -> None:
+        """Reject every token issued so far, as after a credential rotation."""
+
+        with self._lock:
+            self._tokens.clear()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = StubStats()
+
+    def _issue_token(self) -> Mapping[str, object]:
+        with self._lock:
+            value = f"stub-token-{next(self._token_ids)}"
+            self._tokens[value] = time.monotonic() + self.token_valid_for
+            self._stats.tokens_issued += 1
+        return {"access_token": value, "token_type": "Bearer", "expires_in": self.token_ttl}
+
+    def _token_is_valid(self, authorization: str | None) -> bool:
+        if not authorization or not authorization.startswith("Bearer "):
+            return False
+        with self._lock:
+            expires_at = self._tokens.get(authorization[len("Bearer "):])
+        return expires_at is not None and expires_at > time.monotonic()
+
+    def _resolve(self, path: str) -> tuple[str, EndpointBehavior, bytes | None] | None:
+        with self._lock:
+            prefix = max((prefix for prefix in self._endpoints if path.startswith(prefix)), key=len, default=None)
+            if prefix is None:
+                return None
+            return prefix, self._endpoints[prefix], self._encoded.get(prefix)
+
+    def _draw(self, behavior: EndpointBehavior) -> tuple[float, int | None]:
+        """Return the delay and the injected status (if any) for one request."""
+
+        with self._lock:
+            delay = behavior.latency(self._rng) if behavior.latency is not None else 0.0
+            roll = self._rng.random()
+        for status, probability in behavior.faults.items():
+            if roll < probability:
+                return delay, status
+            roll -= probability
+        return delay, None
+
+    def _count(self, endpoint: str, status: int, size: int, *, injected: bool = False) -> None:
+        with self._lock:
+            self._stats.requests[endpoint] += 1
+            self._stats.statuses[status] += 1
+            self._stats.bytes_sent += size
+            if injected:
+                self._stats.injected[status] += 1
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this keep-alive clients stall on delayed ACKs.
+    disable_nagle_algorithm = True
+
+    @property
+    def stub(self) -> StubAmadeusServer:
+        return self.server.stub  # type: ignore[attr-defined]
+
+    def do_POST(self) -> None:  # noqa: N802 - required by BaseHTTPRequestHandler
+        # Drain the form body so that the kept-alive connection stays in sync.
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path = urlsplit(self.path).path
+        if path != TOKEN_PATH:
+            self._send(path, 404, {"errors": [{"status": 404, "title": "Unknown endpoint"}]})
+            return
+        self._send(path, 200, self.stub._issue_token())
+
+    def do_GET(self) -> None:  # noqa: N802 - required by BaseHTTPRequestHandler
+        parts = urlsplit(self.path)
+        resolved = self.stub._resolve(parts.path)
+        if resolved is None:
+            self._send(parts.path, 404, {"errors": [{"status": 404, "title": "Unknown endpoint"}]})
+            return
+        endpoint, behavior, encoded = resolved
+        delay, fault = self.stub._draw(behavior)
+        if delay > 0:
+            time.sleep(delay)
+        if behavior.authenticated and not self.stub._token_is_valid(self.headers.get("Authorization")):
+            self._send(endpoint, 401, {"errors": [{"status": 401, "title": "Invalid access token"}]})
+            return
+        if fault is not None:
+            headers = {}
+            if behavior.retry_after is not None and fault in (429, 503):
+                headers["Retry-After"] = f"{behavior.retry_after:g}"
+            self._send(endpoint, fault, {"errors": [{"status": fault, "title": "Injected fault"}]}, headers, True)
+            return
+        if encoded is None:
+            payload = behavior.payload(dict(parse_qsl(parts.query)))  # type: ignore[operator]
+            encoded = _encode(payload)
+        self._send(endpoint, 200, encoded)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A003 - signature defined by base class
+        return
+
+    def _send(
+        self,
+        endpoint: str,
+        status: int,
+        body: Mapping[str, object] | bytes,
+        headers: Mapping[str, str] | None = None,
+        injected: bool = False,
+    ) -> None:
+        data = _encode(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+        self.stub._count(endpoint, status, len(data), injected=injected)
+
+
+def _encode(payload: Mapping[str, object] | bytes) -> bytes:
+    return payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+
+
+def default_endpoints() -> Dict[str, EndpointBehavior]:
+    """Small canned responses for the flight, hotel and location endpoints."""
+
+    now = datetime.now()
+    return {
+        FLIGHT_OFFERS_PATH: EndpointBehavior(
+            payload={
+                "data": [
+                    {
+                        "itineraries": [
+                            {
+                                "segments": [
+                                    {
+                                        "departure": {"at": now.isoformat(timespec="seconds")},
+                                        "arrival": {"at": (now + timedelta(hours=3)).isoformat(timespec="seconds")},
+                                        "carrierCode": "ST",
+                                        "number": "123",
+                                    }
+                                ]
+                            }
+                        ],
+                        "price": {"total": "199.99", "currency": "USD"},
+                        "links": {"deeplink": "/bookings/flight/abc"},
+                        "travelerPricings": [{"loyaltyProgramme": {"program": "Sample Rewards", "points": 15000}}],
+                    }
+                ]
+            }
+        ),
+        HOTEL_OFFERS_PATH: EndpointBehavior(
+            payload={
+                "data": [
+                    {
+                        "hotel": {
+                            "name": "Stub Plaza",
+                            "rating": 4.5,
+                            "geoCode": {"latitude": 39.9042, "longitude": 116.4074},
+                        },
+                        "offers": [
+                            {
+                                "price": {"total": "289.50", "currency": "USD"},
+                                "boardType": "Breakfast",
+                                "room": {"description": {"text": "City view suite"}},
+                                "loyaltyProgramme": {"program": "Stub Rewards", "points": 22000},
+                                "links": {"deeplink": "/bookings/hotel/xyz"},
+                            }
+                        ],
+                    }
+                ]
+            }
+        ),
+        LOCATIONS_PATH: EndpointBehavior(
+            payload={"data": [{"type": "location", "subType": "CITY", "name": "Stub City", "iataCode": "STB"}]}
+        ),
+        "/bookings/": EndpointBehavior(payload={"status": "ok"}, authenticated=False),
+    }
+
+
+_CARRIERS = ("CA", "MU", "CZ", "CX", "HU", "NH", "LH", "BA", "AF", "UA")
+_DISTRICTS = ("Chaoyang", "Dongcheng", "Xicheng", "Haidian", "Fengtai", "Shunyi")
+_SYNTHETIC_DATE = date(2030, 5, 1)
+
+
+def synthetic_flight_offers(count: int, *, seed: int = 0, day: date = _SYNTHETIC_DATE) -> Dict[str, object]:
+    """Return a flight-offers payload with *count* offers of one to three segments."""
+
+    rng = random.Random(seed)
+    data = []
+    for index in range(count):
+        departure = datetime.combine(day, datetime.min.time()) + timedelta(minutes=rng.randrange(0, 24 * 60))
+        segments = []
+        for _ in range(rng.choice((1, 1, 2, 3))):
+            arrival = departure + timedelta(minutes=rng.randrange(60, 600))
+            segments.append(
+                {
+                    "departure": {"at": departure.isoformat(timespec="seconds")},
+                    "arrival": {"at": arrival.isoformat(timespec="seconds")},
+                    "carrierCode": rng.choice(_CARRIERS),
+                    "number": str(100 + index % 9000),
+                }
+            )
+            departure = arrival + timedelta(minutes=rng.randrange(45, 240))
+        offer: Dict[str, object] = {
+            "itineraries": [{"segments": segments}],
+            "price": {"total": f"{rng.uniform(80, 2500):.2f}", "currency": "USD"},
+            "links": {"deeplink": f"/bookings/flight/{index}"},
+        }
+        if rng.random() < 0.3:
+            offer["travelerPricings"] = [
+                {"loyaltyProgramme": {"program": "Sample Rewards", "points": rng.randrange(5000, 90000, 500)}}
+            ]
+        data.append(offer)
+    return {"data": data, "meta": {"count": count}}
+
+
+def synthetic_hotel_offers(count: int, *, seed: int = 0) -> Dict[str, object]:
+    """Return a hotel-offers payload with *count* hotels of one or two room offers."""
+
+    rng = random.Random(seed)
+    data = []
+    for index in range(count):
+        offers = []
+        for room in range(rng.choice((1, 1, 2))):
+            offers.append(
+                {
+                    "price": {"total": f"{rng.uniform(60, 900):.2f}", "currency": "USD"},
+                    "boardType": rng.choice(("RoomOnly", "Breakfast")),
+                    "room": {"description": {"text": f"Room type {room}"}},
+                    "links": {"deeplink": f"/bookings/hotel/{index}/{room}"},
+                }
+            )
+        data.append(
+            {
+                "hotel": {
+                    "name": f"Hotel {index}",
+                    "rating": round(rng.uniform(2.5, 5.0), 1),
+                    "geoCode": {
+                        "latitude": round(39.9 + rng.uniform(-0.2, 0.2), 5),
+                        "longitude": round(116.4 + rng.uniform(-0.2, 0.2), 5),
+                    },
+                },
+                "offers": offers,
+            }
+        )
+    return {"data": data, "meta": {"count": count}}
+
+
+def synthetic_places(count: int, *, seed: int = 0) -> Dict[str, object]:
+    """Return a locations payload whose items also carry the activity fields the planner reads.
+
+    Items are drawn from a pool of ``2 * count`` places, so the results of
+    different queries overlap the way real interest searches do.
+    """
+
+    rng = random.Random(seed)
+    data = []
+    for _ in range(count):
+        place = rng.randrange(2 * count)
+        prng = random.Random(place)
+        opens = prng.choice((None, 8, 9, 10))
+        data.append(
+            {
+                "type": "location",
+                "subType": "CITY",
+                "name": f"Place {place}",
+                "iataCode": f"P{place % 1000:03d}",
+                "title": f"Place {place}",
+                "snippet": "Synthetic attraction",
+                "location": prng.choice(_DISTRICTS),
+                "url": f"https://example.com/places/{place}?utm_source=bench",
+                "geoCode": {
+                    "latitude": round(39.9 + prng.uniform(-0.1, 0.1), 5),
+                    "longitude": round(116.4 + prng.uniform(-0.1, 0.1), 5),
+                },
+                "opens_at": f"{opens:02d}:00" if opens else None,
+                "closes_at": "18:00" if opens else None,
+            }
+        )
+    return {"data": data, "meta": {"count": count}}
@@ -0,0 +1,133 @@
+import dataclasses
+import threading
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from agent import TravelAgent
+from itinerary import ItineraryPlanner
+from models import FlightPreference, HotelPreference, TripRequest
+from search import InMemorySearchProvider
+from timetable import DayScheduler
+
+START = date(2030, 5, 1)
+
+
+def _trip(destination: str, offset: int = 0, interests=("museums", "food")) -> TripRequest:
+    start = START + timedelta(days=offset)
+    return TripRequest("PAR", destination, start, start + timedelta(days=1), interests=interests)
+
+
+class _Provider(InMemorySearchProvider):
+    """Counts searches and the most that ran at once."""
+
+    def __init__(self, *, delay: float = 0.0, failing: str | None = None) -> None:
+        super().__init__(
+            generic_results=[{"title": "Gallery", "snippet": ""}],
+            flight_results=[
+                {
+                    "airline": "AF",
+                    "flight_number": "1",
+                    "departure_time": "2030-05-01T08:00:00",
+                    "arrival_time": "2030-05-01T10:00:00",
+                    "price": 100.0,
+                }
+            ],
+        )
+        self.delay = delay
+        self.failing = failing
+        self.queries: list[str] = []
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def search(self, query, *, filters=None):
+        with self._lock:
+            self.queries.append(query)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(self.delay)
+            return super().search(query, filters=filters)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def search_flights(self, *, destination, **kwargs):
+        if destination == self.failing:
+            raise ConnectionError("down")
+        return super().search_flights(destination=destination, **kwargs)
+
+
+class _FailingScheduler(DayScheduler):
+    def __init__(self, failing_start: date) -> None:
+        super().__init__()
+        self.failing_start = failing_start
+
+    def schedule(self, start_date, end_date, activities):
+        if start_date == self.failing_start:
+            raise RuntimeError("cannot schedule")
+        return super().schedule(start_date, end_date, activities)
+
+
+def test_every_trip_is_planned_and_repeated_searches_reach_the_provider_once() -> None:
+    provider = _Provider()
+    agent = TravelAgent.from_provider(provider)
+    requests = [_trip("ROM", offset) for offset in range(4)] + [_trip("MIL")]
+
+    results = list(agent.plan_many(requests, max_workers=3))
+
+    assert sorted(result.index for result in results) == list(range(5))
+    for result in results:
+        assert result.error is None
+        assert result.value.request is requests[result.index]
+    assert sorted(provider.queries) == ["MIL food", "MIL museums", "ROM food", "ROM museums"]
+
+
+def test_max_workers_bounds_the_searches_in_flight() -> None:
+    provider = _Provider(delay=0.05)
+    agent = TravelAgent.from_provider(provider)
+    interests = tuple(f"interest {number}" for number in range(6))
+    requests = [_trip(destination, interests=interests) for destination in ("ROM", "MIL", "NAP", "VCE")]
+
+    assert all(result.error is None for result in agent.plan_many(requests, max_workers=2))
+    assert len(provider.queries) == 24
+    assert provider.peak <= 2
+
+
+def test_a_failing_trip_is_reported_without_stopping_the_others() -> None:
+    provider = _Provider()
+    failing = _trip("ROM", offset=1)
+    agent = dataclasses.replace(
+        TravelAgent.from_provider(provider),
+        planner=ItineraryPlanner(provider, day_scheduler=_FailingScheduler(failing.start_date)),
+    )
+
+    results = sorted(agent.plan_many([_trip("ROM"), failing, _trip("MIL")]), key=lambda result: result.index)
+
+    assert [result.error is None for result in results] == [True, False, True]
+    assert isinstance(results[1].error, RuntimeError) and results[1].value is None
+    assert results[1].request is failing
+
+
+def test_flight_batches_report_provider_errors_per_trip() -> None:
+    agent = TravelAgent.from_provider(_Provider(failing="MIL"))
+
+    results = {
+        result.index: result
+        for result in agent.find_flights_many([_trip("ROM"), _trip("MIL")], FlightPreference(), max_workers=2)
+    }
+
+    assert [offer.flight_number for offer in results[0].value] == ["1"]
+    assert isinstance(results[1].error, ConnectionError)
+
+
+def test_empty_batches_and_invalid_worker_counts() -> None:
+    agent = TravelAgent.from_provider(_Provider())
+
+    assert list(agent.plan_many([])) == []
+    with pytest.raises(ValueError):
+        agent.plan_many([_trip("ROM")], max_workers=0)
+    with pytest.raises(ValueError):
+        agent.find_hotels_many([_trip("ROM")], HotelPreference(), max_workers=0)
@@ -0,0 +1,20 @@
+import os
+
+import pytest
+
+from auth import AccessToken, FileTokenStore
+
+
+def test_token_directory_open_to_other_users_is_refused(tmp_path) -> None:
+    directory = tmp_path / "tokens"
+    directory.mkdir(mode=0o777)
+    os.chmod(directory, 0o777)
+    with pytest.raises(PermissionError):
+        FileTokenStore(directory)
+
+
+def test_private_token_directory_round_trips_tokens(tmp_path) -> None:
+    store = FileTokenStore(tmp_path / "tokens")
+    store.save("key", AccessToken(value="secret", expires_at=123.0))
+    assert store.load("key") == AccessToken(value="secret", expires_at=123.0)
+    assert (tmp_path / "tokens").stat().st_mode & 0o777 == 0o700
@@ -0,0 +1,129 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cache import CachingSearchProvider
+from metrics import MetricsRegistry
+from search import InMemorySearchProvider
+
+
+class _CountingProvider(InMemorySearchProvider):
+    def __init__(self, results_by_query: dict[str, list[dict]] | None = None) -> None:
+        super().__init__()
+        self.results_by_query = results_by_query or {}
+        self.calls: list[str] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def search(self, query, *, filters=None):
+        self.calls.append(query)
+        self.release.wait(5)
+        return tuple(self.results_by_query.get(query, ()))
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(provider, **kwargs) -> CachingSearchProvider:
+    return CachingSearchProvider(provider, metrics=MetricsRegistry(), **kwargs)
+
+
+def test_entries_expire_after_their_ttl() -> None:
+    provider = _CountingProvider({"rome": [{"name": "Rome"}]})
+    clock = _Clock()
+    cache = _cache(provider, search_ttl=10.0, clock=clock)
+
+    assert cache.search("rome") == ({"name": "Rome"},)
+    clock.now = 9.9
+    cache.search("rome")
+    clock.now = 10.0
+    cache.search("rome")
+
+    assert provider.calls == ["rome", "rome"]
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.expirations) == (1, 2, 1)
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    provider = _CountingProvider({query: [{"name": query}] for query in ("a", "b", "c")})
+    cache = _cache(provider, max_entries=2)
+
+    cache.search("a")
+    cache.search("b")
+    cache.search("a")  # "b" is now the least recently used entry.
+    cache.search("c")
+    cache.search("a")
+    cache.search("b")
+
+    assert provider.calls == ["a", "b", "c", "b"]
+    assert cache.stats.evictions == 2
+    assert cache.stats.entries == 2
+
+
+def test_empty_results_use_the_negative_ttl() -> None:
+    provider = _CountingProvider()
+    clock = _Clock()
+    cache = _cache(provider, negative_ttl=1.0, clock=clock)
+
+    assert cache.search("nowhere") == ()
+    assert cache.search("nowhere") == ()
+    clock.now = 1.0
+    cache.search("nowhere")
+
+    assert provider.calls == ["nowhere", "nowhere"]
+    assert cache.stats.negative_hits == 1
+
+    uncached = _cache(_CountingProvider(), negative_ttl=None)
+    uncached.search("nowhere")
+    uncached.search("nowhere")
+    assert uncached.stats.misses == 2
+
+
+def test_concurrent_misses_are_coalesced_and_not_counted_as_hits() -> None:
+    provider = _CountingProvider({"rome": [{"name": "Rome"}]})
+    provider.release.clear()
+    cache = _cache(provider)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(cache.search, "rome") for _ in range(4)]
+        while cache.stats.coalesced < 3:
+            threading.Event().wait(0.01)
+        provider.release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == [({"name": "Rome"},)] * 4
+    assert provider.calls == ["rome"]
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.coalesced) == (0, 1, 3)
+    assert stats.hit_ratio == 0.0
+
+
+def test_coalesced_callers_see_the_leader_error() -> None:
+    class _FailingProvider(_CountingProvider):
+        def search(self, query, *, filters=None):
+            super().search(query, filters=filters)
+            raise RuntimeError("upstream down")
+
+    provider = _FailingProvider()
+    provider.release.clear()
+    cache = _cache(provider)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(cache.search, "rome") for _ in range(2)]
+        while cache.stats.coalesced < 1:
+            threading.Event().wait(0.01)
+        provider.release.set()
+        errors = [future.exception(timeout=5) for future in futures]
+
+    assert [str(error) for error in errors] == ["upstream down"] * 2
+    assert provider.calls == ["rome"]
+    # Failures are not cached; the next lookup tries upstream again.
+    with pytest.raises(RuntimeError):
+        cache.search("rome")
+    assert provider.calls == ["rome", "rome"]
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from changes import OfferChangeDetector, OfferEvent, OfferEventKind, notable_offers
+
+
+def _detector(**kwargs) -> OfferChangeDetector[tuple[str, float]]:
+    return OfferChangeDetector(lambda offer: offer[0], price=lambda offer: offer[1], **kwargs)
+
+
+def _kinds(events: list[OfferEvent]) -> list[tuple[str, str, float | None]]:
+    return [(event.kind.value, event.offer[0], event.previous_price) for event in events]
+
+
+def test_reports_new_offers_price_moves_and_disappearances() -> None:
+    detector = _detector()
+
+    assert _kinds(detector.diff([("AF1", 100.0), ("AZ2", 80.0), ("LH3", 90.0)])) == [
+        ("new", "AF1", None),
+        ("new", "AZ2", None),
+        ("new", "LH3", None),
+    ]
+    events = detector.diff([("AF1", 90.0), ("AZ2", 85.0)])
+
+    assert _kinds(events) == [
+        ("price_dropped", "AF1", 100.0),
+        ("price_raised", "AZ2", 80.0),
+        ("disappeared", "LH3", 90.0),
+    ]
+    assert notable_offers(events) == (("AF1", 90.0),)
+    assert detector.diff([("AF1", 90.0), ("AZ2", 85.0)]) == []
+    # A disappeared offer is forgotten, so its return is announced again.
+    assert _kinds(detector.diff([("AF1", 90.0), ("AZ2", 85.0), ("LH3", 90.0)])) == [("new", "LH3", None)]
+
+
+def test_duplicates_within_a_snapshot_keep_the_cheapest() -> None:
+    detector = _detector()
+    events = detector.diff([("AF1", 120.0), ("AF1", 100.0), ("AF1", 110.0)])
+
+    assert [event.offer for event in events] == [("AF1", 100.0)]
+
+
+def test_moves_within_min_change_do_not_creep() -> None:
+    detector = _detector(min_change=5.0)
+    detector.diff([("AF1", 100.0)])
+
+    assert detector.diff([("AF1", 97.0)]) == []
+    assert detector.diff([("AF1", 96.0)]) == []
+    # Compared with the last reported price (100), not the last observed one.
+    assert _kinds(detector.diff([("AF1", 94.0)])) == [("price_dropped", "AF1", 100.0)]
+
+
+def test_least_recently_seen_prices_are_evicted_beyond_capacity() -> None:
+    detector = _detector(capacity=2)
+    detector.diff([("A", 1.0), ("B", 2.0), ("C", 3.0)])
+
+    assert len(detector) == 2
+    # "A" was evicted, so seeing it again is a new offer; "C" is still known.
+    assert _kinds(detector.diff([("A", 1.0), ("C", 3.0)])) == [("new", "A", None), ("disappeared", "B", 2.0)]
+    assert len(detector) == 2
+
+
+def test_state_round_trips_through_json_and_respects_capacity() -> None:
+    detector = OfferChangeDetector(lambda offer: (offer[0], "2030-05-01"), price=lambda offer: offer[1])
+    detector.diff([("AF1", 100.0), ("AZ2", 80.0)])
+    state = json.loads(json.dumps(detector.export_state()))
+
+    restored = OfferChangeDetector(lambda offer: (offer[0], "2030-05-01"), price=lambda offer: offer[1])
+    restored.load_state(state)
+    assert _kinds(restored.diff([("AF1", 90.0), ("AZ2", 80.0)])) == [("price_dropped", "AF1", 100.0)]
+
+    small = _detector(capacity=1)
+    small.load_state([["A", 1.0], ["B", 2.0]])
+    assert small.export_state() == [("B", 2.0)]
+
+
+def test_capacity_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        _detector(capacity=0)
+
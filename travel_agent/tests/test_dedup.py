@@ -0,0 +1,67 @@
+from dedup import ActivityDeduplicator, deduplicate_activities, normalize_name, normalize_url
+from models import Activity
+
+
+def test_urls_normalise_host_tracking_parameters_and_order() -> None:
+    assert normalize_url("HTTPS://www.Example.com/tours/colosseum/?b=2&utm_source=x&a=1&gclid=z#top") == (
+        normalize_url("http://example.com/tours/colosseum?a=1&b=2")
+    )
+    assert normalize_url("https://example.com/a") != normalize_url("https://example.com/b")
+    assert normalize_url("/relative/path") is None
+    assert normalize_url(None) is None
+
+
+def test_names_ignore_case_width_punctuation_and_word_order() -> None:
+    assert normalize_name("Palace Museum") == normalize_name("MUSEUM, palace!") == normalize_name("Ｐａｌａｃｅ　Ｍｕｓｅｕｍ")
+    assert normalize_name("Palace Museum") != normalize_name("Palace Gardens")
+
+
+def test_same_url_is_a_duplicate_and_fills_missing_fields() -> None:
+    first = Activity("Colosseum tour", "", booking_url="https://www.example.com/tour?utm_medium=ads")
+    second = Activity(
+        "Skip-the-line Colosseum", "Guided tour", location="Rome", booking_url="https://example.com/tour/"
+    )
+
+    assert deduplicate_activities([first, second]) == [
+        Activity("Colosseum tour", "Guided tour", location="Rome", booking_url=first.booking_url)
+    ]
+
+
+def test_names_match_only_at_the_same_place() -> None:
+    deduplicator = ActivityDeduplicator()
+    deduplicator.extend(
+        [
+            Activity("Trevi Fountain", "", latitude=41.900930, longitude=12.483313),
+            # About 70 m north, in the neighbouring 0.001 degree bucket.
+            Activity("trevi fountain", "", latitude=41.901560, longitude=12.483313),
+            # Same name in another city.
+            Activity("Trevi Fountain", "", latitude=45.4642, longitude=9.1900),
+            Activity("Old Town", "", location="Prague"),
+            Activity("old town", "", location="PRAGUE"),
+            Activity("Old Town", "", location="Tallinn"),
+        ]
+    )
+
+    assert [(activity.name, activity.location, activity.latitude) for activity in deduplicator.activities] == [
+        ("Trevi Fountain", None, 41.900930),
+        ("Trevi Fountain", None, 45.4642),
+        ("Old Town", "Prague", None),
+        ("Old Town", "Tallinn", None),
+    ]
+    assert deduplicator.duplicates == 2
+
+
+def test_a_duplicate_registers_its_own_keys() -> None:
+    deduplicator = ActivityDeduplicator()
+    assert deduplicator.add(Activity("Vatican Museums", "", location="Rome"))
+    # Matched by name and place, and brings a booking URL with it...
+    assert not deduplicator.add(Activity("Vatican Museums", "", location="Rome", booking_url="https://a.test/vm"))
+    # ...so a later offer that shares only that URL is recognised too.
+    assert not deduplicator.add(Activity("Musei Vaticani", "", booking_url="https://a.test/vm"))
+    assert len(deduplicator.activities) == 1
+
+
+def test_nameless_activities_only_match_by_url() -> None:
+    activities = [Activity("", ""), Activity("", ""), Activity("", "", booking_url="https://a.test/x")]
+
+    assert len(deduplicate_activities(activities)) == 3
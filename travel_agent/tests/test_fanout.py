@@ -0,0 +1,142 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fanout import FanOutFlightSearchProvider, FanOutHotelSearchProvider
+from search import InMemorySearchProvider
+
+SEARCH = {
+    "origin": "PAR",
+    "destination": "ROM",
+    "departure_date": "2030-05-01",
+    "return_date": "2030-05-04",
+    "travelers": 1,
+    "cabin": None,
+    "max_stops": None,
+    "loyalty_programs": (),
+}
+HOTEL_SEARCH = {
+    "destination": "ROM",
+    "check_in": "2030-05-01",
+    "check_out": "2030-05-04",
+    "travelers": 1,
+    "neighborhoods": (),
+    "amenities": (),
+    "loyalty_programs": (),
+}
+
+
+def _flight(number: str, price: float, source: str) -> dict:
+    return {
+        "airline": "AF",
+        "flight_number": number,
+        "departure_time": "2030-05-01T08:00:00",
+        "arrival_time": "2030-05-01T10:00:00",
+        "price": price,
+        "source": source,
+    }
+
+
+class _Provider(InMemorySearchProvider):
+    def __init__(self, *, flights=(), hotels=(), delay: float = 0.0, error: Exception | None = None) -> None:
+        super().__init__(flight_results=flights, hotel_results=hotels)
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def search_flights(self, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return super().search_flights(**kwargs)
+
+    def search_hotels(self, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return super().search_hotels(**kwargs)
+
+
+def test_duplicates_keep_the_cheapest_copy_in_first_seen_order() -> None:
+    amadeus = _Provider(flights=[_flight("1", 300.0, "amadeus"), _flight("2", 150.0, "amadeus")])
+    cache = _Provider(flights=[_flight("2", 140.0, "cache"), _flight("3", 90.0, "cache"), _flight("1", 300.0, "cache")])
+    fan_out = FanOutFlightSearchProvider([amadeus, cache])
+
+    results = fan_out.search_flights(**SEARCH)
+
+    assert [(raw["flight_number"], raw["source"]) for raw in results] == [
+        ("1", "amadeus"),  # Equal prices keep the earlier provider's copy.
+        ("2", "cache"),
+        ("3", "cache"),
+    ]
+    assert fan_out.stats.duplicates == 2
+
+
+def test_hotels_are_merged_on_their_identity() -> None:
+    stay = {"name": "Duomo", "check_in": "2030-05-01", "check_out": "2030-05-04"}
+    fan_out = FanOutHotelSearchProvider(
+        [
+            _Provider(hotels=[dict(stay, price_per_night=120.0), dict(stay, name="Eden", price_per_night=90.0)]),
+            _Provider(hotels=[dict(stay, price_per_night=110.0), dict(stay, notes=["breakfast"], price_per_night=150.0)]),
+        ]
+    )
+
+    assert [(raw["name"], raw["price_per_night"]) for raw in fan_out.search_hotels(**HOTEL_SEARCH)] == [
+        ("Duomo", 110.0),
+        ("Eden", 90.0),
+        ("Duomo", 150.0),
+    ]
+
+
+def test_slow_and_failing_providers_yield_partial_results() -> None:
+    fast = _Provider(flights=[_flight("1", 100.0, "fast")])
+    slow = _Provider(flights=[_flight("2", 50.0, "slow")], delay=1.0)
+    broken = _Provider(error=ConnectionError("down"))
+    fan_out = FanOutFlightSearchProvider([fast, slow, broken], timeout=0.2)
+
+    started = time.perf_counter()
+    results = fan_out.search_flights(**SEARCH)
+
+    assert time.perf_counter() - started < 0.8
+    assert [raw["source"] for raw in results] == ["fast"]
+    stats = fan_out.stats
+    assert (stats.searches, stats.partial_results, stats.timeouts, stats.failures) == (1, 1, 1, 1)
+
+
+def test_an_error_is_raised_only_when_no_provider_answered() -> None:
+    failing = FanOutFlightSearchProvider([_Provider(error=ConnectionError("down")), _Provider(error=KeyError("x"))])
+    with pytest.raises(ConnectionError):
+        failing.search_flights(**SEARCH)
+
+    silent = FanOutFlightSearchProvider([_Provider(delay=0.5)], timeout=0.05)
+    with pytest.raises(TimeoutError):
+        silent.search_flights(**SEARCH)
+
+
+def test_unparseable_results_pass_through_and_an_injected_executor_is_reused() -> None:
+    odd = [{"flight_number": "X", "price": "n/a"}, {"flight_number": "X", "price": "n/a"}]
+    provider = _Provider(flights=odd)
+    submitted = []
+
+    class _RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            submitted.append(fn)
+            return super().submit(fn, *args, **kwargs)
+
+    with _RecordingExecutor(max_workers=2) as executor:
+        fan_out = FanOutFlightSearchProvider([provider], executor=executor)
+        assert fan_out.search_flights(**SEARCH) == tuple(odd)
+        fan_out.search_flights(**SEARCH)
+        # The caller's pool runs every search and is left running afterwards.
+        assert executor.submit(lambda: 1).result() == 1
+
+    assert len(submitted) == 3
+    assert fan_out.stats.duplicates == 0
+
+
+def test_at_least_one_provider_is_required() -> None:
+    with pytest.raises(ValueError):
+        FanOutFlightSearchProvider([])
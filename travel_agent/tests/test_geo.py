@@ -0,0 +1,35 @@
+import math
+import random
+
+import pytest
+
+from geo import GridIndex
+
+
+def _brute_force(points, groups, aggregate):
+    index = GridIndex([], reference_latitude=39.9)
+    combine = max if aggregate == "max" else (lambda values: sum(values) / len(values))
+
+    def distance(a, b):
+        (ax, ay), (bx, by) = index.project(*a), index.project(*b)
+        return math.hypot(ax - bx, ay - by)
+
+    scores = [
+        (sum(combine([distance((lat, lng), target) for target in group]) for group in groups) / len(groups), name)
+        for lat, lng, name in points
+    ]
+    return sorted(scores)
+
+
+@pytest.mark.parametrize("aggregate", ["mean", "max"])
+def test_closest_to_groups_matches_brute_force(aggregate: str) -> None:
+    rng = random.Random(7)
+    points = [(39.9 + rng.uniform(-0.2, 0.2), 116.4 + rng.uniform(-0.2, 0.2), index) for index in range(500)]
+    groups = [
+        [(39.9 + rng.uniform(-0.1, 0.1), 116.4 + rng.uniform(-0.1, 0.1)) for _ in range(size)] for size in (1, 4, 9)
+    ]
+    index = GridIndex(points, reference_latitude=39.9)
+    found = index.closest_to_groups(groups, k=10, aggregate=aggregate)
+    expected = _brute_force(points, groups, aggregate)[:10]
+    assert [item for _, item in found] == [item for _, item in expected]
+    assert [score for score, _ in found] == pytest.approx([score for score, _ in expected])
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from locations import LocationIndex, response_is_complete
+
+PARIS = {"id": "CPAR", "subType": "CITY", "iataCode": "PAR", "name": "PARIS", "address": {"countryCode": "FR"}}
+CDG = {
+    "id": "ACDG",
+    "subType": "AIRPORT",
+    "iataCode": "CDG",
+    "name": "CHARLES DE GAULLE",
+    "detailedName": "PARIS/FR:CHARLES DE GAULLE",
+    "address": {"cityName": "PARIS", "countryCode": "FR"},
+}
+PARMA = {"id": "APMF", "subType": "AIRPORT", "iataCode": "PMF", "name": "PARMA", "address": {"countryCode": "IT"}}
+PARIS_TX = {"id": "CPRX", "subType": "CITY", "iataCode": "PRX", "name": "PARIS", "address": {"countryCode": "US"}}
+
+
+def _ids(locations) -> list[str]:
+    return [location["id"] for location in locations]
+
+
+def test_only_keywords_extending_a_covered_prefix_are_answered() -> None:
+    index = LocationIndex()
+    assert index.lookup("par") is None
+
+    index.record("Par", None, [CDG, PARMA, PARIS], complete=True)
+
+    assert _ids(index.lookup("PARI")) == ["CPAR", "ACDG"]
+    assert _ids(index.lookup("par")) == ["CPAR", "ACDG", "APMF"]
+    assert index.lookup("parz") == ()
+    # Shorter or unrelated keywords may match locations the index never saw.
+    assert index.lookup("pa") is None
+    assert index.lookup("cdg") is None
+    assert (index.hits, index.misses) == (3, 3)
+
+
+def test_incomplete_responses_are_indexed_but_cover_nothing() -> None:
+    index = LocationIndex()
+    index.record("par", None, [PARIS], complete=False)
+    assert index.lookup("paris") is None
+
+    index.record("p", None, [CDG], complete=True)
+    # Locations learned earlier still contribute once a prefix is covered.
+    assert _ids(index.lookup("paris")) == ["CPAR", "ACDG"]
+
+
+def test_country_filters_are_answered_locally() -> None:
+    index = LocationIndex()
+    index.record("paris", {"countryCode": "fr"}, [PARIS, CDG], complete=True)
+    index.record("paris", None, [PARIS_TX], complete=False)
+
+    assert _ids(index.lookup("paris", {"countryCode": "FR"})) == ["CPAR", "ACDG"]
+    # Coverage for one country says nothing about the others.
+    assert index.lookup("paris", {"countryCode": "US"}) is None
+    assert index.lookup("paris") is None
+    # Filters the index cannot evaluate always go upstream.
+    assert index.lookup("paris", {"countryCode": "FR", "subType": "CITY"}) is None
+
+    index.record("pa", {"countryCode": "US", "view": None}, [PARIS_TX], complete=True)
+    assert _ids(index.lookup("paris", {"countryCode": "us"})) == ["CPRX"]
+
+
+def test_complete_seed_file_covers_every_keyword_including_words(tmp_path) -> None:
+    seed = tmp_path / "locations.jsonl"
+    seed.write_text("\n".join(json.dumps(location) for location in (PARIS, CDG, PARMA)) + "\n", encoding="utf-8")
+
+    index = LocationIndex.from_file(seed)
+    assert len(index) == 3
+    assert _ids(index.lookup("gaul")) == ["ACDG"]
+    assert _ids(index.lookup("CDG")) == ["ACDG"]
+    assert index.lookup("nowhere") == ()
+
+    partial = tmp_path / "partial.json"
+    partial.write_text(json.dumps({"data": [PARIS]}), encoding="utf-8")
+    assert LocationIndex.from_file(partial, complete=False).lookup("paris") is None
+
+
+def test_re_adding_a_location_replaces_it() -> None:
+    index = LocationIndex()
+    index.record("par", None, [PARIS], complete=True)
+    index.add([dict(PARIS, name="PARIS (ALL AIRPORTS)")])
+
+    assert [location["name"] for location in index.lookup("par")] == ["PARIS (ALL AIRPORTS)"]
+    # Words only found in the new copy are indexed too.
+    assert _ids(index.lookup("paris (all")) == ["CPAR"]
+    assert len(index) == 1
+
+
+@pytest.mark.parametrize(
+    ("response", "returned", "complete"),
+    [
+        ({"data": []}, 0, True),
+        ({"meta": {"count": 2}}, 2, True),
+        ({"meta": {"count": 25}}, 10, False),
+        ({"meta": {"count": 10, "links": {"next": "https://example.test?page=2"}}}, 10, False),
+    ],
+)
+def test_response_is_complete(response, returned, complete) -> None:
+    assert response_is_complete(response, returned) is complete
@@ -0,0 +1,44 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from flights import FlightMonitor
+from hotels import HotelMonitor
+from models import FlightPreference, TripRequest
+from search import InMemorySearchProvider
+
+REQUEST = TripRequest("PAR", "ROM", date(2030, 5, 1), date(2030, 5, 4))
+
+
+def test_concurrency_limit_works_across_event_loops() -> None:
+    async def contended(monitor: FlightMonitor) -> list:
+        return await asyncio.gather(
+            *(monitor.find_best_flights_async(REQUEST, FlightPreference()) for _ in range(4))
+        )
+
+    with FlightMonitor(InMemorySearchProvider(), max_concurrency=1) as monitor:
+        # Waiting binds a semaphore to its loop, so one shared across loops fails on the second run.
+        for _ in range(2):
+            assert asyncio.run(contended(monitor)) == [[]] * 4
+
+
+def test_close_shuts_down_only_an_owned_executor() -> None:
+    owned = HotelMonitor(InMemorySearchProvider(), max_concurrency=2)
+    clone = owned.with_provider(InMemorySearchProvider())
+    clone.close()
+    assert not owned._executor._shutdown
+    owned.close()
+    assert owned._executor._shutdown
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        HotelMonitor(InMemorySearchProvider(), executor=executor, max_concurrency=2).close()
+        assert executor.submit(lambda: 1).result() == 1
+
+
+def test_closed_monitor_rejects_further_async_searches() -> None:
+    monitor = FlightMonitor(InMemorySearchProvider(), max_concurrency=1)
+    monitor.close()
+    with pytest.raises(RuntimeError):
+        asyncio.run(monitor.find_best_flights_async(REQUEST, FlightPreference()))
@@ -0,0 +1,103 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import ranking
+from models import FlightOffer, FlightPreference, HotelOffer, HotelPreference
+from ranking import RankingWeights, rank_flights, rank_hotels
+
+DEPARTURE = datetime(2030, 5, 1, 8, 0)
+
+
+def _flight(number: str, price: float, *, currency: str = "EUR", minutes: int = 120, stops: int | None = 0,
+            airline: str = "AF", loyalty_cost: int | None = None) -> FlightOffer:
+    return FlightOffer(
+        price=price,
+        currency=currency,
+        departure_time=DEPARTURE,
+        arrival_time=DEPARTURE + timedelta(minutes=minutes),
+        airline=airline,
+        flight_number=number,
+        booking_url=f"https://example.test/{number}",
+        loyalty_cost=loyalty_cost,
+        stops=stops,
+    )
+
+
+def _hotel(name: str, price: float, rating: float | None, *, currency: str = "EUR") -> HotelOffer:
+    return HotelOffer(
+        name=name,
+        price_per_night=price,
+        currency=currency,
+        check_in=date(2030, 5, 1),
+        check_out=date(2030, 5, 4),
+        rating=rating,
+        location=None,
+        booking_url=f"https://example.test/{name}",
+    )
+
+
+FLIGHTS = [
+    _flight("1", 320.0, minutes=90, stops=0, airline="AF", loyalty_cost=20_000),
+    _flight("2", 180.0, minutes=300, stops=2, airline="LH"),
+    _flight("3", 210.0, minutes=150, stops=None, airline="AZ", loyalty_cost=9_000),
+    _flight("4", 180.0, minutes=95, stops=1, airline="AF"),
+    _flight("5", 950.0, minutes=80, stops=0, airline="BA"),
+    _flight("6", 26_000.0, currency="JPY", minutes=200, stops=1, airline="NH"),
+    _flight("7", 31_000.0, currency="JPY", minutes=100, stops=0, airline="JL", loyalty_cost=40_000),
+]
+HOTELS = [
+    _hotel("Aurora", 140.0, 4.5),
+    _hotel("Borgo", 90.0, 3.9),
+    _hotel("Corte", 110.0, None),
+    _hotel("Duomo", 110.0, 4.8),
+    _hotel("Eden", 16_000.0, 4.1, currency="JPY"),
+]
+CASES = [
+    (FlightPreference(), RankingWeights(), None),
+    (FlightPreference(max_price=400.0), RankingWeights(), 3),
+    (FlightPreference(max_stops=1, preferred_airlines=("AF",)), RankingWeights(duration=1.0, stops=0.5), None),
+    (FlightPreference(), RankingWeights(price=0.2, loyalty=1.0), 4),
+]
+
+
+def _flight_numbers(preference: FlightPreference, weights: RankingWeights, limit: int | None) -> list[str]:
+    return [offer.flight_number for offer in rank_flights(FLIGHTS, preference, weights=weights, limit=limit)]
+
+
+def _hotel_names(preference: HotelPreference, weights: RankingWeights) -> list[str]:
+    return [offer.name for offer in rank_hotels(HOTELS, preference, weights=weights)]
+
+
+def test_prices_are_compared_within_each_currency(monkeypatch) -> None:
+    monkeypatch.setattr(ranking, "np", None)
+
+    # Each currency's cheapest offer scores 0, whatever the exchange rate.
+    assert _flight_numbers(FlightPreference(), RankingWeights(preferred_airline=0.0), 3) == ["2", "4", "6"]
+    assert _hotel_names(HotelPreference(), RankingWeights())[:2] == ["Borgo", "Eden"]
+
+
+def test_preferences_filter_offers(monkeypatch) -> None:
+    monkeypatch.setattr(ranking, "np", None)
+
+    assert _flight_numbers(FlightPreference(max_price=200.0), RankingWeights(), None) == ["2", "4"]
+    # Unknown stop counts pass a max_stops filter.
+    assert "3" in _flight_numbers(FlightPreference(max_stops=0), RankingWeights(), None)
+    # Missing ratings fail a min_rating filter.
+    assert _hotel_names(HotelPreference(min_rating=4.0, max_price_per_night=150.0), RankingWeights()) == [
+        "Duomo",
+        "Aurora",
+    ]
+
+
+@pytest.mark.parametrize(("preference", "weights", "limit"), CASES)
+def test_numpy_and_fallback_paths_agree(monkeypatch, preference, weights, limit) -> None:
+    numpy = pytest.importorskip("numpy")
+
+    monkeypatch.setattr(ranking, "np", None)
+    fallback = _flight_numbers(preference, weights, limit)
+    hotels_fallback = _hotel_names(HotelPreference(min_rating=4.0), RankingWeights(rating=1.0))
+    monkeypatch.setattr(ranking, "np", numpy)
+
+    assert _flight_numbers(preference, weights, limit) == fallback
+    assert _hotel_names(HotelPreference(min_rating=4.0), RankingWeights(rating=1.0)) == hotels_fallback
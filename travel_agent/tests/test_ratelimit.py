@@ -0,0 +1,20 @@
+import pytest
+
+from ratelimit import TokenBucket
+
+
+def test_reservations_queued_during_a_pause_are_spaced_at_the_rate() -> None:
+    now = [0.0]
+    bucket = TokenBucket(10, burst=1, clock=lambda: now[0])
+    bucket.pause(5)
+    waits = [bucket.reserve() for _ in range(8)]
+    assert waits == pytest.approx([5.0 + index / 10 for index in range(8)])
+
+
+def test_bucket_refills_normally_after_a_pause() -> None:
+    now = [0.0]
+    bucket = TokenBucket(10, burst=5, clock=lambda: now[0])
+    bucket.pause(1)
+    now[0] = 10.0
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+    assert bucket.reserve() == pytest.approx(0.1)
@@ -0,0 +1,159 @@
+import asyncio
+import http.client
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import requests
+from stub_server import FLIGHT_OFFERS_PATH, EndpointBehavior, StubAmadeusServer
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - required by BaseHTTPRequestHandler
+        if self.path == "/moved":
+            self._reply(302, b"", Location="/echo")
+        elif self.path == "/loop":
+            self._reply(307, b"", Location="/loop")
+        elif self.path == "/missing":
+            self._reply(404, b"not here")
+        elif self.path == "/drop":
+            # Advertise keep-alive but hang up anyway, like a server expiring an idle connection.
+            self._reply(200, b"dropped")
+            self.close_connection = True
+        else:
+            self._reply(200, f"GET {self.path} {self.headers.get('Authorization')}".encode())
+
+    def do_POST(self) -> None:  # noqa: N802 - required by BaseHTTPRequestHandler
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        if self.path == "/moved":
+            self._reply(303, b"", Location="/echo")
+            return
+        self._reply(200, f"{self.headers.get('Content-Type')}|{body.decode()}".encode())
+
+    def _reply(self, status: int, body: bytes, **headers: str) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A003 - signature defined by base class
+        return
+
+
+@pytest.fixture
+def echo_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_sync_and_async_sessions_send_the_same_form_post(echo_url: str) -> None:
+    with requests.Session() as session:
+        sync_text = session.post(echo_url, data={"grant_type": "client_credentials", "skip": None}).text
+
+    async def send() -> str:
+        async with requests.AsyncSession() as session:
+            return (await session.post(echo_url, data={"grant_type": "client_credentials", "skip": None})).text
+
+    assert asyncio.run(send()) == sync_text == "application/x-www-form-urlencoded|grant_type=client_credentials"
+
+
+@pytest.fixture
+def opened_connections(monkeypatch):
+    opened = []
+
+    class CountingConnection(http.client.HTTPConnection):
+        def connect(self) -> None:
+            opened.append(self)
+            super().connect()
+
+    monkeypatch.setattr(http.client, "HTTPConnection", CountingConnection)
+    return opened
+
+
+def test_session_follows_redirects(echo_url: str) -> None:
+    with requests.Session() as session:
+        get = session.get(echo_url + "/moved", headers={"Authorization": "Bearer t"})
+        post = session.post(echo_url + "/moved", data={"a": 1})
+
+    assert get.url == echo_url + "/echo"
+    assert get.text == "GET /echo Bearer t"
+    # 303 turns the POST into a body-less GET.
+    assert post.text == "GET /echo None"
+
+
+def test_session_stops_after_max_redirects(echo_url: str) -> None:
+    with requests.Session(max_redirects=3) as session:
+        with pytest.raises(requests.RequestException, match="Exceeded 3 redirects"):
+            session.get(echo_url + "/loop")
+
+
+def test_session_raises_for_error_statuses_unless_disabled(echo_url: str) -> None:
+    with requests.Session() as session:
+        with pytest.raises(requests.HTTPError) as excinfo:
+            session.get(echo_url + "/missing")
+    assert excinfo.value.status_code == 404
+    assert excinfo.value.response.text == "not here"
+
+    with requests.Session(raise_for_status=False) as session:
+        assert session.get(echo_url + "/missing").status_code == 404
+
+
+def test_async_session_follows_redirects_and_raises(echo_url: str) -> None:
+    async def scenario() -> str:
+        async with requests.AsyncSession() as session:
+            with pytest.raises(requests.HTTPError):
+                await session.get(echo_url + "/missing")
+            return (await session.get(echo_url + "/moved")).text
+
+    assert asyncio.run(scenario()) == "GET /echo None"
+
+
+def test_session_reuses_keep_alive_connections(echo_url: str, opened_connections: list) -> None:
+    with requests.Session() as session:
+        texts = [session.get(f"{echo_url}/echo?n={index}").text for index in range(5)]
+
+    assert texts == [f"GET /echo?n={index} None" for index in range(5)]
+    assert len(opened_connections) == 1
+
+
+def test_session_retries_when_an_idle_connection_was_dropped(echo_url: str, opened_connections: list) -> None:
+    with requests.Session() as session:
+        assert session.get(echo_url + "/drop").text == "dropped"
+        # The pooled connection is dead; the request transparently moves to a fresh one.
+        assert session.get(echo_url + "/echo").text == "GET /echo None"
+
+    assert len(opened_connections) == 2
+
+
+def test_async_session_reuses_keep_alive_connections(monkeypatch) -> None:
+    opened = []
+    open_connection = asyncio.open_connection
+
+    async def counting_open_connection(*args, **kwargs):
+        opened.append(args)
+        return await open_connection(*args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "open_connection", counting_open_connection)
+    with StubAmadeusServer({FLIGHT_OFFERS_PATH: EndpointBehavior(authenticated=False)}) as stub:
+
+        async def scenario() -> list[int]:
+            async with requests.AsyncSession() as session:
+                statuses = []
+                for _ in range(5):
+                    response = await session.get(stub.base_url + FLIGHT_OFFERS_PATH)
+                    statuses.append(response.status_code)
+                return statuses
+
+        assert asyncio.run(scenario()) == [200] * 5
+    assert len(opened) == 1
@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import requests
+from metrics import MetricsRegistry
+from providers import AmadeusConfig, ProviderError, _AmadeusClient
+from ratelimit import RetryPolicy
+from resilience import CircuitBreaker, CircuitBreakers, CircuitState
+
+
+def test_released_probe_lets_the_next_probe_through() -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=10.0, clock=lambda: now[0])
+    breaker.record_failure()
+    now[0] = 11.0
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+class _Tokens:
+    def get_token(self) -> str:
+        return "token"
+
+    def invalidate(self, value: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _Raw:
+    """Stand-in for a streamed HTTP body that is cut off after *chunks*."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = list(chunks)
+
+    def read(self, size: int) -> bytes:
+        if not self._chunks:
+            raise ConnectionResetError("connection reset mid-body")
+        return self._chunks.pop(0)
+
+    def close(self) -> None:
+        pass
+
+
+class _StreamingSession:
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.closed = False
+
+    def request(self, method, url, **kwargs):
+        return requests.Response(url, 200, {}, _raw=_Raw(self.chunks))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _client(session, breakers: CircuitBreakers, **kwargs) -> _AmadeusClient:
+    return _AmadeusClient(
+        AmadeusConfig("id", "secret", hostname="http://stub.invalid"),
+        session=session,
+        token_manager=_Tokens(),
+        circuit_breakers=breakers,
+        retry_policy=RetryPolicy(max_attempts=1),
+        metrics=MetricsRegistry(),
+        **kwargs,
+    )
+
+
+def test_stream_cut_off_mid_body_counts_as_a_failure() -> None:
+    breakers = CircuitBreakers(failure_threshold=1, recovery_time=60.0)
+    client = _client(_StreamingSession([b'{"data": [{"id": 1}, ']), breakers)
+    received = []
+
+    with pytest.raises(ProviderError, match="Failed to read"):
+        for item in client.iter_items("/v2/shopping/flight-offers"):
+            received.append(item)
+
+    assert received == [{"id": 1}]
+    assert breakers.for_path("/v2/shopping/flight-offers").state is CircuitState.OPEN
+
+
+def test_stopping_a_stream_early_releases_the_half_open_probe() -> None:
+    breakers = CircuitBreakers(failure_threshold=1, recovery_time=0.0)
+    breaker = breakers.for_path("/v2/shopping/flight-offers")
+    breaker.record_failure()
+    client = _client(_StreamingSession([b'{"data": [{"id": 1}, {"id": 2}]}']), breakers)
+
+    items = client.iter_items("/v2/shopping/flight-offers")
+    assert next(items) == {"id": 1}
+    assert not breaker.allow()  # The stream holds the only probe.
+    items.close()
+
+    assert breaker.allow()
+
+
+def test_close_shuts_down_only_resources_the_client_created() -> None:
+    session = _StreamingSession([])
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with _client(session, CircuitBreakers(), hedge_after=1.0, hedge_executor=executor):
+            pass
+        assert executor.submit(lambda: 1).result() == 1
+    assert not session.closed
+
+    client = _client(None, CircuitBreakers(), hedge_after=1.0)
+    pool = client._hedge_executor()
+    client.close()
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: 1)
@@ -0,0 +1,45 @@
+import asyncio
+from datetime import date
+
+from models import FlightPreference, TripRequest
+from scheduler import MonitorScheduler
+
+
+class _CountingFlightMonitor:
+    def __init__(self) -> None:
+        self.polls = 0
+
+    async def find_best_flights_async(self, request, preference):
+        self.polls += 1
+        return []
+
+
+def _request() -> TripRequest:
+    return TripRequest(
+        origin="HKG",
+        destination="BJS",
+        start_date=date(2030, 5, 1),
+        end_date=date(2030, 5, 4),
+        interests=(),
+        travelers=1,
+    )
+
+
+def test_readding_a_removed_watch_does_not_double_its_polling() -> None:
+    monitor = _CountingFlightMonitor()
+    scheduler = MonitorScheduler(flight_monitor=monitor)  # type: ignore[arg-type]
+
+    async def scenario() -> None:
+        runner = asyncio.create_task(scheduler.run())
+        scheduler.add_flight_watch(_request(), FlightPreference(), watch_id="w", interval_seconds=0.1)
+        await asyncio.sleep(0.05)
+        assert scheduler.remove_watch("w")
+        scheduler.add_flight_watch(_request(), FlightPreference(), watch_id="w", interval_seconds=0.1)
+        monitor.polls = 0
+        await asyncio.sleep(1.0)
+        scheduler.stop()
+        await runner
+
+    asyncio.run(scenario())
+    # About ten polls in one second; a stale heap entry for the old watch would double that.
+    assert 5 <= monitor.polls <= 14
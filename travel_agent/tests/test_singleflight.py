@@ -0,0 +1,98 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_share_one_execution() -> None:
+    group = SingleFlight()
+    release = threading.Event()
+    executions = []
+
+    def fetch() -> str:
+        executions.append(1)
+        release.wait(5)
+        return "offers"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(group.do, "PAR-ROM", fetch) for _ in range(4)]
+        while group.stats.calls < 4:
+            threading.Event().wait(0.01)
+        release.set()
+        assert [future.result(timeout=5) for future in futures] == ["offers"] * 4
+
+    assert len(executions) == 1
+    assert (group.stats.executions, group.stats.shared) == (1, 3)
+
+
+def test_waiters_receive_the_leader_exception_and_nothing_is_cached() -> None:
+    group = SingleFlight()
+    release = threading.Event()
+
+    def fail() -> str:
+        release.wait(5)
+        raise LookupError("no offers")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(group.do, "key", fail) for _ in range(2)]
+        while group.stats.calls < 2:
+            threading.Event().wait(0.01)
+        release.set()
+        assert [type(future.exception(timeout=5)) for future in futures] == [LookupError] * 2
+
+    assert group.do("key", lambda: "fresh") == "fresh"
+    assert group.stats.executions == 2
+
+
+def test_async_calls_share_one_task() -> None:
+    group = AsyncSingleFlight()
+    executions = []
+
+    async def fetch() -> str:
+        executions.append(1)
+        await asyncio.sleep(0.01)
+        return "offers"
+
+    async def scenario() -> list[str]:
+        return await asyncio.gather(*(group.do("PAR-ROM", fetch) for _ in range(5)))
+
+    assert asyncio.run(scenario()) == ["offers"] * 5
+    assert len(executions) == 1
+    assert group.stats.shared == 4
+
+
+def test_cancelling_one_async_waiter_does_not_cancel_the_shared_call() -> None:
+    group = AsyncSingleFlight()
+
+    async def fetch() -> str:
+        await asyncio.sleep(0.05)
+        return "offers"
+
+    async def scenario() -> str:
+        first = asyncio.ensure_future(group.do("key", fetch))
+        second = asyncio.ensure_future(group.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "offers"
+    assert group.stats.executions == 1
+
+
+def test_async_exception_is_shared_and_retrieved() -> None:
+    group = AsyncSingleFlight()
+
+    async def fail() -> str:
+        await asyncio.sleep(0)
+        raise LookupError("no offers")
+
+    async def scenario() -> list[object]:
+        return await asyncio.gather(*(group.do("key", fail) for _ in range(3)), return_exceptions=True)
+
+    assert [type(result) for result in asyncio.run(scenario())] == [LookupError] * 3
+    assert group.stats.executions == 1
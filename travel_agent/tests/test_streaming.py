@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+import streaming
+from streaming import _Buffer, iter_json_array
+
+DOCUMENT = json.dumps(
+    {
+        "meta": {"count": 12, "data": [9], "links": [1, 2.5e3, None, True]},
+        "data": [
+            {"id": "1", "city": "Zürich", "price": {"total": "1234.50"}},
+            12,
+            -0.5,
+            1e-3,
+            123456789,
+            True,
+            False,
+            None,
+            "東京 ✈ São Paulo",
+            [],
+            {},
+            [1, [2, {"a": "b"}]],
+        ],
+        "dictionaries": {"carriers": {"AF": "AIR FRANCE"}},
+    },
+    ensure_ascii=False,
+).encode("utf-8")
+
+
+def _chunks(document: bytes, size: int | None) -> list[bytes]:
+    if size is None:
+        return [document]
+    return [document[offset:offset + size] for offset in range(0, len(document), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, None])
+def test_items_match_a_full_parse_for_any_chunking(size: int | None) -> None:
+    assert list(iter_json_array(_chunks(DOCUMENT, size))) == json.loads(DOCUMENT)["data"]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, None])
+def test_numbers_and_literals_at_chunk_edges_are_not_cut_short(size: int | None) -> None:
+    document = b'{"data":[1234567890,-12.5e-3,true,false,null,0],"n":42}'
+
+    assert list(iter_json_array(_chunks(document, size))) == [1234567890, -0.0125, True, False, None, 0]
+
+
+@pytest.mark.parametrize("size", [1, 7, None])
+@pytest.mark.parametrize(
+    "document",
+    [b"{}", b'{"meta": {"count": 0}}', b'{"data": null}', b'{"data": []}', b'{"data" : [ ] , "meta": 1}'],
+)
+def test_missing_null_and_empty_arrays_yield_nothing(document: bytes, size: int | None) -> None:
+    assert list(iter_json_array(_chunks(document, size))) == []
+
+
+def test_other_keys_can_be_selected() -> None:
+    assert list(iter_json_array(_chunks(DOCUMENT, 7), key="links")) == []
+    document = b'{"warnings": [{"code": 1}], "data": [2]}'
+    assert list(iter_json_array(_chunks(document, 3), key="warnings")) == [{"code": 1}]
+
+
+def test_multibyte_characters_split_across_chunks() -> None:
+    document = '{"data": ["é", "東京", "🛫"]}'.encode("utf-8")
+
+    for size in range(1, 6):
+        assert list(iter_json_array(_chunks(document, size))) == ["é", "東京", "🛫"]
+
+
+def test_truncated_document_raises() -> None:
+    with pytest.raises(ValueError):
+        list(iter_json_array(_chunks(b'{"data": [1, 2', 3)))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"data": [1, {"a": ']))
+
+
+def test_buffer_compacts_consumed_text(monkeypatch) -> None:
+    monkeypatch.setattr(streaming, "_COMPACT_THRESHOLD", 256)
+    items = [{"id": index, "name": "x" * 20} for index in range(500)]
+    document = json.dumps(items).encode()
+    buffer = _Buffer(_chunks(document, 64))
+    decoder = json.JSONDecoder()
+    largest = 0
+
+    buffer.expect("[")
+    decoded = []
+    while True:
+        decoded.append(buffer.value(decoder))
+        largest = max(largest, len(buffer.text))
+        if buffer.expect(",", "]") == "]":
+            break
+
+    assert decoded == items
+    assert largest < len(document) // 4
@@ -0,0 +1,113 @@
+import random
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from models import Activity
+from timetable import DayScheduler
+
+DAY = date(2030, 5, 1)
+
+
+def _at(hour: int, minute: int = 0, day: date = DAY) -> datetime:
+    return datetime.combine(day, time(hour, minute))
+
+
+def _timed(name: str, start: datetime, end: datetime | None = None) -> Activity:
+    return Activity(name=name, description="", start_time=start, end_time=end)
+
+
+def _names(days) -> list[list[str]]:
+    return [[activity.name for activity in day.activities] for day in days]
+
+
+def test_timed_activities_keep_the_most_non_overlapping() -> None:
+    activities = [
+        _timed("all-day tour", _at(9), _at(17)),
+        _timed("museum", _at(9), _at(10)),
+        _timed("lunch", _at(11), _at(12)),
+        _timed("late", _at(21), _at(23)),
+    ]
+    days, leftovers = DayScheduler().schedule(DAY, DAY, activities)
+
+    assert _names(days) == [["museum", "lunch"]]
+    # The tour overlaps better options and "late" ends after the day does.
+    assert [activity.name for activity in leftovers] == ["all-day tour", "late"]
+
+
+def test_buffer_separates_consecutive_activities() -> None:
+    activities = [_timed("museum", _at(9), _at(10)), _timed("walk", _at(10, 15), _at(11))]
+
+    _, leftovers = DayScheduler(buffer=timedelta(minutes=30)).schedule(DAY, DAY, activities)
+    assert [activity.name for activity in leftovers] == ["walk"]
+    days, leftovers = DayScheduler(buffer=timedelta(0)).schedule(DAY, DAY, activities)
+    assert leftovers == [] and _names(days) == [["museum", "walk"]]
+
+
+def test_untimed_activities_fill_the_least_busy_day_first() -> None:
+    second = DAY + timedelta(days=1)
+    activities = [
+        _timed("opera", _at(19, day=DAY), _at(21, day=DAY)),
+        Activity("market", "", opens_at=time(7), closes_at=time(13)),
+        Activity("gallery", "", opens_at=time(10), closes_at=time(18)),
+    ]
+    days, leftovers = DayScheduler().schedule(DAY, second, activities)
+
+    assert leftovers == []
+    # The market goes to the empty second day; the gallery then breaks the tie on the earlier date.
+    assert _names(days) == [["gallery", "opera"], ["market"]]
+    gallery, _ = days[0].activities
+    market = days[1].activities[0]
+    assert (market.start_time, market.end_time) == (_at(8, day=second), _at(10, day=second))
+    assert (gallery.start_time, gallery.end_time) == (_at(10), _at(12))
+
+
+def test_opening_hours_and_max_per_day_limit_placement() -> None:
+    activities = [
+        Activity("night market", "", opens_at=time(23), closes_at=time(23, 59)),
+        Activity("a", ""),
+        Activity("b", ""),
+        Activity("c", ""),
+    ]
+    days, leftovers = DayScheduler(max_per_day=2).schedule(DAY, DAY, activities)
+
+    assert _names(days) == [["a", "b"]]
+    assert [activity.name for activity in leftovers] == ["night market", "c"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_schedules_never_overlap_and_account_for_every_activity(seed: int) -> None:
+    rng = random.Random(seed)
+    end = DAY + timedelta(days=3)
+    activities = []
+    for index in range(60):
+        day = DAY + timedelta(days=rng.randrange(4))
+        if rng.random() < 0.5:
+            start = _at(rng.randrange(6, 22), rng.choice((0, 15, 30, 45)), day)
+            activities.append(_timed(f"t{index}", start, start + timedelta(minutes=rng.randrange(30, 240))))
+        else:
+            opens = rng.randrange(6, 20)
+            activities.append(Activity(f"u{index}", "", opens_at=time(opens), closes_at=time(min(opens + 4, 23))))
+    buffer = timedelta(minutes=20)
+    days, leftovers = DayScheduler(buffer=buffer, max_per_day=6).schedule(DAY, end, activities)
+
+    scheduled = [activity for day in days for activity in day.activities]
+    assert sorted(activity.name for activity in scheduled + leftovers) == sorted(a.name for a in activities)
+    for day in days:
+        assert len(day.activities) <= 6
+        for activity in day.activities:
+            assert _at(8, day=day.date) <= activity.start_time < activity.end_time <= _at(22, day=day.date)
+            if activity.opens_at is not None:
+                assert activity.opens_at <= activity.start_time.time()
+                assert activity.end_time.time() <= activity.closes_at
+        for earlier, later in zip(day.activities, day.activities[1:]):
+            assert earlier.end_time + buffer <= later.start_time
+
+
+def test_invalid_settings_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        DayScheduler(day_start=time(22), day_end=time(8))
+    with pytest.raises(ValueError):
+        DayScheduler(default_duration=timedelta(0))
+    with pytest.raises(ValueError):
+        DayScheduler(max_per_day=0)
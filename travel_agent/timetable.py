@@ -0,0 +1,202 @@
+"""Fit activities into the available hours of each trip day."""
+
+from __future__ import annotations
+
+import dataclasses
+import heapq
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Sequence, Tuple
+
+from models import Activity, ItineraryDay
+
+
+@dataclass(slots=True)
+class _Day:
+    date: date
+    window_start: datetime
+    window_end: datetime
+    activities: List[Activity] = field(default_factory=list)
+    # Sorted, non-overlapping free intervals once timed activities are placed.
+    gaps: List[Tuple[datetime, datetime]] = field(default_factory=list)
+    last_end: datetime | None = None
+
+
+class DayScheduler:
+    """Pack activities into each day's available hours without overlaps.
+
+    Activities with a fixed ``start_time`` are chosen per day by earliest
+    finishing time, which keeps the largest number of non-overlapping
+    activities. Untimed activities are then placed, in suggestion order, into
+    the earliest free gap of the least busy day that fits them and, when
+    ``opens_at``/``closes_at`` are set, their opening hours. Everything runs
+    in ``O(n log n)`` for *n* activities plus the per-day gap scans.
+
+    Parameters
+    ----------
+    day_start, day_end:
+        Hours available for activities on every day of the trip.
+    default_duration:
+        Duration assumed for activities without an ``end_time``.
+    buffer:
+        Minimum time kept free between consecutive activities.
+    max_per_day:
+        Optional cap on the number of activities per day.
+    """
+
+    def __init__(
+        self,
+        *,
+        day_start: time = time(8, 0),
+        day_end: time = time(22, 0),
+        default_duration: timedelta = timedelta(hours=2),
+        buffer: timedelta = timedelta(minutes=30),
+        max_per_day: int | None = None,
+    ) -> None:
+        if day_end <= day_start:
+            raise ValueError("day_end must be after day_start")
+        if default_duration <= timedelta(0):
+            raise ValueError("default_duration must be positive")
+        if max_per_day is not None and max_per_day < 1:
+            raise ValueError("max_per_day must be at least 1")
+        self._day_start = day_start
+        self._day_end = day_end
+        self._default_duration = default_duration
+        self._buffer = buffer
+        self._max_per_day = max_per_day
+
+    def schedule(
+        self, start_date: date, end_date: date, activities: Sequence[Activity]
+    ) -> Tuple[List[ItineraryDay], List[Activity]]:
+        """Return the planned days and the activities that did not fit.
+
+        Untimed activities that are scheduled are returned as copies with
+        ``start_time`` and ``end_time`` filled in.
+        """
+
+        days: Dict[date, _Day] = {}
+        cursor = start_date
+        while cursor <= end_date:
+            days[cursor] = _Day(
+                date=cursor,
+                window_start=datetime.combine(cursor, self._day_start),
+                window_end=datetime.combine(cursor, self._day_end),
+            )
+            cursor += timedelta(days=1)
+
+        timed = [activity for activity in activities if activity.start_time is not None]
+        untimed = [activity for activity in activities if activity.start_time is None]
+        leftovers = self._place_timed(days, timed)
+        for day in days.values():
+            day.gaps = self._free_gaps(day)
+        leftovers.extend(self._place_untimed(days, untimed))
+
+        planned = [
+            ItineraryDay(
+                date=day.date,
+                activities=sorted(day.activities, key=lambda activity: _naive(activity.start_time)),
+            )
+            for day in days.values()
+        ]
+        return planned, leftovers
+
+    def _place_timed(self, days: Dict[date, _Day], activities: Sequence[Activity]) -> List[Activity]:
+        leftovers: List[Activity] = []
+        spans = sorted(
+            ((self._span(activity), position, activity) for position, activity in enumerate(activities)),
+            key=lambda entry: (entry[0][1], entry[0][0], entry[1]),
+        )
+        for (start, end), _, activity in spans:
+            day = days.get(start.date())
+            if (
+                day is None
+                or self._is_full(day)
+                or start < day.window_start
+                or end > day.window_end
+                or (day.last_end is not None and start < day.last_end + self._buffer)
+            ):
+                leftovers.append(activity)
+                continue
+            day.activities.append(activity)
+            day.last_end = end
+        return leftovers
+
+    def _place_untimed(self, days: Dict[date, _Day], activities: Sequence[Activity]) -> List[Activity]:
+        leftovers: List[Activity] = []
+        # Least busy day first, earliest date on ties.
+        load = [(len(day.activities), day.date) for day in days.values() if not self._is_full(day)]
+        heapq.heapify(load)
+        for activity in activities:
+            tried: List[Tuple[int, date]] = []
+            placed = None
+            while load and placed is None:
+                count, day_date = heapq.heappop(load)
+                day = days[day_date]
+                placed = self._fit(day, activity)
+                if placed is not None:
+                    count += 1
+                # Days without a gap long enough for any activity are dropped for good.
+                if not self._is_full(day) and self._has_room(day):
+                    tried.append((count, day_date))
+            for entry in tried:
+                heapq.heappush(load, entry)
+            if placed is None:
+                leftovers.append(activity)
+        return leftovers
+
+    def _fit(self, day: _Day, activity: Activity) -> Activity | None:
+        """Place *activity* in the earliest gap of *day* that can hold it."""
+
+        opens = datetime.combine(day.date, activity.opens_at) if activity.opens_at else day.window_start
+        closes = datetime.combine(day.date, activity.closes_at) if activity.closes_at else day.window_end
+        duration = self._default_duration
+        for index, (gap_start, gap_end) in enumerate(day.gaps):
+            start = max(gap_start, opens)
+            end = start + duration
+            if end > min(gap_end, closes):
+                if gap_start >= closes:
+                    break
+                continue
+            pieces = []
+            if start - self._buffer > gap_start:
+                pieces.append((gap_start, start - self._buffer))
+            if end + self._buffer < gap_end:
+                pieces.append((end + self._buffer, gap_end))
+            day.gaps[index:index + 1] = pieces
+            placed = dataclasses.replace(activity, start_time=start, end_time=end)
+            day.activities.append(placed)
+            return placed
+        return None
+
+    def _has_room(self, day: _Day) -> bool:
+        return any(end - start >= self._default_duration for start, end in day.gaps)
+
+    def _free_gaps(self, day: _Day) -> List[Tuple[datetime, datetime]]:
+        gaps: List[Tuple[datetime, datetime]] = []
+        cursor = day.window_start
+        for activity in day.activities:
+            start, end = self._span(activity)
+            if start - self._buffer > cursor:
+                gaps.append((cursor, start - self._buffer))
+            cursor = max(cursor, end + self._buffer)
+        if cursor < day.window_end:
+            gaps.append((cursor, day.window_end))
+        return gaps
+
+    def _span(self, activity: Activity) -> Tuple[datetime, datetime]:
+        start = _naive(activity.start_time)
+        end = _naive(activity.end_time) if activity.end_time is not None else None
+        if end is None or end <= start:
+            end = start + self._default_duration
+        return start, end
+
+    def _is_full(self, day: _Day) -> bool:
+        return self._max_per_day is not None and len(day.activities) >= self._max_per_day
+
+
+def _naive(value: datetime | None) -> datetime:
+    """Compare activities by local wall-clock time, ignoring any tzinfo."""
+
+    if value is None:
+        return datetime.min
+    return value.replace(tzinfo=None)
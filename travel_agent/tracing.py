@@ -0,0 +1,274 @@
+"""Optional spans and sampled profiling for attributing latency.
+
+Tracing is off until a :class:`Tracer` is installed::
+
+    tracer = Tracer(sample_every=50, profile_dir="profiles")
+    set_tracer(tracer)
+    agent.plan_itinerary(request)
+    print(format_trace(tracer.traces[-1]))
+
+While no tracer is installed, :func:`span` returns a shared no-op context
+manager, so the hooks left in the code cost one global lookup.
+
+Spans nest through :mod:`contextvars`, which follows ``await`` but not thread
+pools: work submitted to an executor starts a new trace unless it is run
+with :func:`contextvars.copy_context`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import cProfile
+import functools
+import inspect
+import itertools
+import json
+import os
+import re
+import threading
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_current: contextvars.ContextVar[Span | None] = contextvars.ContextVar("travel_agent_span", default=None)
+_tracer: Tracer | None = None
+_NO_SPAN = contextlib.nullcontext()
+
+
+@dataclass(slots=True)
+class Span:
+    """Timing of one traced operation and the operations it contained.
+
+    ``cpu_seconds`` is the CPU time of the thread that opened the span, so
+    for a coroutine it includes other tasks running on the same loop.
+    ``allocated_bytes`` is the change in memory traced by
+    :mod:`tracemalloc` and is ``None`` when allocation tracing is off.
+    """
+
+    name: str
+    attributes: Dict[str, object] = field(default_factory=dict)
+    started_at: float = 0.0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    allocated_bytes: int | None = None
+    error: str | None = None
+    children: List["Span"] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "attributes": {key: _jsonable(value) for key, value in self.attributes.items()},
+            "started_at": self.started_at,
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "allocated_bytes": self.allocated_bytes,
+            "error": self.error,
+            "children": [child.to_dict() for child in list(self.children)],
+        }
+
+
+class Tracer:
+    """Collect span trees and profile a sample of them.
+
+    Parameters
+    ----------
+    sink:
+        Called with every finished root span. By default the last
+        *keep* traces are kept in :attr:`traces`.
+    sample_every:
+        Profile one in every *sample_every* root spans with :mod:`cProfile`
+        and :mod:`tracemalloc`; ``None`` disables profiling.
+    profile_dir:
+        Directory receiving ``<time>-<name>-<n>.prof`` (``pstats``),
+        ``.tracemalloc`` (``tracemalloc.Snapshot.load``) and ``.json`` (the
+        span tree) for each sampled trace. Required with *sample_every*.
+    trace_allocations:
+        Start :mod:`tracemalloc` for the tracer's lifetime so that every
+        span records allocations. This slows Python down noticeably.
+    """
+
+    def __init__(
+        self,
+        *,
+        sink: Callable[[Span], None] | None = None,
+        sample_every: int | None = None,
+        profile_dir: str | os.PathLike[str] | None = None,
+        trace_allocations: bool = False,
+        keep: int = 100,
+    ) -> None:
+        if sample_every is not None and sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        if sample_every is not None and profile_dir is None:
+            raise ValueError("profile_dir is required when sampling profiles")
+        self.traces: Deque[Span] = deque(maxlen=keep)
+        self._sink = sink if sink is not None else self.traces.append
+        self._sample_every = sample_every
+        self._profile_dir = Path(profile_dir) if profile_dir is not None else None
+        self._roots = itertools.count(1)
+        # cProfile and tracemalloc are process wide, so only one sampled trace runs at a time.
+        self._profiling = threading.Lock()
+        self._started_tracemalloc = False
+        if trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def close(self) -> None:
+        """Stop allocation tracing started by this tracer."""
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes: object) -> Iterator[Span]:
+        parent = _current.get()
+        record = Span(name=name, attributes=attributes, started_at=time.time())
+        if parent is not None:
+            parent.children.append(record)
+        sequence = next(self._roots) if parent is None else 0
+        profiler = self._start_profile(sequence) if sequence else None
+        token = _current.set(record)
+        memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        cpu = time.thread_time()
+        wall = time.perf_counter()
+        try:
+            yield record
+        except BaseException as exc:
+            record.error = type(exc).__name__
+            raise
+        finally:
+            record.wall_seconds = time.perf_counter() - wall
+            record.cpu_seconds = time.thread_time() - cpu
+            if memory is not None and tracemalloc.is_tracing():
+                record.allocated_bytes = tracemalloc.get_traced_memory()[0] - memory
+            _current.reset(token)
+            if parent is None:
+                if profiler is not None:
+                    self._finish_profile(profiler, record, sequence)
+                self._sink(record)
+
+    def _start_profile(self, sequence: int) -> "_Profile | None":
+        if self._sample_every is None or sequence % self._sample_every:
+            return None
+        if not self._profiling.acquire(blocking=False):
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:  # another profiler is active in this thread
+            self._profiling.release()
+            return None
+        started_tracemalloc = not tracemalloc.is_tracing()
+        if started_tracemalloc:
+            tracemalloc.start()
+        return _Profile(profile=profile, started_tracemalloc=started_tracemalloc)
+
+    def _finish_profile(self, sampled: "_Profile", record: Span, sequence: int) -> None:
+        try:
+            sampled.profile.disable()
+            snapshot = tracemalloc.take_snapshot()
+            if sampled.started_tracemalloc:
+                tracemalloc.stop()
+            assert self._profile_dir is not None
+            self._profile_dir.mkdir(parents=True, exist_ok=True)
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+            stem = self._profile_dir / f"{stamp}-{_slug(record.name)}-{sequence}"
+            sampled.profile.dump_stats(f"{stem}.prof")
+            snapshot.dump(f"{stem}.tracemalloc")
+            Path(f"{stem}.json").write_text(json.dumps(record.to_dict(), indent=2), encoding="utf-8")
+            record.attributes["profile"] = str(stem)
+        finally:
+            self._profiling.release()
+
+
+@dataclass(slots=True)
+class _Profile:
+    profile: cProfile.Profile
+    started_tracemalloc: bool
+
+
+def set_tracer(tracer: Tracer | None) -> Tracer | None:
+    """Install *tracer* process wide (``None`` disables tracing); return the previous one."""
+
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def span(name: str, **attributes: object) -> contextlib.AbstractContextManager[Span | None]:
+    """Open a span on the installed tracer, or do nothing when tracing is off."""
+
+    tracer = _tracer
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.span(name, **attributes)
+
+
+def traced(name: str) -> Callable[[_F], _F]:
+    """Decorate a function or coroutine function so that each call is a span."""
+
+    def decorate(func: _F) -> _F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def run_async(*args: Any, **kwargs: Any) -> Any:
+                with span(name):
+                    return await func(*args, **kwargs)
+
+            return run_async  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def run(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return func(*args, **kwargs)
+
+        return run  # type: ignore[return-value]
+
+    return decorate
+
+
+def format_trace(root: Span, *, min_seconds: float = 0.0) -> str:
+    """Render a span tree as indented text, one span per line."""
+
+    lines: List[str] = []
+
+    def visit(node: Span, depth: int) -> None:
+        if depth and node.wall_seconds < min_seconds:
+            return
+        parts = [f"{node.wall_seconds * 1000:9.2f} ms wall", f"{node.cpu_seconds * 1000:9.2f} ms cpu"]
+        if node.allocated_bytes is not None:
+            parts.append(f"{node.allocated_bytes / 1024:+10.1f} KiB")
+        label = node.name
+        if node.attributes:
+            label += " " + " ".join(f"{key}={value}" for key, value in node.attributes.items())
+        if node.error:
+            label += f" !{node.error}"
+        lines.append(f"{'  '.join(parts)}  {'  ' * depth}{label}")
+        for child in list(node.children):
+            visit(child, depth + 1)
+
+    visit(root, 0)
+    return "\n".join(lines)
+
+
+def _jsonable(value: object) -> object:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Mapping):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    return str(value)
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name)[:60]